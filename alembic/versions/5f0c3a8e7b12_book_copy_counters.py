@@ -0,0 +1,51 @@
+"""Book copy counters
+
+Revision ID: 5f0c3a8e7b12
+Revises: e4b7d1c9a260
+Create Date: 2026-10-18 14:05:12.518204
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5f0c3a8e7b12"
+down_revision = "e4b7d1c9a260"
+branch_labels = None
+depends_on = None
+
+# column: status counted by the column, None for every status
+# Keep in sync with src.book_counters.
+COUNTERS = {
+    "total_copies": None,
+    "available_copies": "available",
+    "borrowed_copies": "borrowed",
+    "reserved_copies": "reserved",
+    "maintenance_copies": "maintenance",
+}
+
+
+def upgrade() -> None:
+    for column in COUNTERS:
+        op.add_column(
+            "book",
+            sa.Column(column, sa.Integer(), nullable=False, server_default="0"),
+        )
+    # Backfills the counters from the copies that are not deleted.
+    for column, status in COUNTERS.items():
+        status_filter = ""
+        if status is not None:
+            status_filter = (
+                " AND copy.status_id IN (SELECT status.id FROM status"
+                f" WHERE status.status = '{status}' AND NOT status.is_deleted)"
+            )
+        op.execute(
+            f"UPDATE book SET {column} = (SELECT count(*) FROM copy"
+            f" WHERE copy.book_id = book.id AND NOT copy.is_deleted{status_filter})"
+        )
+
+
+def downgrade() -> None:
+    for column in reversed(COUNTERS):
+        op.drop_column("book", column)
@@ -0,0 +1,47 @@
+"""Book search indexes
+
+Revision ID: 7c2e91d4a5f3
+Revises: 23a363c84509
+Create Date: 2026-10-18 11:02:37.514210
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "7c2e91d4a5f3"
+down_revision = "23a363c84509"
+branch_labels = None
+depends_on = None
+
+# Expressions must stay identical to the ones in
+# src/endpoints/book/search_utils.py for the planner to use the indexes.
+INDEXES = {
+    "ix_book_title_tsv": "book USING gin (to_tsvector('simple'::regconfig, title))",
+    "ix_book_title_trgm": "book USING gin (title gin_trgm_ops)",
+    "ix_book_isbn_pattern": "book (isbn text_pattern_ops)",
+    "ix_author_name_trgm": (
+        "author USING gin ((first_name || ' ' || last_name) gin_trgm_ops)"
+    ),
+}
+
+
+def upgrade() -> None:
+    # Full text and trigram search only exist on postgres, other databases use
+    # the fallback search which doesn't need them.
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Built concurrently so that the catalog stays writable meanwhile.
+    with op.get_context().autocommit_block():
+        for name, definition in INDEXES.items():
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {definition}"
+            )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    with op.get_context().autocommit_block():
+        for name in INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
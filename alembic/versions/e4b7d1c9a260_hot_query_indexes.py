@@ -0,0 +1,52 @@
+"""Hot query indexes
+
+Revision ID: e4b7d1c9a260
+Revises: 7c2e91d4a5f3
+Create Date: 2026-10-18 12:20:41.093117
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e4b7d1c9a260"
+down_revision = "7c2e91d4a5f3"
+branch_labels = None
+depends_on = None
+
+# name: (table, columns, partial over the rows that are not soft deleted)
+# Keep in sync with the __table_args__ of the models.
+INDEXES = {
+    "ix_borrowed_user_id": ("borrowed", ["user_id", "id"], True),
+    "ix_borrowed_copy_id": ("borrowed", ["copy_id"], False),
+    "ix_copy_book_id": ("copy", ["book_id", "id"], True),
+    "ix_copy_status_id": ("copy", ["status_id", "book_id"], True),
+    "ix_book_language_id": ("book", ["language_id", "id"], True),
+    "ix_book_author_book_id": ("book_author", ["book_id"], False),
+    "ix_book_genre_genre_id": ("book_genre", ["genre_id", "book_id"], False),
+}
+
+
+def upgrade() -> None:
+    is_postgres = op.get_bind().dialect.name == "postgresql"
+    # Postgres builds the indexes concurrently, outside of a transaction, so
+    # that the tables stay writable on a live database.
+    with op.get_context().autocommit_block():
+        for name, (table, columns, partial) in INDEXES.items():
+            options = {}
+            if partial:
+                options.update(
+                    postgresql_where=sa.text("NOT is_deleted"),
+                    sqlite_where=sa.text("is_deleted = 0"),
+                )
+            op.create_index(
+                name, table, columns, postgresql_concurrently=is_postgres, **options
+            )
+
+
+def downgrade() -> None:
+    is_postgres = op.get_bind().dialect.name == "postgresql"
+    with op.get_context().autocommit_block():
+        for name, (table, _, _) in INDEXES.items():
+            op.drop_index(name, table, postgresql_concurrently=is_postgres)
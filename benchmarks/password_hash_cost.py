@@ -0,0 +1,83 @@
+"""
+Reports login latency (password verification, including the wait for a free
+hashing thread) at each bcrypt cost, to pick BCRYPT_ROUNDS for a p99 target.
+
+Run from the project root with the same environment as the app, e.g:
+    python -m benchmarks.password_hash_cost --rounds 10 11 12 13 --target-ms 250
+"""
+import argparse
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.dependencies import get_crypt_context
+from src.password_pool import PASSWORD_HASH_WORKERS
+
+PASSWORD = "abc123A_GT"
+
+
+def percentile(values: list[float], percent: float) -> float:
+    values = sorted(values)
+    index = min(len(values) - 1, round(percent / 100 * (len(values) - 1)))
+    return values[index]
+
+
+def run(rounds: int, logins: int, concurrency: int, workers: int) -> dict:
+    """
+    Verifies the password of `logins` logins, `concurrency` at a time, in a pool
+    of `workers` threads and returns the latency percentiles in milliseconds.
+    """
+    context = get_crypt_context(scheme="bcrypt", bcrypt_rounds=rounds)
+    hashed = context.hash(PASSWORD)
+
+    def login(submitted_at: float) -> float:
+        context.verify_and_update(PASSWORD, hashed)
+        return (time.perf_counter() - submitted_at) * 1000
+
+    latencies = []
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for start in range(0, logins, concurrency):
+            batch = [
+                pool.submit(login, time.perf_counter())
+                for _ in range(min(concurrency, logins - start))
+            ]
+            latencies.extend(future.result() for future in batch)
+    elapsed = time.perf_counter() - started_at
+    return {
+        "rounds": rounds,
+        "p50": statistics.median(latencies),
+        "p95": percentile(latencies, 95),
+        "p99": percentile(latencies, 99),
+        "max": max(latencies),
+        "logins_per_second": logins / elapsed,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, nargs="+", default=[10, 11, 12, 13])
+    parser.add_argument("--logins", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=PASSWORD_HASH_WORKERS)
+    parser.add_argument("--workers", type=int, default=PASSWORD_HASH_WORKERS)
+    parser.add_argument("--target-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    print(
+        f"{'rounds':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} "
+        f"{'max ms':>9} {'logins/s':>9}"
+    )
+    for rounds in args.rounds:
+        result = run(rounds, args.logins, args.concurrency, args.workers)
+        line = (
+            f"{result['rounds']:>6} {result['p50']:>9.1f} {result['p95']:>9.1f} "
+            f"{result['p99']:>9.1f} {result['max']:>9.1f} "
+            f"{result['logins_per_second']:>9.1f}"
+        )
+        if args.target_ms is not None:
+            line += "  ok" if result["p99"] <= args.target_ms else "  over target"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Compares the time to serialize a page of books (with their authors, genres and
+language) through jsonable_encoder + json, as FastAPI does for plain dicts, and
+through the orjson EnvelopeResponse used by custom_response.
+
+Run from the project root with the same environment as the app, e.g:
+    python -m benchmarks.response_serialization --rows 100 1000
+"""
+import argparse
+import json
+import time
+from datetime import datetime
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.orm.attributes import set_committed_value
+
+from src.models import all_models
+from src.responses import custom_response
+
+
+def make_books(rows: int) -> list:
+    """
+    Returns books shaped like the ones loaded by the full book loader profile.
+    """
+    language = all_models.Language(id=1, language="English", is_deleted=False)
+    authors = [
+        all_models.Author(
+            id=i, first_name="First", last_name="Last", birth_date=datetime(1990, 1, 1)
+        )
+        for i in range(3)
+    ]
+    genres = [all_models.Genre(id=i, genre="Fiction") for i in range(2)]
+    books = []
+    for i in range(rows):
+        book = all_models.Book(
+            id=i,
+            title=f"Book {i}",
+            description="A description of the book",
+            isbn=f"{i:013d}",
+            date_of_publication=datetime(2008, 1, 1),
+            language_id=1,
+            is_deleted=False,
+            created_at=datetime(2023, 5, 1, 10, 30),
+        )
+        # committed values don't fire the backrefs, like loaded relationships
+        set_committed_value(book, "authors", authors)
+        set_committed_value(book, "genres", genres)
+        set_committed_value(book, "language", language)
+        books.append(book)
+    return books
+
+
+def timed(func, repeat: int) -> float:
+    started_at = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - started_at) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'rows':>6} {'jsonable ms':>12} {'orjson ms':>10} {'speedup':>8}")
+    for rows in args.rows:
+        books = make_books(rows)
+        content = {"status_code": 200, "details": "Books found", "data": books}
+        before = timed(lambda: json.dumps(jsonable_encoder(content)), args.repeat)
+        after = timed(
+            lambda: custom_response(200, "Books found", books).body, args.repeat
+        )
+        print(f"{rows:>6} {before:>12.2f} {after:>10.2f} {before / after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
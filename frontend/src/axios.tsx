@@ -711,7 +711,9 @@ export class APIClient {
   //Used to get a new access token using a refresh token
   private UseRefreshToken(refreshToken: string): Promise<string> {
     return APIClient.axiosInstance
-      .post("/auth/refresh_token", { refresh_token: refreshToken })
+      .post("/auth/refresh_token?minimal=true", {
+        refresh_token: refreshToken,
+      })
       .then((response) => {
         const access_token: string = response.data.data.access_token;
         localStorage.setItem("access_token", access_token);
@@ -6,15 +6,23 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from logs import setup_logging
 from routes.api import router
+from src.compression import CompressionMiddleware
+from src.dependencies import (
+    async_redis_conn,
+    start_blacklist_listener,
+    stop_blacklist_listener,
+)
 from src.models import all_models
-from src.models.database import engine
+from src.models.database import AsyncSessionLocal, engine
+from src.responses import EnvelopeResponse
+from src.status_registry import load_status_ids
 
 load_dotenv()
 
 all_models.Base.metadata.create_all(engine)
 
 
-app = FastAPI()
+app = FastAPI(default_response_class=EnvelopeResponse)
 
 origins = ["http://localhost:3000", "http://16.170.249.16"]
 
@@ -25,8 +33,32 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(CompressionMiddleware)
 
 
 setup_logging()
 logging.info("Starting the application")
 app.include_router(router)
+
+
+@app.on_event("startup")
+async def load_statuses() -> None:
+    """
+    Loads the status ids used by the circulation endpoints.
+    """
+    async with AsyncSessionLocal() as db:
+        await load_status_ids(db)
+
+
+@app.on_event("startup")
+async def listen_to_blacklist() -> None:
+    """
+    Keeps the token cache of this worker in sync with the blacklist.
+    """
+    start_blacklist_listener()
+
+
+@app.on_event("shutdown")
+async def close_redis() -> None:
+    stop_blacklist_listener()
+    await async_redis_conn.connection_pool.disconnect()
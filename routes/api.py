@@ -1,10 +1,12 @@
 from fastapi import APIRouter
 
+from src.endpoints import admin  # noqa
 from src.endpoints import auth  # noqa
 from src.endpoints import author  # noqa
 from src.endpoints import book  # noqa
 from src.endpoints import borrowed  # noqa
 from src.endpoints import copy  # noqa
+from src.endpoints import export  # noqa
 from src.endpoints import genre  # noqa
 from src.endpoints import language  # noqa
 from src.endpoints import status  # noqa
@@ -20,3 +22,5 @@ router.include_router(author.router)
 router.include_router(borrowed.router)
 router.include_router(genre.router)
 router.include_router(status.router)
+router.include_router(admin.router)
+router.include_router(export.router)
@@ -0,0 +1,162 @@
+import argparse
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from sqlalchemy import and_, func, not_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.all_models import Book, Copy
+from src.models.database import AsyncSessionLocal
+from src.status_constants import AVAILABLE, BORROWED, MAINTENANCE, RESERVED
+from src.status_registry import get_status_name
+
+# Counter column of the copies of a book in each status, every copy that is
+# not deleted is also counted in total_copies.
+TOTAL = "total_copies"
+STATUS_COLUMNS = {
+    AVAILABLE: "available_copies",
+    BORROWED: "borrowed_copies",
+    RESERVED: "reserved_copies",
+    MAINTENANCE: "maintenance_copies",
+}
+COUNTER_COLUMNS = (TOTAL, *STATUS_COLUMNS.values())
+
+# (book_id, status_id, number of copies added, negative when removed)
+CopyChange = Tuple[int, int, int]
+
+
+async def get_counter_deltas(
+    db: AsyncSession, changes: List[CopyChange]
+) -> Dict[int, Dict[str, int]]:
+    """
+    Returns the change of every counter of every book for the given changes.
+    """
+    deltas: Dict[int, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+    for book_id, status_id, count in changes:
+        columns = deltas[book_id]
+        columns[TOTAL] += count
+        column = STATUS_COLUMNS.get(await get_status_name(db, status_id))
+        if column is not None:
+            columns[column] += count
+    return deltas
+
+
+async def update_copy_counters(db: AsyncSession, *changes: CopyChange) -> None:
+    """
+    Applies the changes of copies to the counters of their books in the
+    transaction of the session, e.g a checkout is
+    (book_id, available_status_id, -1), (book_id, borrowed_status_id, 1).
+    Books with the same changes are updated together.
+    The changed copies must be locked first (e.g by their conditional update)
+    so that every transaction locks copies before books.
+    The counters are not part of the book, so its updated_at is kept.
+    """
+    by_deltas: Dict[tuple, List[int]] = defaultdict(list)
+    for book_id, columns in (await get_counter_deltas(db, list(changes))).items():
+        delta = tuple(sorted((name, n) for name, n in columns.items() if n))
+        if delta:
+            by_deltas[delta].append(book_id)
+    for delta, book_ids in by_deltas.items():
+        await db.execute(
+            update(Book)
+            .where(Book.id.in_(sorted(book_ids)))
+            .values(
+                {
+                    "updated_at": Book.updated_at,
+                    **{name: getattr(Book, name) + n for name, n in delta},
+                }
+            )
+        )
+
+
+async def update_copy(db: AsyncSession, copy: Copy, values: dict) -> bool:
+    """
+    Updates the given copy with the values if it is not deleted and still has
+    the book and status it was read with, then the counters of its book(s).
+    The conditional update locks the copy, so concurrent changes of the same
+    copy are counted once, and it is locked before the book as in the checkouts.
+    Returns False when the copy changed since it was read.
+    """
+    book_id, status_id = copy.book_id, copy.status_id
+    updated = (
+        await db.execute(
+            update(Copy)
+            .where(
+                and_(
+                    Copy.id == copy.id,
+                    Copy.book_id == book_id,
+                    Copy.status_id == status_id,
+                    not_(Copy.is_deleted),
+                )
+            )
+            .values(values)
+            .returning(Copy.book_id, Copy.status_id, Copy.is_deleted)
+        )
+    ).first()
+    if updated is None:
+        return False
+    changes = [(book_id, status_id, -1)]
+    if not updated.is_deleted:
+        changes.append((updated.book_id, updated.status_id, 1))
+    await update_copy_counters(db, *changes)
+    return True
+
+
+async def reconcile_book_counters(db: AsyncSession, dry_run: bool = False) -> int:
+    """
+    Recounts the copies of every book and fixes the counters that drifted
+    (e.g after copies were changed outside of the API).
+    Returns the number of books whose counters were wrong.
+    """
+    expected: Dict[int, Dict[str, int]] = defaultdict(
+        lambda: dict.fromkeys(COUNTER_COLUMNS, 0)
+    )
+    rows = await db.execute(
+        select(Copy.book_id, Copy.status_id, func.count())
+        .where(not_(Copy.is_deleted))
+        .group_by(Copy.book_id, Copy.status_id)
+    )
+    changes = [(book_id, status_id, count) for book_id, status_id, count in rows]
+    for book_id, columns in (await get_counter_deltas(db, changes)).items():
+        expected[book_id].update(columns)
+
+    books = await db.execute(
+        select(Book.id, *(getattr(Book, name) for name in COUNTER_COLUMNS))
+        .order_by(Book.id)
+        .execution_options(include_deleted=True)
+    )
+    wrong = [
+        {"id": book.id, **expected[book.id]}
+        for book in books
+        if any(
+            getattr(book, name) != expected[book.id][name] for name in COUNTER_COLUMNS
+        )
+    ]
+    if wrong and not dry_run:
+        await db.execute(update(Book).values(updated_at=Book.updated_at), wrong)
+        await db.commit()
+    logging.info(
+        f"{len(wrong)} books with wrong copy counters"
+        f"{' (dry run)' if dry_run else ' fixed'} -- {__name__}"
+    )
+    return len(wrong)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Recounts the copies of every book and fixes its counters."
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="only report the wrong counters"
+    )
+    args = parser.parse_args()
+
+    async with AsyncSessionLocal() as db:
+        wrong = await reconcile_book_counters(db, args.dry_run)
+    print(f"{wrong} books with wrong copy counters")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,184 @@
+import hashlib
+import logging
+import os
+from typing import Any, Tuple
+
+import redis
+from fastapi import Response, status
+
+from src.dependencies import async_redis_conn, redis_conn
+from src.metrics import Counter
+
+# Seconds a cached response is kept, bounding staleness for writes that
+# don't go through the API.
+CACHE_TTL = int(os.getenv("CACHE_TTL", 300))
+
+BOOK = "book"
+AUTHOR = "author"
+GENRE = "genre"
+LANGUAGE = "language"
+STATUS = "status"
+NAMESPACES = (BOOK, AUTHOR, GENRE, LANGUAGE, STATUS)
+
+# Cached books embed their authors, genres and language, so a write to one
+# of those also invalidates the books.
+DEPENDENTS = {AUTHOR: (BOOK,), GENRE: (BOOK,), LANGUAGE: (BOOK,)}
+
+# Browsers and proxies may reuse a catalog response for HTTP_CACHE_MAX_AGE
+# seconds, after which they revalidate it with its ETag.
+HTTP_CACHE_MAX_AGE = int(os.getenv("HTTP_CACHE_MAX_AGE", 0))
+CACHE_CONTROL = f"public, max-age={HTTP_CACHE_MAX_AGE}, must-revalidate"
+
+CACHE_HITS = {namespace: Counter() for namespace in NAMESPACES}
+CACHE_MISSES = {namespace: Counter() for namespace in NAMESPACES}
+NOT_MODIFIED = {namespace: Counter() for namespace in NAMESPACES}
+
+
+def make_key(**params: Any) -> str:
+    """
+    Returns a stable cache key for the given request parameters.
+    """
+    return "&".join(f"{name}={value}" for name, value in sorted(params.items()))
+
+
+def _version_key(namespace: str) -> str:
+    return f"cache:{namespace}:version"
+
+
+def _data_key(namespace: str, key: str) -> str:
+    return f"cache:{namespace}:data:{key}"
+
+
+def make_etag(body: bytes) -> str:
+    """
+    Returns a strong ETag of the given response body.
+    """
+    return f'"{hashlib.sha1(body).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str | None) -> bool:
+    """
+    Returns whether the If-None-Match header matches the given ETag.
+    """
+    if not if_none_match or not etag:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    tags = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in tags
+
+
+def _cached_response(body: Any, etag: str | None, status_code: int) -> Response:
+    headers = {"Cache-Control": CACHE_CONTROL}
+    if etag:
+        headers["ETag"] = etag
+    return Response(
+        content=body,
+        status_code=status_code,
+        media_type=None if body is None else "application/json",
+        headers=headers,
+    )
+
+
+async def cache_get(
+    namespace: str, key: str, if_none_match: str | None = None
+) -> Tuple[Response | None, str | None]:
+    """
+    Returns the cached response of the key in the namespace (None on a miss) and
+    the version of the namespace it was looked up at, which cache_set must be
+    given along with the response read from the database after the miss.
+    The version, body and ETag are read in one round trip. The cached body is
+    sent as is, without being parsed or serialized again, and as a 304 when the
+    If-None-Match header matches its ETag.
+    Redis errors are treated as a miss so that the database stays the fallback.
+    """
+    try:
+        pipe = async_redis_conn.pipeline()
+        pipe.get(_version_key(namespace))
+        pipe.hmget(_data_key(namespace, key), "version", "etag", "body")
+        version, (cached_version, etag, body) = await pipe.execute()
+    except redis.RedisError as e:
+        logging.warning(f"Cache read failed for {namespace}: {e} -- {__name__}")
+        CACHE_MISSES[namespace].inc()
+        return None, None
+    version = version or "0"
+    # Entries written before the last invalidation are left to be overwritten
+    if body is None or cached_version != version:
+        CACHE_MISSES[namespace].inc()
+        return None, version
+    CACHE_HITS[namespace].inc()
+    if etag_matches(if_none_match, etag):
+        NOT_MODIFIED[namespace].inc()
+        return _cached_response(None, etag, status.HTTP_304_NOT_MODIFIED), version
+    return _cached_response(body, etag, status.HTTP_200_OK), version
+
+
+async def cache_set(
+    namespace: str,
+    key: str,
+    version: str | None,
+    response: Response,
+    if_none_match: str | None = None,
+) -> Response:
+    """
+    Caches the body of the response of the key in the namespace, along with its
+    ETag, for CACHE_TTL seconds. The entry is tagged with the version returned
+    by cache_get before the database was read, so that a body read before an
+    invalidation is never served after it. Nothing is cached without a version.
+    Returns the given response with its ETag, or a 304 response when the
+    If-None-Match header already matches it.
+    """
+    etag = make_etag(response.body)
+    if version is not None:
+        data_key = _data_key(namespace, key)
+        try:
+            pipe = async_redis_conn.pipeline()
+            pipe.hset(
+                data_key,
+                mapping={"version": version, "etag": etag, "body": response.body},
+            )
+            pipe.expire(data_key, CACHE_TTL)
+            await pipe.execute()
+        except redis.RedisError as e:
+            logging.warning(f"Cache write failed for {namespace}: {e} -- {__name__}")
+    if etag_matches(if_none_match, etag):
+        NOT_MODIFIED[namespace].inc()
+        return _cached_response(None, etag, status.HTTP_304_NOT_MODIFIED)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    return response
+
+
+def invalidate(*namespaces: str) -> None:
+    """
+    Invalidates every cached value of the namespaces and of their dependents.
+    Bumping the version turns the cached entries into misses, they are then
+    overwritten or expire on their own.
+    """
+    to_invalidate = set(namespaces)
+    for namespace in namespaces:
+        to_invalidate.update(DEPENDENTS.get(namespace, ()))
+    try:
+        pipe = redis_conn.pipeline()
+        for namespace in sorted(to_invalidate):
+            pipe.incr(_version_key(namespace))
+        pipe.execute()
+    except redis.RedisError as e:
+        logging.error(
+            f"Cache invalidation failed for {to_invalidate}: {e} -- {__name__}"
+        )
+
+
+def get_cache_stats() -> dict:
+    """
+    Returns the hit, miss and not modified counts of every namespace for this
+    worker.
+    """
+    return {
+        namespace: {
+            "hits": CACHE_HITS[namespace].value,
+            "misses": CACHE_MISSES[namespace].value,
+            "not_modified": NOT_MODIFIED[namespace].value,
+        }
+        for namespace in NAMESPACES
+    }
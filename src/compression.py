@@ -0,0 +1,178 @@
+import os
+import zlib
+from typing import Sequence
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, gzip is used without it
+    brotli = None
+
+# Responses smaller than this many bytes are sent as is.
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", 1000))
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", 6))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", 4))
+# Comma separated path prefixes whose responses are never compressed.
+COMPRESSION_EXCLUDE_PATHS = [
+    path.strip()
+    for path in os.getenv("COMPRESSION_EXCLUDE_PATHS", "").split(",")
+    if path.strip()
+]
+
+
+class GZipCompressor:
+    def __init__(self, level: int) -> None:
+        # wbits=31 writes the gzip header and trailer around the deflate stream
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class BrotliCompressor:
+    def __init__(self, quality: int) -> None:
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+def accepted_encodings(accept_encoding: str) -> set[str]:
+    """
+    Returns the content codings of an Accept-Encoding header, except the ones
+    refused with q=0.
+    """
+    encodings = set()
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = params.strip().removeprefix("q=")
+        if name and quality not in ("0", "0.0", "0.00", "0.000"):
+            encodings.add(name.strip().lower())
+    return encodings
+
+
+class CompressionMiddleware:
+    """
+    Compresses responses with brotli (when installed and accepted) or gzip.
+    Responses under minimum_size, the paths starting with one of exclude_paths
+    and responses that set their own Content-Encoding (e.g identity, to opt a
+    single route out) are sent uncompressed.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = COMPRESSION_MIN_SIZE,
+        gzip_level: int = GZIP_LEVEL,
+        brotli_quality: int = BROTLI_QUALITY,
+        exclude_paths: Sequence[str] = COMPRESSION_EXCLUDE_PATHS,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.exclude_paths = tuple(exclude_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and not self.is_excluded(scope["path"]):
+            encodings = accepted_encodings(
+                Headers(scope=scope).get("Accept-Encoding", "")
+            )
+            if brotli is not None and "br" in encodings:
+                responder = CompressionResponder(
+                    self.app, self.minimum_size, "br", self._brotli
+                )
+                await responder(scope, receive, send)
+                return
+            if "gzip" in encodings:
+                responder = CompressionResponder(
+                    self.app, self.minimum_size, "gzip", self._gzip
+                )
+                await responder(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+    def is_excluded(self, path: str) -> bool:
+        return any(path.startswith(prefix) for prefix in self.exclude_paths)
+
+    def _gzip(self) -> GZipCompressor:
+        return GZipCompressor(self.gzip_level)
+
+    def _brotli(self) -> BrotliCompressor:
+        return BrotliCompressor(self.brotli_quality)
+
+
+class CompressionResponder:
+    """
+    Compresses the body of a single response, buffered or streamed.
+    """
+
+    def __init__(
+        self, app: ASGIApp, minimum_size: int, encoding: str, make_compressor
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encoding = encoding
+        self.make_compressor = make_compressor
+        self.send: Send = None
+        self.initial_message: Message = {}
+        self.started = False
+        self.passthrough = False
+        self.compressor = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_compressed)
+
+    async def send_compressed(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # Held back until the first body chunk shows whether to compress.
+            self.initial_message = message
+            self.passthrough = "content-encoding" in Headers(raw=message["headers"])
+            return
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if not self.started:
+            self.started = True
+            if self.passthrough or (len(body) < self.minimum_size and not more_body):
+                self.passthrough = True
+                await self.send(self.initial_message)
+                await self.send(message)
+                return
+            self.compressor = self.make_compressor()
+            headers = MutableHeaders(raw=self.initial_message["headers"])
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            # The compressed bytes differ, so a strong ETag becomes weak.
+            etag = headers.get("ETag")
+            if etag and not etag.startswith("W/"):
+                headers["ETag"] = f"W/{etag}"
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                body = self.compressor.compress(body) + self.compressor.finish()
+                headers["Content-Length"] = str(len(body))
+                await self.send(self.initial_message)
+                await self.send({**message, "body": body})
+                return
+            await self.send(self.initial_message)
+        elif self.passthrough:
+            await self.send(message)
+            return
+
+        compressed = self.compressor.compress(body)
+        if not more_body:
+            compressed += self.compressor.finish()
+        await self.send({**message, "body": compressed})
@@ -1,49 +1,105 @@
+import json
 import logging
 import os
-from typing import Generator, Tuple
+import time
+from datetime import timedelta
+from typing import AsyncGenerator
 
 import redis
+import redis.asyncio
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.exceptions import custom_exception
-from src.models.database import SessionLocal
+from src.models.database import AsyncSessionLocal
 from src.models.user import User
+from src.password_pool import run_in_password_pool
+from src.token_cache import TokenCache
 
 SECRET_KEY = os.getenv("JWT_SECRET_KEY")
 ALGORITHM = os.getenv("JWT_ALGORITHM")
 REDIS_HOST = os.getenv("REDIS_HOST")
 REDIS_PORT = os.getenv("REDIS_PORT")
 
-bcryp_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing policy. Hashes made with another scheme or cost still verify
+# and are rehashed with the current policy on the next successful login.
+# argon2 requires the argon2-cffi package.
+PASSWORD_HASH_SCHEME = os.getenv("PASSWORD_HASH_SCHEME", "bcrypt")
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", 12))
+ARGON2_TIME_COST = int(os.getenv("ARGON2_TIME_COST", 3))
+ARGON2_MEMORY_COST = int(os.getenv("ARGON2_MEMORY_COST", 65536))
+
+
+def get_crypt_context(
+    scheme: str = PASSWORD_HASH_SCHEME, bcrypt_rounds: int = BCRYPT_ROUNDS
+) -> CryptContext:
+    """
+    Returns a CryptContext hashing with the given scheme and cost.
+    Hashes with any other scheme or cost are reported as needing an update.
+    """
+    options = {
+        "bcrypt__rounds": bcrypt_rounds,
+        "bcrypt__min_rounds": bcrypt_rounds,
+        "bcrypt__max_rounds": bcrypt_rounds,
+    }
+    if scheme == "argon2":
+        options.update(
+            argon2__time_cost=ARGON2_TIME_COST,
+            argon2__memory_cost=ARGON2_MEMORY_COST,
+        )
+    schemes = [scheme] + [name for name in ("bcrypt",) if name != scheme]
+    return CryptContext(schemes=schemes, default=scheme, deprecated="auto", **options)
+
+
+bcryp_context = get_crypt_context()
 
 oauth2_bearer = OAuth2PasswordBearer(tokenUrl="token")
 
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", 50))
+
 redis_conn = redis.Redis(host=REDIS_HOST, port=REDIS_PORT, decode_responses=True)
 
+# Non blocking client for the checks made on every request. Requests wait for
+# a free connection when all of them are in use.
+async_redis_conn = redis.asyncio.Redis(
+    connection_pool=redis.asyncio.BlockingConnectionPool(
+        host=REDIS_HOST,
+        port=REDIS_PORT,
+        decode_responses=True,
+        max_connections=REDIS_MAX_CONNECTIONS,
+    )
+)
+
+# Claims of verified tokens, so a token is decoded and checked against the
+# blacklist once instead of on every request. Blacklisting evicts entries of
+# every worker through the BLACKLIST_CHANNEL pub/sub channel.
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", 10000))
+TOKEN_CACHE_MAX_AGE = int(os.getenv("TOKEN_CACHE_MAX_AGE", 300))
+BLACKLIST_CHANNEL = "blacklist"
+
+token_cache = TokenCache(TOKEN_CACHE_SIZE, TOKEN_CACHE_MAX_AGE)
+blacklist_listener = None
+
 
-def get_db() -> Generator[Session, None, None]:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
-    A generetor function that yields the DB session
+    A generetor function that yields the async DB session
     """
-    try:
-        db = SessionLocal()
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
-def get_current_user(token: str = Depends(oauth2_bearer)) -> dict:
+async def get_current_user(token: str = Depends(oauth2_bearer)) -> dict:
     """
     Fetches user details for a given token.
     To be used as a dependency by authenticated routes for users
     """
     try:
-        return check_blacklist_and_decode_jwt(token)
+        return await check_blacklist_and_decode_jwt(token)
     except JWTError:
         raise custom_exception(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -52,13 +108,13 @@ def get_current_user(token: str = Depends(oauth2_bearer)) -> dict:
         )
 
 
-def get_current_librarian(token: str = Depends(oauth2_bearer)) -> dict:
+async def get_current_librarian(token: str = Depends(oauth2_bearer)) -> dict:
     """
     Verifies that user for given token is librarian and fetches details.
     To be used as a dependency by authenticated routes for librarians
     """
     try:
-        user_dict = check_blacklist_and_decode_jwt(token)
+        user_dict = await check_blacklist_and_decode_jwt(token)
         if not user_dict.get("is_librarian"):
             raise custom_exception(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -77,24 +133,33 @@ def get_current_librarian(token: str = Depends(oauth2_bearer)) -> dict:
 # Helper functions
 
 
-def check_blacklist_and_decode_jwt(token: str) -> Tuple[str | None]:
+async def check_blacklist_and_decode_jwt(token: str) -> dict:
     """
-    Checks a given token against the redis blacklist. Raises an exception if it exists.\n
-    Decodes the given jwt token and returns the sub (username) and id. Raises an exception if any of these are None
+    Decodes the given jwt token and returns the sub (username), id and is_librarian.\n
+    Checks the token and its user against the redis blacklist in a single round trip. Raises an exception if any of them is blacklisted or if the username or id are None
     """
-    if redis_conn.get(f"bl_{token}"):
+    claims = token_cache.get(token)
+    if claims is not None:
+        return dict(claims)
+
+    # Captured before the blacklist is read, a blacklisting published after that
+    # read evicts from the cache and stops the claims from being cached below.
+    generation = token_cache.generation
+    payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    username = payload.get("sub")
+    user_id = payload.get("id")
+    token_blacklisted, user_blacklisted = await async_redis_conn.mget(
+        f"bl_{token}", f"bl_user_{user_id}"
+    )
+    if token_blacklisted:
         logging.error(f"black listed token used -- {__name__}")
         raise custom_exception(
             status_code=status.HTTP_401_UNAUTHORIZED,
             details="Could not validate credentials for user",
             headers={"WWW-Authenticate": "Bearer"},
         )
-
-    payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-    username = payload.get("sub")
-    user_id = payload.get("id")
     # Validating if user is already blacklisted (Deleted by librarian after users loggin)
-    if redis_conn.get(f"bl_user_{user_id}"):
+    if user_blacklisted:
         logging.error(f"user deleted -- {__name__}")
         raise custom_exception(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -109,7 +174,76 @@ def check_blacklist_and_decode_jwt(token: str) -> Tuple[str | None]:
             details="Could not validate credentials for user",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    return {"username": username, "id": user_id, "is_librarian": is_librarian}
+    claims = {"username": username, "id": user_id, "is_librarian": is_librarian}
+    token_cache.put(token, claims, payload.get("exp", 0), generation)
+    return dict(claims)
+
+
+def blacklist_token(token: str, expire_time: int | timedelta) -> None:
+    """
+    Blacklists the given token and evicts it from the token cache of every worker.
+    """
+    redis_conn.setex(f"bl_{token}", expire_time, token)
+    publish_blacklist({"token": TokenCache.key(token)})
+
+
+def blacklist_user(user_id: int, expire_time: int | timedelta) -> None:
+    """
+    Blacklists every token of the given user and evicts them from the token
+    cache of every worker.
+    """
+    redis_conn.setex(f"bl_user_{user_id}", expire_time, user_id)
+    publish_blacklist({"user_id": user_id})
+
+
+def publish_blacklist(message: dict) -> None:
+    """
+    Applies a blacklist message to the token cache of this worker and publishes
+    it to the other workers.
+    """
+    handle_blacklist_message({"data": json.dumps(message)})
+    redis_conn.publish(BLACKLIST_CHANNEL, json.dumps(message))
+
+
+def handle_blacklist_message(message: dict) -> None:
+    """
+    Evicts the token or the user of a blacklist message from the token cache.
+    """
+    data = json.loads(message["data"])
+    if "token" in data:
+        token_cache.evict_key(data["token"])
+    if "user_id" in data:
+        token_cache.evict_user(int(data["user_id"]))
+
+
+def handle_blacklist_listener_error(error: Exception, pubsub, thread) -> None:
+    """
+    Blacklist messages may be missed while the listener is disconnected, so the
+    token cache is dropped until it is connected again.
+    """
+    logging.error(f"Blacklist listener error: {error} -- {__name__}")
+    token_cache.clear()
+    time.sleep(1)
+
+
+def start_blacklist_listener() -> None:
+    """
+    Subscribes to the blacklist channel in a background thread.
+    """
+    global blacklist_listener
+    pubsub = redis_conn.pubsub(ignore_subscribe_messages=True)
+    pubsub.subscribe(**{BLACKLIST_CHANNEL: handle_blacklist_message})
+    token_cache.clear()
+    blacklist_listener = pubsub.run_in_thread(
+        sleep_time=1, daemon=True, exception_handler=handle_blacklist_listener_error
+    )
+
+
+def stop_blacklist_listener() -> None:
+    global blacklist_listener
+    if blacklist_listener is not None:
+        blacklist_listener.stop()
+        blacklist_listener = None
 
 
 def get_password_hash(password: str) -> str:
@@ -122,3 +256,32 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     """A helper function that verifies a given password against a hashed password"""
 
     return bcryp_context.verify(plain_password, hashed_password)
+
+
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """
+    A helper function that verifies a given password against a hashed password
+    and returns a new hash when the hashed password doesn't match the policy
+    """
+    return bcryp_context.verify_and_update(plain_password, hashed_password)
+
+
+async def async_get_password_hash(password: str) -> str:
+    """Hashes a given password in the password pool, off the event loop"""
+    return await run_in_password_pool(get_password_hash, password)
+
+
+async def async_verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verifies a given password in the password pool, off the event loop"""
+    return await run_in_password_pool(verify_password, plain_password, hashed_password)
+
+
+async def async_verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """Verifies and rehashes a given password in the password pool"""
+    return await run_in_password_pool(
+        verify_and_update_password, plain_password, hashed_password
+    )
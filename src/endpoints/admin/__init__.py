@@ -0,0 +1,5 @@
+from src.endpoints.admin.get.get_cache_stats import get_catalog_cache_stats
+from src.endpoints.admin.get.get_login_limiter_stats import get_login_limit_stats
+from src.endpoints.admin.get.get_password_pool_stats import get_password_hash_pool_stats
+from src.endpoints.admin.get.get_pool_stats import get_db_pool_stats
+from src.endpoints.admin.router_init import router
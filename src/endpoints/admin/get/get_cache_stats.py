@@ -0,0 +1,30 @@
+import logging
+
+from fastapi import Depends
+from starlette import status
+
+from src.cache import get_cache_stats
+from src.dependencies import get_current_librarian
+from src.endpoints.admin.router_init import router
+from src.responses import custom_response
+
+
+@router.get("/cache", status_code=status.HTTP_200_OK, response_model=None)
+async def get_catalog_cache_stats(
+    librarian: dict = Depends(get_current_librarian),
+) -> dict:
+    """
+    Returns the hit and miss counts of the catalog cache of this worker.\n
+    Params
+    ------
+    JWT token of librarian.\n
+    Returns
+    ------
+    dict : A dict with status code, details and data
+    """
+    logging.info(f"Librarian {librarian['id']} requested cache stats -- {__name__}")
+    return custom_response(
+        status_code=status.HTTP_200_OK,
+        details="Cache stats fetched successfully!",
+        data=get_cache_stats(),
+    )
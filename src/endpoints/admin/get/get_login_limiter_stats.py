@@ -0,0 +1,32 @@
+import logging
+
+from fastapi import Depends
+from starlette import status
+
+from src.dependencies import get_current_librarian
+from src.endpoints.admin.router_init import router
+from src.login_limiter import get_login_limiter_stats
+from src.responses import custom_response
+
+
+@router.get("/login_limiter", status_code=status.HTTP_200_OK, response_model=None)
+async def get_login_limit_stats(
+    librarian: dict = Depends(get_current_librarian),
+) -> dict:
+    """
+    Returns the limits and the failed and rejected login counts of this worker.\n
+    Params
+    ------
+    JWT token of librarian.\n
+    Returns
+    ------
+    dict : A dict with status code, details and data
+    """
+    logging.info(
+        f"Librarian {librarian['id']} requested login limiter stats -- {__name__}"
+    )
+    return custom_response(
+        status_code=status.HTTP_200_OK,
+        details="Login limiter stats fetched successfully!",
+        data=get_login_limiter_stats(),
+    )
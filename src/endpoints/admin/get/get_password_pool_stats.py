@@ -0,0 +1,32 @@
+import logging
+
+from fastapi import Depends
+from starlette import status
+
+from src.dependencies import get_current_librarian
+from src.endpoints.admin.router_init import router
+from src.password_pool import get_password_pool_stats
+from src.responses import custom_response
+
+
+@router.get("/password_pool", status_code=status.HTTP_200_OK, response_model=None)
+async def get_password_hash_pool_stats(
+    librarian: dict = Depends(get_current_librarian),
+) -> dict:
+    """
+    Returns the queue depth and timings of the password hashing pool of this worker.\n
+    Params
+    ------
+    JWT token of librarian.\n
+    Returns
+    ------
+    dict : A dict with status code, details and data
+    """
+    logging.info(
+        f"Librarian {librarian['id']} requested password pool stats -- {__name__}"
+    )
+    return custom_response(
+        status_code=status.HTTP_200_OK,
+        details="Password pool stats fetched successfully!",
+        data=get_password_pool_stats(),
+    )
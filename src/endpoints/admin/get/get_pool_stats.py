@@ -0,0 +1,28 @@
+import logging
+
+from fastapi import Depends
+from starlette import status
+
+from src.dependencies import get_current_librarian
+from src.endpoints.admin.router_init import router
+from src.models.database import get_pool_stats
+from src.responses import custom_response
+
+
+@router.get("/pool", status_code=status.HTTP_200_OK, response_model=None)
+async def get_db_pool_stats(librarian: dict = Depends(get_current_librarian)) -> dict:
+    """
+    Returns the state of the database connection pool of this worker.\n
+    Params
+    ------
+    JWT token of librarian.\n
+    Returns
+    ------
+    dict : A dict with status code, details and data
+    """
+    logging.info(f"Librarian {librarian['id']} requested pool stats -- {__name__}")
+    return custom_response(
+        status_code=status.HTTP_200_OK,
+        details="Pool stats fetched successfully!",
+        data=get_pool_stats(),
+    )
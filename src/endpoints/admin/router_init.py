@@ -0,0 +1,5 @@
+from fastapi import APIRouter
+
+router = APIRouter(
+    prefix="/admin", tags=["admin"], responses={401: {"user": "Not authorized"}}
+)
@@ -1,3 +1,4 @@
+import logging
 import os
 from datetime import datetime, timedelta
 
@@ -5,10 +6,12 @@ import pytz
 from fastapi import status
 from jose import jwt
 from sqlalchemy import or_, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
+from src.dependencies import async_get_password_hash  # isort skip
+from src.dependencies import async_verify_and_update_password  # isort skip
 from src.dependencies import get_password_hash  # isort skip
-from src.dependencies import verify_password  # isort skip; isort skip
 from src.exceptions import custom_exception
 from src.models.user import User
 from src.schemas.user import UserSchemaIn, UserSchemaOut
@@ -17,19 +20,21 @@ SECRET_KEY = os.getenv("JWT_SECRET_KEY")
 ALGORITHM = os.getenv("JWT_ALGORITHM")
 
 
-def create_user(user: UserSchemaIn, is_librarian: bool, db: Session) -> UserSchemaOut:
+async def create_user(
+    user: UserSchemaIn, is_librarian: bool, db: AsyncSession
+) -> UserSchemaOut:
     """
     Helper function that creates a user based on the parameters provided and returns the user. It also checks if the user already exists. Raises an exception if it does.
     """
 
-    check_user_already_exists(user, db)
+    await check_user_already_exists(user, db)
 
     new_user = User()
     new_user.email = user.email
     new_user.username = user.username
     new_user.first_name = user.first_name
     new_user.last_name = user.last_name
-    new_user.password = get_password_hash(user.password)
+    new_user.password = await async_get_password_hash(user.password)
     new_user.is_active = True
     new_user.contact_number = user.contact_number
     new_user.address = user.address
@@ -38,21 +43,22 @@ def create_user(user: UserSchemaIn, is_librarian: bool, db: Session) -> UserSche
     new_user.is_librarian = is_librarian
 
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
+    await db.refresh(new_user)
     user = UserSchemaOut(**new_user.__dict__)
     return user
 
 
-def check_user_already_exists(user: UserSchemaIn, db: Session) -> None:
+async def check_user_already_exists(user: UserSchemaIn, db: AsyncSession) -> None:
     """
     Raises an exception is user with the same email or username already exists
+    Deleted users are included since their email and username stay taken.
     """
 
-    fetched_user = db.scalar(
-        select(User).where(
-            or_(User.email == user.email, User.username == user.username)
-        )
+    fetched_user = await db.scalar(
+        select(User)
+        .where(or_(User.email == user.email, User.username == user.username))
+        .execution_options(include_deleted=True)
     )
     if fetched_user:
         raise custom_exception(
@@ -60,14 +66,26 @@ def check_user_already_exists(user: UserSchemaIn, db: Session) -> None:
         )
 
 
-def authenticate_user(username: str, password: str, db: Session) -> User | bool:
-    """A helper function that authenticates a given username and password"""
+async def authenticate_user(
+    username: str, password: str, db: AsyncSession
+) -> User | bool:
+    """
+    A helper function that authenticates a given username and password.
+    The stored hash is replaced when it was made with an outdated hashing policy.
+    """
 
-    user = db.query(User).filter(User.username == username).first()
+    user = await db.scalar(
+        select(User).where(User.username == username).options(undefer(User.password))
+    )
     if not user:
         return False
-    if not verify_password(password, user.password):
+    verified, new_hash = await async_verify_and_update_password(password, user.password)
+    if not verified:
         return False
+    if new_hash:
+        logging.info(f"Rehashing password of user {user.id} -- {__name__}")
+        user.password = new_hash
+        await db.commit()
     return user
 
 
@@ -75,7 +93,18 @@ def create_token(user: User, expire_time_in_min: int) -> str:
     """
     Takes in a username, id and expire time and returns a JWT token for the user
     """
-    encode = {"sub": user.username, "id": user.id, "is_librarian": user.is_librarian}
+    return create_token_from_claims(
+        user.username, user.id, user.is_librarian, expire_time_in_min
+    )
+
+
+def create_token_from_claims(
+    username: str, user_id: int, is_librarian: bool, expire_time_in_min: int
+) -> str:
+    """
+    Returns a JWT token with the given claims, without needing the user from the db
+    """
+    encode = {"sub": username, "id": user_id, "is_librarian": is_librarian}
     expire = datetime.utcnow() + timedelta(minutes=expire_time_in_min)
     encode.update({"exp": expire})
     return jwt.encode(encode, SECRET_KEY, algorithm=ALGORITHM)
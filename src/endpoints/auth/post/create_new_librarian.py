@@ -1,7 +1,7 @@
 import logging
 
 from fastapi import Depends, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.dependencies import get_current_librarian, get_db
 from src.endpoints.auth.auth_utils import create_user
@@ -17,13 +17,13 @@ from src.schemas.user import UserSchemaIn, UserSchemaOut
 )
 async def create_new_librarian(
     user: UserSchemaIn,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     librarian: dict = Depends(get_current_librarian),
 ) -> dict:
     """
     Creates a new librarian (requires authentication by another librarian)
     """
-    librarian = create_user(user, is_librarian=True, db=db)
+    librarian = await create_user(user, is_librarian=True, db=db)
     logging.info(f"New Librarian with ID {librarian.id} created.")
     return custom_response(
         status_code=status.HTTP_201_CREATED,
@@ -1,7 +1,7 @@
 import logging
 
 from fastapi import Depends, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.dependencies import get_db
 from src.endpoints.auth.auth_utils import create_user
@@ -12,11 +12,13 @@ from src.schemas.user import UserSchemaIn, UserSchemaOut
 
 
 @router.post("/register", status_code=status.HTTP_201_CREATED, response_model=None)
-async def create_new_user(user: UserSchemaIn, db: Session = Depends(get_db)) -> dict:
+async def create_new_user(
+    user: UserSchemaIn, db: AsyncSession = Depends(get_db)
+) -> dict:
     """
     Creates a new user
     """
-    user = create_user(user, is_librarian=False, db=db)
+    user = await create_user(user, is_librarian=False, db=db)
     logging.info(f"New User with ID {user.id} created.")
     return custom_response(
         status_code=status.HTTP_201_CREATED,
@@ -1,14 +1,17 @@
 import os
 
-from fastapi import Depends, status
+from fastapi import Depends, Request, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.dependencies import get_db
 from src.endpoints.auth.auth_utils import authenticate_user  # isort skip
 from src.endpoints.auth.auth_utils import create_token  # isort skip
 from src.endpoints.auth.router_init import router
 from src.exceptions import custom_exception
+from src.login_limiter import check_login_allowed  # isort skip
+from src.login_limiter import clear_login_failures  # isort skip
+from src.login_limiter import record_login_failure  # isort skip
 from src.responses import custom_response
 from src.schemas.user import UserSchemaToken
 
@@ -20,16 +23,23 @@ REFRESH_TOKEN_EXPIRE_TIME_IN_MINUTES = int(
 
 @router.post("/token", status_code=status.HTTP_200_OK, response_model=None)
 async def login_for_access_token(
-    form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)
+    request: Request,
+    form_data: OAuth2PasswordRequestForm = Depends(),
+    db: AsyncSession = Depends(get_db),
 ) -> dict:
     """
     Logs in a user using username and password and returns the access token and the user object.
+    Usernames and clients with too many failed logins are rejected before the credentials are checked.
     """
-    user = authenticate_user(form_data.username, form_data.password, db)
+    client_ip = request.client.host if request.client else "unknown"
+    await check_login_allowed(form_data.username, client_ip)
+    user = await authenticate_user(form_data.username, form_data.password, db)
     if not user:
+        await record_login_failure(form_data.username, client_ip)
         raise custom_exception(
             status_code=status.HTTP_400_BAD_REQUEST, details="Invalid credentials."
         )
+    await clear_login_failures(form_data.username)
     access_token = create_token(user, EXPIRE_TIME_IN_MINUTES)
     refresh_token = create_token(user, REFRESH_TOKEN_EXPIRE_TIME_IN_MINUTES)
     user = UserSchemaToken(
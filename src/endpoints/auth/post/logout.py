@@ -1,6 +1,6 @@
 from fastapi import Depends, Request, status
 
-from src.dependencies import get_current_user, redis_conn
+from src.dependencies import blacklist_token, get_current_user
 from src.endpoints.auth.auth_utils import get_jwt_exp
 from src.endpoints.auth.router_init import router
 from src.responses import custom_response
@@ -15,13 +15,9 @@ async def logout(
     Logs out the authenticated user by storing the token in the redis blacklist
     """
     token = request.headers.get("authorization").split()[1]
-    redis_conn.setex(f"bl_{token}", get_jwt_exp(token), token)
+    blacklist_token(token, get_jwt_exp(token))
     # For refresh token using the same expire time since expire time in refresh token is 5 days.
-    redis_conn.setex(
-        f"bl_{refresh_token.refresh_token}",
-        get_jwt_exp(token),
-        refresh_token.refresh_token,
-    )
+    blacklist_token(refresh_token.refresh_token, get_jwt_exp(token))
     return custom_response(
         status_code=status.HTTP_200_OK, details="Logout successful.", data=None
     )
@@ -2,47 +2,65 @@ import logging
 import os
 
 from fastapi import Depends, status
-from sqlalchemy import and_, not_
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, not_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.dependencies import get_current_user, get_db
 from src.endpoints.auth.auth_utils import create_token  # isort skip
+from src.endpoints.auth.auth_utils import create_token_from_claims  # isort skip
 from src.endpoints.auth.router_init import router
 from src.exceptions import custom_exception
 from src.models.user import User
 from src.responses import custom_response
 from src.schemas.token import TokenSchema
-from src.schemas.user import UserSchemaToken
+from src.schemas.user import UserSchemaRefresh, UserSchemaToken
 
 EXPIRE_TIME_IN_MINUTES = int(os.getenv("JWT_EXPIRE_TIME_IN_MINUTES"))
 
 
 @router.post("/refresh_token", status_code=status.HTTP_200_OK, response_model=None)
 async def refresh_access_token(
-    refresh_token: TokenSchema, db: Session = Depends(get_db)
+    refresh_token: TokenSchema,
+    minimal: bool = False,
+    db: AsyncSession = Depends(get_db),
 ) -> dict:
     """
+    Mints a new access token for the user of the refresh token.
+    With minimal the token is minted from the claims of the refresh token and
+    the db is not queried at all (deleted users are rejected through the user
+    blacklist), otherwise from the current user.\n
     Params
     ------
     refresh_token: str passed in json body.\n
+    minimal: bool, returns only the tokens and claims instead of the whole user.\n
     Return
     ------
     Dict have new (fresh) access token and old refresh token\n
     """
-    user_dict = get_current_user(refresh_token.refresh_token)
-    user = (
-        db.query(User)
-        .filter(and_(User.username == user_dict.get("username"), not_(User.is_deleted)))
-        .first()
-    )
-    if user is None:
-        raise custom_exception(status.HTTP_404_NOT_FOUND, "User deleted.")
-    access_token = create_token(user, EXPIRE_TIME_IN_MINUTES)
-    user = UserSchemaToken(
-        access_token=access_token,
-        refresh_token=refresh_token.refresh_token,
-        **user.__dict__,
-    )
+    user_dict = await get_current_user(refresh_token.refresh_token)
+    if minimal:
+        user = UserSchemaRefresh(
+            access_token=create_token_from_claims(
+                user_dict["username"],
+                user_dict["id"],
+                user_dict["is_librarian"],
+                EXPIRE_TIME_IN_MINUTES,
+            ),
+            refresh_token=refresh_token.refresh_token,
+            **user_dict,
+        )
+    else:
+        fetched_user = await db.scalar(
+            select(User).where(and_(User.id == user_dict["id"], not_(User.is_deleted)))
+        )
+        if fetched_user is None:
+            raise custom_exception(status.HTTP_404_NOT_FOUND, "User deleted.")
+        # The user is loaded anyway, so the token carries its current claims.
+        user = UserSchemaToken(
+            access_token=create_token(fetched_user, EXPIRE_TIME_IN_MINUTES),
+            refresh_token=refresh_token.refresh_token,
+            **fetched_user.__dict__,
+        )
     logging.info(
         f"Generated refresh token for {user_dict.get('username')} -- {__name__}"
     )
@@ -2,9 +2,10 @@ import logging
 
 from fastapi import Depends, HTTPException, Path
 from sqlalchemy import and_, not_, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
+from src.cache import AUTHOR, invalidate
 from src.dependencies import get_current_librarian, get_db
 from src.endpoints.author.router_init import router
 from src.exceptions import custom_exception
@@ -17,7 +18,7 @@ from src.models.author import Author
 async def delete_author_by_id(
     author_id: int = Path(gt=0),
     user: dict = Depends(get_current_librarian),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> None:
     """
     Deletes the authors whose id is passed.
@@ -30,12 +31,10 @@ async def delete_author_by_id(
     Status code 204 NO_CONTENT
     """
     author = (
-        db.execute(
+        await db.scalars(
             select(Author).where(and_(Author.id == author_id, not_(Author.is_deleted)))
         )
-        .scalars()
-        .first()
-    )
+    ).first()
     if not author:
         logging.error("Author not found -- {__name__}")
         raise custom_exception(
@@ -43,4 +42,5 @@ async def delete_author_by_id(
         )
     author.is_deleted = True
     logging.info(f"Deleting author {author_id} -- {__name__}")
-    db.commit()
+    await db.commit()
+    invalidate(AUTHOR)
@@ -1,47 +1,63 @@
 import logging
 from typing import Annotated, List
 
-from fastapi import Depends, Query
-from sqlalchemy import asc, not_, select
-from sqlalchemy.orm import Session
+from fastapi import Depends, Header, Query
+from sqlalchemy import not_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
+from src.cache import AUTHOR, cache_get, cache_set, make_key
 from src.dependencies import get_db
 from src.endpoints.author.router_init import router
 from src.models.author import Author
-from src.responses import custom_response
+from src.pagination import MAX_PAGE_SIZE, paginate, split_page
+from src.responses import paginated_response
 
 
 @router.get("", status_code=status.HTTP_200_OK, response_model=None)
 async def get_all_authors(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
+    if_none_match: str | None = Header(None),
     page_number: Annotated[int, Query(gt=0)] = 1,  # Default value is 1
-    page_size: Annotated[int, Query(gt=0)] = 10,  # Default value is 10
+    page_size: Annotated[
+        int, Query(gt=0, le=MAX_PAGE_SIZE)
+    ] = 10,  # Default value is 10
+    after: str | None = None,  # Cursor of the previous page, overrides page_number
 ) -> dict:
     """
     Returns all the Authors in DB.\n
     Params
     ------
     JWT token of user.\n
+    If-None-Match header with the ETag of the client's copy.\n
     Returns
     ------
      dict : A dict with status code, details and data
     """
-    starting_index = (page_number - 1) * page_size
+    cache_key = make_key(page_number=page_number, page_size=page_size, after=after)
+    cached, version = await cache_get(AUTHOR, cache_key, if_none_match)
+    if cached is not None:
+        return cached
     logging.info(f"Getting all the authors -- {__name__}")
-    authors = (
-        db.execute(
-            select(Author)
-            .where(not_(Author.is_deleted))
-            .order_by(asc(Author.id))
-            .offset(starting_index)
-            .limit(page_size)
-        )
-        .scalars()
-        .all()
+    query = paginate(
+        select(Author).where(not_(Author.is_deleted)),
+        Author.id,
+        page_number,
+        page_size,
+        after,
     )
-    return custom_response(
-        status_code=status.HTTP_200_OK,
-        details="Authors fetched successfully!",
-        data=authors,
+    authors, next_cursor = split_page(
+        (await db.scalars(query)).all(), page_size, Author.id
+    )
+    return await cache_set(
+        AUTHOR,
+        cache_key,
+        version,
+        paginated_response(
+            status_code=status.HTTP_200_OK,
+            details="Authors fetched successfully!",
+            data=authors,
+            next_cursor=next_cursor,
+        ),
+        if_none_match,
     )
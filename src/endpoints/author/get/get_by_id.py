@@ -1,10 +1,11 @@
 import logging
 
-from fastapi import Depends, HTTPException, Path
+from fastapi import Depends, Header, HTTPException, Path
 from sqlalchemy import and_, not_, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
+from src.cache import AUTHOR, cache_get, cache_set, make_key
 from src.dependencies import get_db
 from src.endpoints.author.router_init import router
 from src.exceptions import custom_exception
@@ -15,7 +16,8 @@ from src.responses import custom_response
 @router.get("/{author_id}", status_code=status.HTTP_200_OK, response_model=None)
 async def get_authors_by_id(
     author_id: int = Path(gt=0),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
+    if_none_match: str | None = Header(None),
 ) -> dict:
     """
     Returns the Authors having the id passed as param.\n
@@ -23,25 +25,34 @@ async def get_authors_by_id(
     ------
     JWT token of user.\n
     author_id: int\n
+    If-None-Match header with the ETag of the client's copy.\n
     Returns
     ------
     dict : A dict with status code, details and data
     """
+    cache_key = make_key(author_id=author_id)
+    cached, version = await cache_get(AUTHOR, cache_key, if_none_match)
+    if cached is not None:
+        return cached
     logging.info(f"Getting authors {author_id}-- {__name__}")
     author = (
-        db.execute(
+        await db.scalars(
             select(Author).where(and_(Author.id == author_id, not_(Author.is_deleted)))
         )
-        .scalars()
-        .first()
-    )
+    ).first()
     if not author:
         logging.error("Author not found -- {__name__}")
         raise custom_exception(
             status_code=status.HTTP_404_NOT_FOUND, details="Author not found."
         )
-    return custom_response(
-        status_code=status.HTTP_200_OK,
-        details="Author fetched successfully!",
-        data=author,
+    return await cache_set(
+        AUTHOR,
+        cache_key,
+        version,
+        custom_response(
+            status_code=status.HTTP_200_OK,
+            details="Author fetched successfully!",
+            data=author,
+        ),
+        if_none_match,
     )
@@ -2,9 +2,10 @@ import logging
 
 from fastapi import Depends
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
+from src.cache import AUTHOR, invalidate
 from src.dependencies import get_current_librarian, get_db
 from src.endpoints.author.router_init import router
 from src.models.author import Author
@@ -16,7 +17,7 @@ from src.schemas.author_schema import AuthorSchema
 async def create_author(
     author: AuthorSchema,
     user: dict = Depends(get_current_librarian),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> dict:
     """
     Adds new author to the database.\n
@@ -31,8 +32,9 @@ async def create_author(
     author_model = Author(**author.dict())
     db.add(author_model)
     logging.info(f"Inserting new author -- {__name__}")
-    db.commit()
-    db.refresh(author_model)
+    await db.commit()
+    invalidate(AUTHOR)
+    await db.refresh(author_model)
     author.id = author_model.id
     return custom_response(
         status_code=status.HTTP_201_CREATED,
@@ -2,9 +2,10 @@ import logging
 
 from fastapi import Depends, HTTPException, Path
 from sqlalchemy import and_, not_, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
+from src.cache import AUTHOR, invalidate
 from src.dependencies import get_current_librarian, get_db
 from src.endpoints.author.router_init import router
 from src.exceptions import custom_exception
@@ -18,7 +19,7 @@ async def update_author(
     new_author: AuthorSchema,
     author_id: int = Path(gt=0),
     user: dict = Depends(get_current_librarian),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> dict:
     """
     Updates the author with new detail whose id is passed.\n
@@ -33,12 +34,10 @@ async def update_author(
     """
     logging.info(f"Getting author {author_id}-- {__name__}")
     author = (
-        db.execute(
+        await db.scalars(
             select(Author).where(and_(Author.id == author_id, not_(Author.is_deleted)))
         )
-        .scalars()
-        .first()
-    )
+    ).first()
     if not author:
         logging.error("Author not found -- {__name__}")
         raise custom_exception(
@@ -50,8 +49,9 @@ async def update_author(
     author.birth_date = new_author.birth_date
     author.death_date = new_author.death_date
     logging.info(f"updating author {author_id}-- {__name__}")
-    db.commit()
-    db.refresh(author)
+    await db.commit()
+    invalidate(AUTHOR)
+    await db.refresh(author)
     new_author.id = author.id
     return custom_response(
         status_code=status.HTTP_200_OK,
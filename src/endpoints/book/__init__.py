@@ -1,6 +1,8 @@
 from src.endpoints.book.delete.book_delete import book_delete
 from src.endpoints.book.get.get_book_by_id import get_book_by_id
+from src.endpoints.book.get.get_book_counters import get_book_counters
 from src.endpoints.book.get.get_books_by_query import get_books_by_query
+from src.endpoints.book.get.search_books import search_books
 from src.endpoints.book.post.book_create import book_create
 from src.endpoints.book.put.book_update import book_update
 from src.endpoints.book.router_init import router
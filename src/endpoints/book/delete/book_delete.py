@@ -2,9 +2,10 @@ import logging
 
 from fastapi import Depends
 from sqlalchemy import and_, not_, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
+from src.cache import BOOK, invalidate
 from src.dependencies import get_current_librarian, get_db
 from src.endpoints.book.router_init import router
 from src.exceptions import custom_exception
@@ -15,7 +16,7 @@ from src.models.book import Book
 async def book_delete(
     book_id: int,
     librarian: dict = Depends(get_current_librarian),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> None:
     """
     Delete a book by ID.
@@ -25,10 +26,10 @@ async def book_delete(
     )
 
     book_model = (
-        db.execute(select(Book).where(and_(Book.id == book_id, not_(Book.is_deleted))))
-        .scalars()
-        .first()
-    )
+        await db.scalars(
+            select(Book).where(and_(Book.id == book_id, not_(Book.is_deleted)))
+        )
+    ).first()
 
     if book_model is None:
         raise custom_exception(
@@ -39,4 +40,5 @@ async def book_delete(
         f"Book with ID: {book_model.id} Deleted by Librarian {librarian['id']}"
     )
     book_model.is_deleted = True
-    db.commit()
+    await db.commit()
+    invalidate(BOOK)
@@ -1,33 +1,51 @@
 import logging
 
-from fastapi import Depends
+from fastapi import Depends, Header
 from sqlalchemy import and_, not_, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
+from src.cache import BOOK, cache_get, cache_set, make_key
 from src.dependencies import get_db
 from src.endpoints.book.router_init import router
 from src.exceptions import custom_exception
+from src.loaders import book_options
 from src.models.book import Book
 from src.responses import custom_response
 
 
-@router.get("/{book_id}", status_code=status.HTTP_200_OK, response_model=None)
-async def get_book_by_id(book_id: int, db: Session = Depends(get_db)) -> dict:
+@router.get("/{book_id:int}", status_code=status.HTTP_200_OK, response_model=None)
+async def get_book_by_id(
+    book_id: int,
+    db: AsyncSession = Depends(get_db),
+    if_none_match: str | None = Header(None),
+) -> dict:
     """
     Endpoint to get book by id
     """
+    cache_key = make_key(book_id=book_id)
+    cached, version = await cache_get(BOOK, cache_key, if_none_match)
+    if cached is not None:
+        return cached
     book = (
-        db.execute(select(Book).where(and_(Book.id == book_id, not_(Book.is_deleted))))
-        .scalars()
-        .first()
-    )
+        await db.scalars(
+            select(Book)
+            .where(and_(Book.id == book_id, not_(Book.is_deleted)))
+            .options(*book_options())
+        )
+    ).first()
     if book:
         logging.info(f"Book with id : {book_id} requested")
-        return custom_response(
-            status_code=status.HTTP_200_OK,
-            details="Book fetched successfully!",
-            data=book,
+        return await cache_set(
+            BOOK,
+            cache_key,
+            version,
+            custom_response(
+                status_code=status.HTTP_200_OK,
+                details="Book fetched successfully!",
+                data=book,
+            ),
+            if_none_match,
         )
 
     if not book:
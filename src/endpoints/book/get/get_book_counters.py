@@ -0,0 +1,47 @@
+import logging
+from typing import Annotated, List
+
+from fastapi import Depends, Query
+from sqlalchemy import and_, not_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette import status
+
+from src.book_counters import COUNTER_COLUMNS
+from src.dependencies import get_db
+from src.endpoints.book.router_init import router
+from src.exceptions import custom_exception
+from src.models.book import Book
+from src.pagination import MAX_PAGE_SIZE
+from src.responses import custom_response
+
+
+@router.get("/counters", status_code=status.HTTP_200_OK, response_model=None)
+async def get_book_counters(
+    book_ids: Annotated[List[int], Query()],
+    db: AsyncSession = Depends(get_db),
+) -> dict:
+    """
+    Endpoint to get the copy counters of many books (e.g a page of results).
+    Not cached, since the counters change on every checkout and return.
+    """
+    book_ids = list(dict.fromkeys(book_ids))
+    if len(book_ids) > MAX_PAGE_SIZE:
+        raise custom_exception(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            details=f"At most {MAX_PAGE_SIZE} books can be requested",
+        )
+    logging.info(f"Counters of {len(book_ids)} books requested")
+
+    rows = await db.execute(
+        select(Book.id, *(getattr(Book, name) for name in COUNTER_COLUMNS)).where(
+            and_(Book.id.in_(book_ids), not_(Book.is_deleted))
+        )
+    )
+    counters = {
+        row.id: {name: getattr(row, name) for name in COUNTER_COLUMNS} for row in rows
+    }
+    return custom_response(
+        status_code=status.HTTP_200_OK,
+        details="Counters fetched successfully!",
+        data=counters,
+    )
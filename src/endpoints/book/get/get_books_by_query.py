@@ -1,19 +1,22 @@
 import logging
 from typing import Annotated, List
 
-from fastapi import Depends, HTTPException, Query
-from sqlalchemy import and_, asc, not_, select
-from sqlalchemy.orm import Session
+from fastapi import Depends, Header, HTTPException, Query
+from sqlalchemy import and_, not_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
+from src.cache import BOOK, cache_get, cache_set, make_key
 from src.dependencies import get_db
 from src.endpoints.book.router_init import router
 from src.exceptions import custom_exception
+from src.loaders import book_options
 from src.models.author import Author
 from src.models.book import Book
 from src.models.genre import Genre
 from src.models.language import Language
-from src.responses import custom_response
+from src.pagination import MAX_PAGE_SIZE, paginate, split_page
+from src.responses import paginated_response
 
 
 @router.get("/", status_code=status.HTTP_200_OK, response_model=None)
@@ -22,64 +25,82 @@ async def get_books_by_query(
     genre: int = None,
     language: int = None,
     page_number: Annotated[int, Query(gt=0)] = 1,  # Default value is 1
-    page_size: Annotated[int, Query(gt=0)] = 10,  # Default value is 10
-    db: Session = Depends(get_db),
+    page_size: Annotated[
+        int, Query(gt=0, le=MAX_PAGE_SIZE)
+    ] = 10,  # Default value is 10
+    after: str | None = None,  # Cursor of the previous page, overrides page_number
+    shallow: bool = False,  # Only return the columns of the books
+    db: AsyncSession = Depends(get_db),
+    if_none_match: str | None = Header(None),
 ) -> dict:
     """
     Endpoint to get books by author , genre , languages
     """
-    starting_index = (page_number - 1) * page_size
-    query = db.query(Book).order_by(asc(Book.id))
+    cache_key = make_key(
+        author=author,
+        genre=genre,
+        language=language,
+        page_number=page_number,
+        page_size=page_size,
+        after=after,
+        shallow=shallow,
+    )
+    cached, version = await cache_get(BOOK, cache_key, if_none_match)
+    if cached is not None:
+        return cached
+    query = select(Book).options(*book_options(shallow))
     logging.info(f"Book filtered with {author}, {genre},{language}")
 
     if author is not None:
         authordb = (
-            db.execute(
+            await db.scalars(
                 select(Author).where(and_(Author.id == author, not_(Author.is_deleted)))
             )
-            .scalars()
-            .first()
-        )
+        ).first()
         if authordb is None:
             return custom_exception(
                 status_code=status.HTTP_404_NOT_FOUND, details="Author not found"
             )
-        query = query.filter(Book.authors.contains(authordb))
+        query = query.where(Book.authors.contains(authordb))
 
     if genre is not None:
         genredb = (
-            db.execute(
+            await db.scalars(
                 select(Genre).where(and_(Genre.id == genre, not_(Genre.is_deleted)))
             )
-            .scalars()
-            .first()
-        )
+        ).first()
         if genredb is None:
             return custom_exception(
                 status_code=status.HTTP_404_NOT_FOUND, details="Genre not found"
             )
-        query = query.filter(Book.genres.contains(genredb))
+        query = query.where(Book.genres.contains(genredb))
 
     if language is not None:
         languagedb = (
-            db.execute(
+            await db.scalars(
                 select(Language).where(
                     and_(Language.id == language, not_(Language.is_deleted))
                 )
             )
-            .scalars()
-            .first()
-        )
+        ).first()
         if languagedb is None:
             return custom_exception(
                 status_code=status.HTTP_404_NOT_FOUND, details="Language not found"
             )
-        query = query.filter(Book.language_id == language)
+        query = query.where(Book.language_id == language)
     # get all those books which are not deleted
-    query = query.filter(not_(Book.is_deleted))
-    books = query.offset(starting_index).limit(page_size).all()
-    return custom_response(
-        status_code=status.HTTP_200_OK,
-        details="Books fetched successfully!",
-        data=books,
+    query = query.where(not_(Book.is_deleted))
+    query = paginate(query, Book.id, page_number, page_size, after)
+    books, next_cursor = split_page((await db.scalars(query)).all(), page_size, Book.id)
+    return await cache_set(
+        BOOK,
+        cache_key,
+        version,
+        paginated_response(
+            status_code=status.HTTP_200_OK,
+            details="Books fetched successfully!",
+            data=books,
+            next_cursor=next_cursor,
+        ),
+        if_none_match,
     )
@@ -0,0 +1,59 @@
+import logging
+from typing import Annotated
+
+from fastapi import Depends, Header, Query
+from sqlalchemy import not_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette import status
+
+from src.cache import BOOK, cache_get, cache_set, make_key
+from src.dependencies import get_db
+from src.endpoints.book.router_init import router
+from src.endpoints.book.search_utils import book_search
+from src.loaders import book_options
+from src.models.book import Book
+from src.pagination import MAX_PAGE_SIZE, paginate_ranked, split_ranked_page
+from src.responses import paginated_response
+
+
+@router.get("/search", status_code=status.HTTP_200_OK, response_model=None)
+async def search_books(
+    q: Annotated[str, Query(min_length=1, max_length=100)],
+    page_size: Annotated[int, Query(gt=0, le=MAX_PAGE_SIZE)] = 10,
+    after: str | None = None,  # Cursor of the previous page
+    shallow: bool = False,  # Only return the columns of the books
+    db: AsyncSession = Depends(get_db),
+    if_none_match: str | None = Header(None),
+) -> dict:
+    """
+    Endpoint to search books by title, isbn prefix or author name.
+    The best matches come first, the next page is fetched with the next_cursor.
+    """
+    q = q.strip()
+    cache_key = make_key(q=q, page_size=page_size, after=after, shallow=shallow)
+    cached, version = await cache_get(BOOK, cache_key, if_none_match)
+    if cached is not None:
+        return cached
+    logging.info(f"Books searched with {q!r}")
+    condition, rank = book_search(db.bind.dialect.name, q)
+    query = (
+        select(Book, rank)
+        .where(condition, not_(Book.is_deleted))
+        .options(*book_options(shallow))
+    )
+    query = paginate_ranked(query, rank, Book.id, page_size, after)
+    books, next_cursor = split_ranked_page(
+        (await db.execute(query)).all(), page_size, Book.id
+    )
+    return await cache_set(
+        BOOK,
+        cache_key,
+        version,
+        paginated_response(
+            status_code=status.HTTP_200_OK,
+            details="Books searched successfully!",
+            data=books,
+            next_cursor=next_cursor,
+        ),
+        if_none_match,
+    )
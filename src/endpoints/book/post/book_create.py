@@ -2,11 +2,13 @@ import logging
 from datetime import datetime
 
 from fastapi import Depends, HTTPException
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
+from src.book_counters import update_copy_counters
+from src.cache import BOOK, invalidate
 from src.dependencies import get_current_librarian, get_db
 from src.endpoints.book.router_init import router
 from src.exceptions import custom_exception
@@ -17,12 +19,14 @@ from src.models.genre import Genre
 from src.models.language import Language
 from src.responses import custom_response
 from src.schemas.book import BookSchema
+from src.status_constants import AVAILABLE
+from src.status_registry import get_status_id
 
 
 @router.post("/", status_code=status.HTTP_201_CREATED)
 async def book_create(
     book: BookSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     librarian: dict = Depends(get_current_librarian),  # noqa,
 ) -> dict:
     """
@@ -31,31 +35,33 @@ async def book_create(
     logging.info(f"Book Create Request by Librarian {librarian['id']}")
 
     language = (
-        db.execute(select(Language).where(Language.id == book.language_id))
-        .scalars()
-        .first()
-    )
+        await db.scalars(select(Language).where(Language.id == book.language_id))
+    ).first()
     if language is None:
         logging.error("No language found while creating book")
         raise custom_exception(
             status_code=status.HTTP_404_NOT_FOUND, details="Language not found"
         )
     authors = (
-        db.execute(select(Author).where(Author.id.in_(book.author_ids))).scalars().all()
-    )
+        await db.scalars(select(Author).where(Author.id.in_(book.author_ids)))
+    ).all()
     if len(authors) == 0:
         logging.error("No author found while creating book")
         raise custom_exception(
             status_code=status.HTTP_404_NOT_FOUND, details="Author not found"
         )
-    genres = (
-        db.execute(select(Genre).where(Genre.id.in_(book.genre_ids))).scalars().all()
-    )
+    genres = (await db.scalars(select(Genre).where(Genre.id.in_(book.genre_ids)))).all()
     if len(genres) == 0:
         logging.error("No genre found while creating book")
         raise custom_exception(
             status_code=status.HTTP_404_NOT_FOUND, details="Genre not found"
         )
+    available_status_id = await get_status_id(db, AVAILABLE)
+    if available_status_id is None and book.no_of_copies > 0:
+        logging.error("No available status found while creating book")
+        raise custom_exception(
+            status_code=status.HTTP_404_NOT_FOUND, details="Status not found"
+        )
     book_model = Book()
     book_model.title = book.title
     book_model.date_of_publication = datetime.strptime(
@@ -70,27 +76,35 @@ async def book_create(
 
     try:
         db.add(book_model)
-        db.commit()
-        logging.info(
-            f"Book with ID: {book_model.id} Created by Librarian {librarian['id']}"
-        )
-        book_id = book_model.id
-        copy_models = []
-        print(book.no_of_copies)
-        for i in range(book.no_of_copies):
-            copy = Copy(book_id=book_id, language_id=book.language_id, status_id=1)
-            copy_models.append(copy)
-
-        db.add_all(copy_models)
-        db.commit()
-        logging.info(
-            f"{book.no_of_copies} Copies created with Book ID: {book_model.id} Created by Librarian {librarian['id']}"
-        )
+        # The book and its copies are created in one transaction, the copies
+        # with one batched insert instead of an ORM object per copy.
+        await db.flush()
+        if book.no_of_copies > 0:
+            await db.execute(
+                insert(Copy),
+                [
+                    {
+                        "book_id": book_model.id,
+                        "language_id": book.language_id,
+                        "status_id": available_status_id,
+                    }
+                ]
+                * book.no_of_copies,
+            )
+            await update_copy_counters(
+                db, (book_model.id, available_status_id, book.no_of_copies)
+            )
+        await db.commit()
     except IntegrityError as e:
-        print(e)
+        logging.error(f"Book create failed: {e}")
         raise custom_exception(
             status_code=status.HTTP_409_CONFLICT, details="Book already exist"
         )
+    invalidate(BOOK)
+    logging.info(
+        f"Book with ID: {book_model.id} and {book.no_of_copies} copies Created "
+        f"by Librarian {librarian['id']}"
+    )
 
     book.id = book_model.id
 
@@ -3,9 +3,11 @@ from datetime import datetime
 
 from fastapi import Depends
 from sqlalchemy import and_, not_, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from starlette import status
 
+from src.cache import BOOK, invalidate
 from src.dependencies import get_current_librarian, get_db
 from src.endpoints.book.router_init import router
 from src.exceptions import custom_exception
@@ -22,17 +24,19 @@ async def book_update(
     book_id: int,
     book: BookSchema,
     librarian: dict = Depends(get_current_librarian),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> dict:
     """
     Update an existing book by ID.
     """
 
     book_model = (
-        db.execute(select(Book).where(and_(Book.id == book_id, not_(Book.is_deleted))))
-        .scalars()
-        .first()
-    )
+        await db.scalars(
+            select(Book)
+            .where(and_(Book.id == book_id, not_(Book.is_deleted)))
+            .options(selectinload(Book.authors), selectinload(Book.genres))
+        )
+    ).first()
 
     if book_model is None:
         raise custom_exception(
@@ -43,16 +47,12 @@ async def book_update(
     )
 
     language = (
-        db.execute(select(Language).where(Language.id == book.language_id))
-        .scalars()
-        .first()
-    )
+        await db.scalars(select(Language).where(Language.id == book.language_id))
+    ).first()
     authors = (
-        db.execute(select(Author).where(Author.id.in_(book.author_ids))).scalars().all()
-    )
-    genres = (
-        db.execute(select(Genre).where(Genre.id.in_(book.genre_ids))).scalars().all()
-    )
+        await db.scalars(select(Author).where(Author.id.in_(book.author_ids)))
+    ).all()
+    genres = (await db.scalars(select(Genre).where(Genre.id.in_(book.genre_ids)))).all()
 
     book_model.title = book.title
     book_model.date_of_publication = datetime.strptime(
@@ -66,8 +66,9 @@ async def book_update(
     book_model.language = language
 
     db.add(book_model)
-    db.commit()
-    db.refresh(book_model)
+    await db.commit()
+    invalidate(BOOK)
+    await db.refresh(book_model)
     book.id = book_model.id
     logging.info(
         f"Book with ID: {book_model.id} Updated by Librarian {librarian['id']}"
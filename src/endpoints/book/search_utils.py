@@ -0,0 +1,114 @@
+from typing import Tuple
+
+from sqlalchemy import (
+    ColumnElement,
+    Float,
+    and_,
+    case,
+    cast,
+    func,
+    literal_column,
+    not_,
+    or_,
+    select,
+    union,
+)
+
+from src.models.author import Author
+from src.models.book import Book
+from src.models.book_author import BookAuthor
+
+# Text search configuration of the title index (see the search migration).
+# It is inlined rather than bound so that postgres matches the index expression.
+TS_CONFIG = literal_column("'simple'::regconfig")
+# Separator of the author name index expression, inlined for the same reason.
+NAME_SEPARATOR = literal_column("' '")
+
+
+def title_document() -> ColumnElement:
+    return func.to_tsvector(TS_CONFIG, Book.title)
+
+
+def author_name() -> ColumnElement:
+    return Author.first_name + NAME_SEPARATOR + Author.last_name
+
+
+def escape_like(value: str) -> str:
+    return value.replace("/", "//").replace("%", "/%").replace("_", "/_")
+
+
+def matching_books(
+    book_match: ColumnElement, author_match: ColumnElement
+) -> ColumnElement:
+    """
+    Returns the filter of the books matched by book_match or by the name of one
+    of their authors (author_match).
+    Each match is its own select of book ids, combined with UNION, so that both
+    can use their indexes. Postgres can't combine indexes through an OR with a
+    correlated author subquery and scans every book instead.
+    """
+    return Book.id.in_(
+        union(
+            select(Book.id).where(book_match),
+            select(BookAuthor.book_id)
+            .join(Author, Author.id == BookAuthor.author_id)
+            .where(
+                and_(not_(BookAuthor.is_deleted), not_(Author.is_deleted), author_match)
+            ),
+        )
+    )
+
+
+def postgres_search(q: str) -> Tuple[ColumnElement, ColumnElement]:
+    """
+    Returns the filter and rank of a search on postgres.
+    Titles are matched by full text search (GIN index) or by trigram similarity
+    (pg_trgm index) for typos, authors by name and isbns by prefix.
+    """
+    query = func.websearch_to_tsquery(TS_CONFIG, q)
+    isbn_match = Book.isbn.like(f"{escape_like(q)}%", escape="/")
+    name = author_name()
+    condition = matching_books(
+        or_(title_document().op("@@")(query), Book.title.op("%")(q), isbn_match),
+        or_(name.op("%")(q), name.ilike(f"%{escape_like(q)}%", escape="/")),
+    )
+    rank = cast(
+        func.ts_rank(title_document(), query)
+        + func.similarity(Book.title, q)
+        + case((isbn_match, 1), else_=0),
+        Float,
+    )
+    return condition, rank
+
+
+def fallback_search(q: str) -> Tuple[ColumnElement, ColumnElement]:
+    """
+    Returns the filter and rank of a search on databases without full text
+    search (sqlite in the tests). Titles and author names are matched by
+    substring and isbns by prefix.
+    """
+    isbn_match = Book.isbn.startswith(q, autoescape=True)
+    condition = matching_books(
+        or_(Book.title.icontains(q, autoescape=True), isbn_match),
+        author_name().icontains(q, autoescape=True),
+    )
+    rank = cast(
+        case(
+            (isbn_match, 3),
+            (Book.title.istartswith(q, autoescape=True), 2),
+            (Book.title.icontains(q, autoescape=True), 1),
+            else_=0.5,
+        ),
+        Float,
+    )
+    return condition, rank
+
+
+def book_search(dialect: str, q: str) -> Tuple[ColumnElement, ColumnElement]:
+    """
+    Returns the filter matching the books of a search and the rank to order
+    them by (higher is better) for the given database dialect.
+    """
+    if dialect == "postgresql":
+        return postgres_search(q)
+    return fallback_search(q)
@@ -5,8 +5,9 @@ from src.endpoints.borrowed.get import (
     get_all_borrowed_for_logged_in_user,
     get_borrowed_by_id,
 )
-from src.endpoints.borrowed.post import create_borrowed
+from src.endpoints.borrowed.post import bulk_checkout, create_borrowed
 from src.endpoints.borrowed.put import (
+    bulk_return,
     return_borrowed_for_any_user,
     return_borrowed_for_user,
     update_borrowed_by_id,
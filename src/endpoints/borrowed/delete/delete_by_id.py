@@ -2,13 +2,15 @@ import logging
 
 from fastapi import Depends, Path, status
 from sqlalchemy import and_, not_, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.book_counters import update_copy
 from src.dependencies import get_current_librarian, get_db
 from src.endpoints.borrowed.router_init import router
 from src.exceptions import custom_exception
 from src.models import all_models
 from src.status_constants import AVAILABLE, BORROWED
+from src.status_registry import get_status_id, get_status_name
 
 
 @router.delete(
@@ -16,7 +18,7 @@ from src.status_constants import AVAILABLE, BORROWED
 )
 async def delete_borrowed(
     borrowed_id: int = Path(gt=-1),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     librarian: dict = Depends(get_current_librarian),
 ) -> dict:
     """
@@ -30,7 +32,7 @@ async def delete_borrowed(
     """
 
     logging.info("Deleting borrowed in database with id: " + str(borrowed_id))
-    found_borrowed = db.scalar(
+    found_borrowed = await db.scalar(
         select(all_models.Borrowed).where(
             and_(
                 all_models.Borrowed.id == borrowed_id,
@@ -43,7 +45,7 @@ async def delete_borrowed(
         raise custom_exception(
             status_code=status.HTTP_404_NOT_FOUND, details="Borrowed not found."
         )
-    found_copy = db.scalar(
+    found_copy = await db.scalar(
         select(all_models.Copy).where(
             and_(
                 all_models.Copy.id == found_borrowed.copy_id,
@@ -58,14 +60,7 @@ async def delete_borrowed(
         raise custom_exception(
             status_code=status.HTTP_404_NOT_FOUND, details="Copy not found."
         )
-    found_status = db.scalar(
-        select(all_models.Status).where(
-            and_(
-                all_models.Status.id == found_copy.status_id,
-                not_(all_models.Status.is_deleted),
-            )
-        )
-    )
+    found_status = await get_status_name(db, found_copy.status_id)
     if not found_status:
         logging.warning(
             "Status not found in database with id: " + str(found_copy.status_id)
@@ -74,17 +69,13 @@ async def delete_borrowed(
             status_code=status.HTTP_404_NOT_FOUND, details="Status not found."
         )
     try:
-        if found_status.status == BORROWED:
-            found_copy.status_id = db.scalar(
-                select(all_models.Status.id).where(
-                    and_(
-                        all_models.Status.status == AVAILABLE,
-                        not_(all_models.Status.is_deleted),
-                    )
-                )
+        if found_status == BORROWED:
+            # Skipped when the copy was returned concurrently.
+            await update_copy(
+                db, found_copy, {"status_id": await get_status_id(db, AVAILABLE)}
             )
         found_borrowed.is_deleted = True
-        db.commit()
+        await db.commit()
         logging.info("Borrowed deleted successfully")
     except Exception as e:
         logging.error("An error occurred: " + str(e))
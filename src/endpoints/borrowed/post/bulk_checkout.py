@@ -0,0 +1,143 @@
+import logging
+
+from fastapi import Depends, status
+from sqlalchemy import and_, not_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.book_counters import update_copy_counters
+from src.dependencies import get_current_librarian, get_db
+from src.endpoints.borrowed.router_init import router
+from src.exceptions import custom_exception
+from src.models import all_models
+from src.responses import custom_response
+from src.schemas.borrowed import BulkCheckoutSchema
+from src.status_constants import AVAILABLE, BORROWED
+from src.status_registry import get_status_id
+
+
+@router.post("/bulk", response_model=None, status_code=status.HTTP_200_OK)
+async def bulk_checkout(
+    checkout: BulkCheckoutSchema,
+    librarian: dict = Depends(get_current_librarian),
+    db: AsyncSession = Depends(get_db),
+) -> dict:
+    """
+    This function will be used to check out many copies to a user at once.
+    All the available copies are checked out with one conditional update and
+    their borrowed are inserted in the same transaction.
+    Parameters:
+        checkout: The user, the copies and the dates.
+        librarian: The librarian data. (current librarian)
+        db: The database session.
+    Returns:
+        A dict that contains the status_code, details and the result of every
+        copy (copy_id, borrowed_id, success and details).
+    """
+    copy_ids = list(dict.fromkeys(checkout.copy_ids))
+    logging.info(
+        f"Librarian {librarian['id']} checking out {len(copy_ids)} copies "
+        f"to user {checkout.user_id}"
+    )
+    user_id = await db.scalar(
+        select(all_models.User.id).where(
+            and_(
+                all_models.User.id == checkout.user_id,
+                not_(all_models.User.is_deleted),
+            )
+        )
+    )
+    if user_id is None:
+        raise custom_exception(
+            status_code=status.HTTP_404_NOT_FOUND, details="User not found."
+        )
+
+    available_status_id = await get_status_id(db, AVAILABLE)
+    borrowed_status_id = await get_status_id(db, BORROWED)
+    checked_out = {}
+    # Without the available status the update would match the copies without
+    # a status instead.
+    if available_status_id is not None and borrowed_status_id is not None:
+        checked_out = dict(
+            (
+                await db.execute(
+                    update(all_models.Copy)
+                    .where(
+                        and_(
+                            all_models.Copy.id.in_(copy_ids),
+                            all_models.Copy.status_id == available_status_id,
+                            not_(all_models.Copy.is_deleted),
+                        )
+                    )
+                    .values(status_id=borrowed_status_id)
+                    .returning(all_models.Copy.id, all_models.Copy.book_id)
+                )
+            ).all()
+        )
+        await update_copy_counters(
+            db,
+            *(
+                change
+                for book_id in checked_out.values()
+                for change in (
+                    (book_id, available_status_id, -1),
+                    (book_id, borrowed_status_id, 1),
+                )
+            ),
+        )
+    new_borrowed = {
+        copy_id: all_models.Borrowed(
+            copy_id=copy_id,
+            user_id=user_id,
+            issue_date=checkout.issue_date,
+            due_date=checkout.due_date,
+        )
+        for copy_id in copy_ids
+        if copy_id in checked_out
+    }
+    db.add_all(new_borrowed.values())
+    await db.flush()
+
+    # Only the copies that failed are read, to tell why they failed.
+    existing = set(
+        await db.scalars(
+            select(all_models.Copy.id).where(
+                and_(
+                    all_models.Copy.id.in_(set(copy_ids) - checked_out.keys()),
+                    not_(all_models.Copy.is_deleted),
+                )
+            )
+        )
+    )
+    await db.commit()
+
+    results = []
+    for copy_id in copy_ids:
+        if copy_id in new_borrowed:
+            details = "Borrowed created successfully!"
+        elif copy_id not in existing:
+            details = "Copy with given ID does not exist"
+        elif available_status_id is None:
+            details = "Available status does not exist"
+        elif borrowed_status_id is None:
+            details = "Borrowed status does not exist"
+        else:
+            details = "Copy is not available"
+        results.append(
+            {
+                "copy_id": copy_id,
+                "borrowed_id": new_borrowed[copy_id].id
+                if copy_id in new_borrowed
+                else None,
+                "success": copy_id in new_borrowed,
+                "details": details,
+            }
+        )
+    logging.info(
+        f"Checked out {len(new_borrowed)} of {len(copy_ids)} copies "
+        f"to user {checkout.user_id}"
+    )
+    return custom_response(
+        status_code=status.HTTP_200_OK,
+        details=f"{len(new_borrowed)} of {len(copy_ids)} copies checked out",
+        data=results,
+    )
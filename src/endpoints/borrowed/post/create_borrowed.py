@@ -1,9 +1,10 @@
 import logging
 
 from fastapi import Depends, HTTPException, status
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, not_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.book_counters import update_copy_counters
 from src.dependencies import get_current_user, get_db
 from src.endpoints.borrowed.router_init import router
 from src.exceptions import custom_exception
@@ -11,16 +12,19 @@ from src.models import all_models
 from src.responses import custom_response
 from src.schemas.borrowed import BorrowedSchema
 from src.status_constants import AVAILABLE, BORROWED
+from src.status_registry import get_status_id, get_status_name
 
 
 @router.post("/", response_model=None, status_code=status.HTTP_201_CREATED)
 async def create_borrowed(
     borrowed: BorrowedSchema,
     user: dict = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> dict:
     """
     This function will be used to create a new borrowed.
+    The copy is checked out with a single conditional update, so that when
+    the same copy is borrowed concurrently only one of the requests succeeds.
     Parameters:
         borrowed: The borrowed data.
         db: The database session.
@@ -28,39 +32,35 @@ async def create_borrowed(
         A dictionary containing the status code, details and data.
     """
     logging.info(f"Creating new borrowed in database with user ID: {user.get('id')}")
-    copy = (
-        db.scalars(
-            select(all_models.Copy).where(all_models.Copy.id == borrowed.copy_id)
+    available_status_id = await get_status_id(db, AVAILABLE)
+    borrowed_status_id = await get_status_id(db, BORROWED)
+    checked_out_book_id = None
+    # Without the available status the update would match the copies without
+    # a status instead.
+    if available_status_id is not None and borrowed_status_id is not None:
+        # Locks the copy row until commit, a concurrent checkout waits for it
+        # and then no longer matches the available status.
+        checked_out_book_id = await db.scalar(
+            update(all_models.Copy)
+            .where(
+                and_(
+                    all_models.Copy.id == borrowed.copy_id,
+                    all_models.Copy.status_id == available_status_id,
+                    not_(all_models.Copy.is_deleted),
+                )
+            )
+            .values(status_id=borrowed_status_id)
+            .returning(all_models.Copy.book_id)
         )
-        .unique()
-        .one_or_none()
+    if checked_out_book_id is None:
+        await db.rollback()
+        await raise_copy_not_available(borrowed.copy_id, db)
+    await update_copy_counters(
+        db,
+        (checked_out_book_id, available_status_id, -1),
+        (checked_out_book_id, borrowed_status_id, 1),
     )
-    if copy is None:
-        raise custom_exception(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            details="Copy with given ID does not exist",
-        )
-    found_status = (
-        db.scalars(
-            select(all_models.Status).where(all_models.Status.id == copy.status_id)
-        )
-        .unique()
-        .one_or_none()
-    )
-    if found_status is None:
-        raise custom_exception(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            details="Status with given ID does not exist",
-        )
-    if found_status.status != AVAILABLE:
-        raise custom_exception(
-            status_code=status.HTTP_400_BAD_REQUEST, details="Copy is not available"
-        )
     try:
-        new_status_id = db.scalars(
-            select(all_models.Status.id).where(all_models.Status.status == BORROWED)
-        ).first()
-        copy.status_id = new_status_id
         new_borrowed = all_models.Borrowed()
         new_borrowed.copy_id = borrowed.copy_id
         new_borrowed.user_id = user.get("id")
@@ -68,9 +68,8 @@ async def create_borrowed(
         new_borrowed.due_date = borrowed.due_date
         new_borrowed.return_date = borrowed.return_date
         db.add(new_borrowed)
-        db.commit()
+        await db.commit()
         logging.info(f"Created new borrowed in database with user ID: {user.get('id')}")
-        db.refresh(new_borrowed)
         borrowed.id = new_borrowed.id
         borrowed.user_id = user.get("id")
         return custom_response(
@@ -86,3 +85,43 @@ async def create_borrowed(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             details="Error creating borrowed details  = " + str(e),
         )
+
+
+async def raise_copy_not_available(copy_id: int, db: AsyncSession) -> None:
+    """
+    This function will be used to explain why a copy could not be checked out.
+    Parameters:
+        copy_id: The id of the copy.
+        db: The database session.
+    Returns:
+        Always raises a HTTPException.
+    """
+    copy = await db.scalar(
+        select(all_models.Copy).where(
+            and_(all_models.Copy.id == copy_id, not_(all_models.Copy.is_deleted))
+        )
+    )
+    if copy is None:
+        raise custom_exception(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            details="Copy with given ID does not exist",
+        )
+    found_status = await get_status_name(db, copy.status_id)
+    if found_status is None:
+        raise custom_exception(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            details="Status with given ID does not exist",
+        )
+    if await get_status_id(db, AVAILABLE) is None:
+        raise custom_exception(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            details="Available status does not exist",
+        )
+    if found_status == AVAILABLE:
+        raise custom_exception(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            details="Borrowed status does not exist",
+        )
+    raise custom_exception(
+        status_code=status.HTTP_400_BAD_REQUEST, details="Copy is not available"
+    )
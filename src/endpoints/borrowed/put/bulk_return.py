@@ -0,0 +1,155 @@
+import logging
+
+from fastapi import Depends, status
+from sqlalchemy import and_, not_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.book_counters import update_copy_counters
+from src.dependencies import get_current_librarian, get_db
+from src.endpoints.borrowed.router_init import router
+from src.exceptions import custom_exception
+from src.models import all_models
+from src.responses import custom_response
+from src.schemas.borrowed import BulkReturnSchema
+from src.status_constants import AVAILABLE, BORROWED
+from src.status_registry import get_status_id
+
+
+@router.put("/bulk/return", response_model=None, status_code=status.HTTP_200_OK)
+async def bulk_return(
+    returned: BulkReturnSchema,
+    librarian: dict = Depends(get_current_librarian),
+    db: AsyncSession = Depends(get_db),
+) -> dict:
+    """
+    This function will be used to return many borrowed at once.
+    The borrowed and their copies are read with one query and updated with one
+    update each, in a single transaction.
+    Only borrowed that are not returned yet are returned, once per copy.
+    Parameters:
+        returned: The borrowed ids and the return date.
+        librarian: The librarian data. (current librarian)
+        db: The database session.
+    Returns:
+        A dict that contains the status_code, details and the result of every
+        borrowed (borrowed_id, copy_id, success and details).
+    """
+    borrowed_ids = list(dict.fromkeys(returned.borrowed_ids))
+    logging.info(f"Librarian {librarian['id']} returning {len(borrowed_ids)} borrowed")
+    rows = await db.execute(
+        select(
+            all_models.Borrowed.id,
+            all_models.Borrowed.copy_id,
+            all_models.Copy.status_id,
+            all_models.Copy.is_deleted,
+        )
+        .outerjoin(all_models.Copy, all_models.Copy.id == all_models.Borrowed.copy_id)
+        .where(
+            and_(
+                all_models.Borrowed.id.in_(borrowed_ids),
+                not_(all_models.Borrowed.is_deleted),
+                all_models.Borrowed.return_date.is_(None),
+            )
+        )
+    )
+    found = {row.id: row for row in rows}
+    # Borrowed whose copy is missing or deleted can't be returned.
+    without_copy = {
+        borrowed_id
+        for borrowed_id, row in found.items()
+        if row.is_deleted is None or row.is_deleted
+    }
+
+    borrowed_status_id = await get_status_id(db, BORROWED)
+    # A copy is returned by the first of its borrowed only.
+    returnable = {}
+    duplicates = set()
+    copy_ids = set()
+    for borrowed_id in borrowed_ids:
+        row = found.get(borrowed_id)
+        if (
+            row is None
+            or borrowed_id in without_copy
+            or row.status_id != borrowed_status_id
+        ):
+            continue
+        if row.copy_id in copy_ids:
+            duplicates.add(borrowed_id)
+        else:
+            copy_ids.add(row.copy_id)
+            returnable[borrowed_id] = row.copy_id
+    returned_copies = {}
+    if returnable:
+        available_status_id = await get_status_id(db, AVAILABLE)
+        if available_status_id is None:
+            raise custom_exception(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                details="Available status does not exist",
+            )
+        # Only copies that are still borrowed are flipped, so a concurrent
+        # return of the same copy can't succeed twice.
+        returned_copies = dict(
+            (
+                await db.execute(
+                    update(all_models.Copy)
+                    .where(
+                        and_(
+                            all_models.Copy.id.in_(copy_ids),
+                            all_models.Copy.status_id == borrowed_status_id,
+                        )
+                    )
+                    .values(status_id=available_status_id)
+                    .returning(all_models.Copy.id, all_models.Copy.book_id)
+                )
+            ).all()
+        )
+        await update_copy_counters(
+            db,
+            *(
+                change
+                for book_id in returned_copies.values()
+                for change in (
+                    (book_id, borrowed_status_id, -1),
+                    (book_id, available_status_id, 1),
+                )
+            ),
+        )
+        returnable = {
+            borrowed_id: copy_id
+            for borrowed_id, copy_id in returnable.items()
+            if copy_id in returned_copies
+        }
+        await db.execute(
+            update(all_models.Borrowed)
+            .where(all_models.Borrowed.id.in_(returnable.keys()))
+            .values(return_date=returned.return_date)
+        )
+    await db.commit()
+
+    results = []
+    for borrowed_id in borrowed_ids:
+        row = found.get(borrowed_id)
+        if row is None:
+            details = "Borrowed not found."
+        elif borrowed_id in without_copy:
+            details = "Copy not found."
+        elif borrowed_id in returnable:
+            details = "Borrowed returned successfully"
+        elif borrowed_id in duplicates:
+            details = "Copy is returned by another borrowed."
+        else:
+            details = "Copy is not borrowed."
+        results.append(
+            {
+                "borrowed_id": borrowed_id,
+                "copy_id": row.copy_id if row else None,
+                "success": borrowed_id in returnable,
+                "details": details,
+            }
+        )
+    logging.info(f"Returned {len(returnable)} of {len(borrowed_ids)} borrowed")
+    return custom_response(
+        status_code=status.HTTP_200_OK,
+        details=f"{len(returnable)} of {len(borrowed_ids)} borrowed returned",
+        data=results,
+    )
@@ -2,8 +2,9 @@ import logging
 
 from fastapi import Depends, Path, status
 from sqlalchemy import and_, not_, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.book_counters import update_copy
 from src.dependencies import get_current_librarian, get_db
 from src.endpoints.borrowed.router_init import router
 from src.exceptions import custom_exception
@@ -11,6 +12,7 @@ from src.models import all_models
 from src.responses import custom_response
 from src.schemas.borrowed import BorrowedSchema
 from src.status_constants import AVAILABLE, BORROWED
+from src.status_registry import get_status_id, get_status_name
 
 
 @router.put(
@@ -21,7 +23,7 @@ from src.status_constants import AVAILABLE, BORROWED
 async def return_borrowed_any_for_user(
     borrowed: BorrowedSchema,
     borrowed_id: int = Path(gt=-1),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     librarian: dict = Depends(get_current_librarian),
 ) -> dict:
     """
@@ -35,7 +37,7 @@ async def return_borrowed_any_for_user(
         A dict that contains the status_code, detail and the data.
     """
     logging.info("Updating borrowed in database with id: " + str(borrowed_id))
-    found_borrowed = db.scalar(
+    found_borrowed = await db.scalar(
         select(all_models.Borrowed).where(
             and_(
                 all_models.Borrowed.id == borrowed_id,
@@ -48,7 +50,7 @@ async def return_borrowed_any_for_user(
         raise custom_exception(
             status_code=status.HTTP_404_NOT_FOUND, details="Borrowed not found."
         )
-    found_copy = db.scalar(
+    found_copy = await db.scalar(
         select(all_models.Copy).where(
             and_(
                 all_models.Copy.id == found_borrowed.copy_id,
@@ -63,14 +65,7 @@ async def return_borrowed_any_for_user(
         raise custom_exception(
             status_code=status.HTTP_404_NOT_FOUND, details="Copy not found."
         )
-    found_status = db.scalar(
-        select(all_models.Status).where(
-            and_(
-                all_models.Status.id == found_copy.status_id,
-                not_(all_models.Status.is_deleted),
-            )
-        )
-    )
+    found_status = await get_status_name(db, found_copy.status_id)
     if not found_status:
         logging.warning(
             "Status not found in database with id: " + str(found_copy.status_id)
@@ -78,24 +73,25 @@ async def return_borrowed_any_for_user(
         raise custom_exception(
             status_code=status.HTTP_404_NOT_FOUND, details="Status not found."
         )
-    if found_status.status != BORROWED:
+    if found_status != BORROWED:
         logging.warning(
             "Copy is not borrowed in database with id: " + str(found_copy.status_id)
         )
         raise custom_exception(
             status_code=status.HTTP_400_BAD_REQUEST, details="Copy is not borrowed."
         )
+    # Only a copy that is still borrowed is returned, so a concurrent return
+    # of the same copy can't succeed twice.
+    returned = await update_copy(
+        db, found_copy, {"status_id": await get_status_id(db, AVAILABLE)}
+    )
+    if not returned:
+        raise custom_exception(
+            status_code=status.HTTP_400_BAD_REQUEST, details="Copy is not borrowed."
+        )
     try:
         found_borrowed.return_date = borrowed.return_date
-        found_copy.status_id = db.scalars(
-            select(all_models.Status.id).where(
-                and_(
-                    all_models.Status.status == AVAILABLE,
-                    not_(all_models.Status.is_deleted),
-                )
-            )
-        ).first()
-        db.commit()
+        await db.commit()
         logging.info("Updated borrowed in database with id: " + str(borrowed_id))
         borrowed.id = borrowed_id
         borrowed.user_id = found_borrowed.user_id
@@ -3,8 +3,9 @@ from datetime import datetime
 
 from fastapi import Depends, Path, status
 from sqlalchemy import and_, not_, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.book_counters import update_copy
 from src.dependencies import get_current_user, get_db
 from src.endpoints.borrowed.router_init import router
 from src.exceptions import custom_exception
@@ -12,6 +13,7 @@ from src.models import all_models
 from src.responses import custom_response
 from src.schemas.borrowed import BorrowedSchema
 from src.status_constants import AVAILABLE, BORROWED
+from src.status_registry import get_status_id, get_status_name
 
 
 @router.put(
@@ -22,7 +24,7 @@ from src.status_constants import AVAILABLE, BORROWED
 async def return_borrowed_for_user(
     borrowed: BorrowedSchema,
     borrowed_id: int = Path(gt=-1),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user: dict = Depends(get_current_user),
 ) -> dict:
     """
@@ -37,8 +39,8 @@ async def return_borrowed_for_user(
     """
     logging.info("Updating borrowed in database with id: " + str(borrowed_id))
     user_id = user["id"]
-    found_borrowed = check_borrowed_exist(user_id, borrowed_id, db)
-    found_copy = db.scalar(
+    found_borrowed = await check_borrowed_exist(user_id, borrowed_id, db)
+    found_copy = await db.scalar(
         select(all_models.Copy).where(
             and_(
                 all_models.Copy.id == found_borrowed.copy_id,
@@ -53,14 +55,7 @@ async def return_borrowed_for_user(
         raise custom_exception(
             status_code=status.HTTP_404_NOT_FOUND, details="Copy not found."
         )
-    found_status = db.scalar(
-        select(all_models.Status).where(
-            and_(
-                all_models.Status.id == found_copy.status_id,
-                not_(all_models.Status.is_deleted),
-            )
-        )
-    )
+    found_status = await get_status_name(db, found_copy.status_id)
     if not found_status:
         logging.warning(
             "Status not found in database with id: " + str(found_copy.status_id)
@@ -68,26 +63,27 @@ async def return_borrowed_for_user(
         raise custom_exception(
             status_code=status.HTTP_404_NOT_FOUND, details="Status not found."
         )
-    if found_status.status != BORROWED:
+    if found_status != BORROWED:
         logging.warning(
             "Copy is not borrowed in database with id: " + str(found_borrowed.copy_id)
         )
         raise custom_exception(
             status_code=status.HTTP_400_BAD_REQUEST, details="Copy is not borrowed."
         )
+    # Only a copy that is still borrowed is returned, so a concurrent return
+    # of the same copy can't succeed twice.
+    returned = await update_copy(
+        db, found_copy, {"status_id": await get_status_id(db, AVAILABLE)}
+    )
+    if not returned:
+        raise custom_exception(
+            status_code=status.HTTP_400_BAD_REQUEST, details="Copy is not borrowed."
+        )
 
     try:
         today = datetime.now().date()
         found_borrowed.return_date = today
-        found_copy.status_id = db.scalars(
-            select(all_models.Status.id).where(
-                and_(
-                    all_models.Status.status == AVAILABLE,
-                    not_(all_models.Status.is_deleted),
-                )
-            )
-        ).first()
-        db.commit()
+        await db.commit()
         logging.info("Updated borrowed in database with id: " + str(borrowed_id))
         borrowed.id = borrowed_id
         borrowed.return_date = today
@@ -105,8 +101,8 @@ async def return_borrowed_for_user(
         )
 
 
-def check_borrowed_exist(
-    user_id: int, borrowed_id: int, db: Session = Depends(get_db)
+async def check_borrowed_exist(
+    user_id: int, borrowed_id: int, db: AsyncSession = Depends(get_db)
 ) -> all_models.Borrowed:
     """
     This function will be used to check if the borrowed exist or not.
@@ -117,7 +113,7 @@ def check_borrowed_exist(
     Returns:
         A HTTPException if the borrowed not found or the borrowed if found.
     """
-    found_borrowed = db.scalar(
+    found_borrowed = await db.scalar(
         select(all_models.Borrowed).where(
             and_(
                 all_models.Borrowed.id == borrowed_id,
@@ -2,7 +2,7 @@ import logging
 
 from fastapi import Depends, Path, status
 from sqlalchemy import and_, not_, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.dependencies import get_current_librarian, get_db
 from src.endpoints.borrowed.router_init import router
@@ -16,7 +16,7 @@ from src.schemas.borrowed import BorrowedSchema
 async def update_borrowed_by_id(
     borrowed: BorrowedSchema,
     borrowed_id: int = Path(gt=-1),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     librarian: dict = Depends(get_current_librarian),
 ) -> dict:
     """
@@ -30,7 +30,7 @@ async def update_borrowed_by_id(
         dict: A dict with the following keys status_code, details and data.
     """
     logging.info("Updating borrowed in database with id: " + str(borrowed_id))
-    found_borrowed = db.scalar(
+    found_borrowed = await db.scalar(
         select(all_models.Borrowed).where(
             and_(
                 all_models.Borrowed.id == borrowed_id,
@@ -47,7 +47,7 @@ async def update_borrowed_by_id(
         found_borrowed.due_date = borrowed.due_date
         if borrowed.return_date:
             found_borrowed.return_date = borrowed.return_date
-        db.commit()
+        await db.commit()
         logging.info("Updated borrowed in database with id: " + str(borrowed_id))
         borrowed.id = borrowed_id
         borrowed.user_id = found_borrowed.user_id
@@ -2,19 +2,20 @@ import logging
 
 from fastapi import Depends
 from sqlalchemy import and_, not_, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
+from src.book_counters import update_copy
 from src.dependencies import get_current_librarian, get_db
 from src.endpoints.copy.router_init import router
 from src.exceptions import custom_exception
 from src.models.copy import Copy
 
 
-@router.delete("/{copy_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete("/{copy_id:int}", status_code=status.HTTP_204_NO_CONTENT)
 async def copy_delete(
     copy_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     librarian: dict = Depends(get_current_librarian),  # noqa
 ) -> None:
     """
@@ -25,18 +26,23 @@ async def copy_delete(
     )
 
     copy_model = (
-        db.execute(select(Copy).where(and_(Copy.id == copy_id, not_(Copy.is_deleted))))
-        .scalars()
-        .first()
-    )
+        await db.scalars(
+            select(Copy).where(and_(Copy.id == copy_id, not_(Copy.is_deleted)))
+        )
+    ).first()
 
     if copy_model is None:
         raise custom_exception(
             status_code=status.HTTP_404_NOT_FOUND, details="Copy not found"
         )
 
-    copy_model.is_deleted = True
-    db.commit()
+    deleted = await update_copy(db, copy_model, {"is_deleted": True})
+    if not deleted:
+        raise custom_exception(
+            status_code=status.HTTP_409_CONFLICT,
+            details="Copy was changed concurrently, try again",
+        )
+    await db.commit()
     logging.info(
         f"Book Updated with id :{copy_id} Request by Librarian {librarian['id']}"
     )
@@ -1,27 +1,47 @@
 import logging
-from typing import List
+from typing import Annotated, List
 
-from fastapi import Depends
+from fastapi import Depends, Query
 from sqlalchemy import and_, not_, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
 from src.dependencies import get_db
 from src.endpoints.copy.router_init import router
+from src.loaders import copy_options
 from src.models.copy import Copy
-from src.responses import custom_response
+from src.pagination import MAX_PAGE_SIZE, count_rows, paginate, split_page
+from src.responses import custom_response, paginated_response
 
 
 @router.get("/", status_code=status.HTTP_200_OK, response_model=None)
-async def get_copies(db: Session = Depends(get_db)) -> dict:
+async def get_copies(
+    db: AsyncSession = Depends(get_db),
+    page_number: Annotated[int, Query(gt=0)] = 1,  # Default value is 1
+    page_size: Annotated[int, Query(gt=0, le=MAX_PAGE_SIZE)] = 10,
+    after: str | None = None,  # Cursor of the previous page, overrides page_number
+    count_only: bool = False,  # Only return the number of copies
+    shallow: bool = False,  # Only return the columns of the copies
+) -> dict:
     """
-    Endpoint to get all copies for copy.
+    Endpoint to get all copies for copy, one page at a time.
     """
     logging.info("All Copy Requested")
 
-    data = (
-        db.execute(select(Copy).where(not_(Copy.is_deleted))).unique().scalars().all()
+    query = select(Copy).where(not_(Copy.is_deleted))
+    if count_only:
+        return custom_response(
+            status_code=status.HTTP_200_OK,
+            details="Copies counted",
+            data={"count": await count_rows(db, query)},
+        )
+    query = paginate(
+        query.options(*copy_options(shallow)), Copy.id, page_number, page_size, after
     )
-    return custom_response(
-        status_code=status.HTTP_200_OK, details="Copies found", data=data
+    data, next_cursor = split_page((await db.scalars(query)).all(), page_size, Copy.id)
+    return paginated_response(
+        status_code=status.HTTP_200_OK,
+        details="Copies found",
+        data=data,
+        next_cursor=next_cursor,
     )
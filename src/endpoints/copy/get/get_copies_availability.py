@@ -0,0 +1,55 @@
+import logging
+from typing import Annotated, Dict, List
+
+from fastapi import Depends, Query
+from sqlalchemy import and_, func, not_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette import status
+
+from src.dependencies import get_db
+from src.endpoints.copy.router_init import router
+from src.exceptions import custom_exception
+from src.models.copy import Copy
+from src.pagination import MAX_PAGE_SIZE
+from src.responses import custom_response
+from src.status_registry import get_status_name
+
+
+@router.get("/availability", status_code=status.HTTP_200_OK, response_model=None)
+async def get_copies_availability(
+    book_ids: Annotated[List[int], Query()],
+    db: AsyncSession = Depends(get_db),
+) -> dict:
+    """
+    Endpoint to get the number of copies of many books (e.g a page of results)
+    per language and status, counted with a single query.
+    """
+    book_ids = list(dict.fromkeys(book_ids))
+    if len(book_ids) > MAX_PAGE_SIZE:
+        raise custom_exception(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            details=f"At most {MAX_PAGE_SIZE} books can be requested",
+        )
+    logging.info(f"Availability of {len(book_ids)} books requested")
+
+    rows = await db.execute(
+        select(Copy.book_id, Copy.language_id, Copy.status_id, func.count())
+        .where(and_(Copy.book_id.in_(book_ids), not_(Copy.is_deleted)))
+        .group_by(Copy.book_id, Copy.language_id, Copy.status_id)
+        .order_by(Copy.book_id, Copy.language_id, Copy.status_id)
+    )
+    availability: Dict[int, List[dict]] = {book_id: [] for book_id in book_ids}
+    for book_id, language_id, status_id, count in rows:
+        availability[book_id].append(
+            {
+                "language_id": language_id,
+                "status_id": status_id,
+                "status": await get_status_name(db, status_id),
+                "count": count,
+            }
+        )
+    return custom_response(
+        status_code=status.HTTP_200_OK,
+        details="Availability fetched successfully!",
+        data=availability,
+    )
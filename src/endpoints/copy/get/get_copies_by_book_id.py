@@ -3,29 +3,33 @@ from typing import List
 
 from fastapi import Depends
 from sqlalchemy import and_, not_, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
 from src.dependencies import get_db
 from src.endpoints.copy.router_init import router
 from src.exceptions import custom_exception
+from src.loaders import copy_options
 from src.models.copy import Copy
 from src.responses import custom_response
 
 
 @router.get("/book/{book_id}", status_code=status.HTTP_200_OK, response_model=None)
-async def get_copies_by_book_id(book_id: int, db: Session = Depends(get_db)) -> dict:
+async def get_copies_by_book_id(
+    book_id: int,
+    shallow: bool = False,  # Only return the columns of the copies
+    db: AsyncSession = Depends(get_db),
+) -> dict:
     """
     Endpoint to get all copies by book id
     """
     copies = (
-        db.execute(
-            select(Copy).where(and_(Copy.book_id == book_id, not_(Copy.is_deleted)))
+        await db.scalars(
+            select(Copy)
+            .where(and_(Copy.book_id == book_id, not_(Copy.is_deleted)))
+            .options(*copy_options(shallow))
         )
-        .unique()
-        .scalars()
-        .all()
-    )
+    ).all()
     if copies:
         logging.info(f"Copies with book id : {book_id}")
         return custom_response(
@@ -2,26 +2,29 @@ import logging
 
 from fastapi import Depends
 from sqlalchemy import and_, not_, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
 from src.dependencies import get_db
 from src.endpoints.copy.router_init import router
 from src.exceptions import custom_exception
+from src.loaders import copy_options
 from src.models.copy import Copy
 from src.responses import custom_response
 
 
-@router.get("/{copy_id}", status_code=status.HTTP_200_OK, response_model=None)
-async def get_copy_by_id(copy_id: int, db: Session = Depends(get_db)) -> dict:
+@router.get("/{copy_id:int}", status_code=status.HTTP_200_OK, response_model=None)
+async def get_copy_by_id(copy_id: int, db: AsyncSession = Depends(get_db)) -> dict:
     """
     Endpoint to get copy by id
     """
     copy = (
-        db.execute(select(Copy).where(and_(Copy.id == copy_id, not_(Copy.is_deleted))))
-        .scalars()
-        .first()
-    )
+        await db.scalars(
+            select(Copy)
+            .where(and_(Copy.id == copy_id, not_(Copy.is_deleted)))
+            .options(*copy_options())
+        )
+    ).first()
     if copy:
         logging.info(f"Copy with copy id : {copy_id}")
         return custom_response(
@@ -1,9 +1,10 @@
 import logging
 
 from fastapi import Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
+from src.book_counters import update_copy_counters
 from src.dependencies import get_current_librarian, get_db
 from src.endpoints.copy.router_init import router
 from src.exceptions import custom_exception
@@ -15,7 +16,7 @@ from src.schemas.copy import CopySchema
 @router.post("/", status_code=status.HTTP_201_CREATED, response_model=None)
 async def copy_create(
     copy: CopySchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     librarian: dict = Depends(get_current_librarian),  # noqa
 ) -> dict:
     """
@@ -28,7 +29,8 @@ async def copy_create(
         copy_model.language_id = copy.language_id
         copy_model.status_id = copy.status_id
         db.add(copy_model)
-        db.commit()
+        await update_copy_counters(db, (copy.book_id, copy.status_id, 1))
+        await db.commit()
         logging.info(
             f"Copy with id : {copy_model.id} Created by Librarian {librarian['id']}"
         )
@@ -2,9 +2,10 @@ import logging
 
 from fastapi import Depends
 from sqlalchemy import and_, not_, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
+from src.book_counters import update_copy
 from src.dependencies import get_current_librarian, get_db
 from src.endpoints.copy.router_init import router
 from src.exceptions import custom_exception
@@ -13,11 +14,11 @@ from src.responses import custom_response
 from src.schemas.copy import CopySchema
 
 
-@router.put("/{copy_id}", status_code=status.HTTP_200_OK)
+@router.put("/{copy_id:int}", status_code=status.HTTP_200_OK)
 async def copy_update(
     copy_id: int,
     copy: CopySchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     librarian: dict = Depends(get_current_librarian),  # noqa
 ) -> dict:
     """
@@ -28,26 +29,33 @@ async def copy_update(
     )
 
     copy_model = (
-        db.execute(
+        await db.scalars(
             select(all_models.Copy).where(
                 and_(all_models.Copy.id == copy_id, not_(all_models.Copy.is_deleted))
             )
         )
-        .scalars()
-        .first()
-    )
+    ).first()
     if copy_model is None:
         logging.info(f"Book Update with id :{copy_id} , not found")
         raise custom_exception(
             status_code=status.HTTP_404_NOT_FOUND, details="Copy not found"
         )
 
-    copy_model.book_id = copy.book_id
-    copy_model.language_id = copy.language_id
-    copy_model.status_id = copy.status_id
-
-    db.add(copy_model)
-    db.commit()
+    updated = await update_copy(
+        db,
+        copy_model,
+        {
+            "book_id": copy.book_id,
+            "language_id": copy.language_id,
+            "status_id": copy.status_id,
+        },
+    )
+    if not updated:
+        raise custom_exception(
+            status_code=status.HTTP_409_CONFLICT,
+            details="Copy was changed concurrently, try again",
+        )
+    await db.commit()
     logging.info(
         f"Book Updated with id :{copy_id} Request by Librarian {librarian['id']}"
     )
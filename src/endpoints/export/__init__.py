@@ -0,0 +1,4 @@
+from src.endpoints.export.get.export_books import export_books
+from src.endpoints.export.get.export_borrowed import export_borrowed
+from src.endpoints.export.get.export_copies import export_copies
+from src.endpoints.export.router_init import router
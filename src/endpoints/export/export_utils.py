@@ -0,0 +1,77 @@
+import csv
+import io
+import json
+from enum import Enum
+from typing import AsyncIterator
+
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Rows fetched from the server side cursor at a time.
+EXPORT_BATCH_SIZE = 1000
+
+
+class ExportFormat(str, Enum):
+    """
+    Formats a table can be exported in.
+    """
+
+    ndjson = "ndjson"
+    csv = "csv"
+
+
+MEDIA_TYPES = {
+    ExportFormat.ndjson: "application/x-ndjson",
+    ExportFormat.csv: "text/csv",
+}
+
+
+async def stream_ndjson(db: AsyncSession, query: Select) -> AsyncIterator[str]:
+    """
+    Yields every row of the query as a json document on its own line.
+    """
+    result = await db.stream(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+    async for row in result.mappings():
+        yield json.dumps(dict(row), default=str) + "\n"
+
+
+async def stream_csv(db: AsyncSession, query: Select) -> AsyncIterator[str]:
+    """
+    Yields the header and then every row of the query as a csv line.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def flush() -> str:
+        line = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+        return line
+
+    writer.writerow(query.selected_columns.keys())
+    yield flush()
+    result = await db.stream(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+    async for row in result:
+        writer.writerow(row)
+        yield flush()
+
+
+def export_response(
+    db: AsyncSession, query: Select, export_format: ExportFormat, name: str
+) -> StreamingResponse:
+    """
+    Returns a response that streams the rows of the query row by row, so memory
+    stays constant whatever the size of the table is.
+    """
+    if export_format == ExportFormat.csv:
+        content = stream_csv(db, query)
+    else:
+        content = stream_ndjson(db, query)
+    return StreamingResponse(
+        content,
+        media_type=MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{name}.{export_format.value}"'
+        },
+    )
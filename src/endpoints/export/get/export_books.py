@@ -0,0 +1,34 @@
+import logging
+
+from fastapi import Depends
+from fastapi.responses import StreamingResponse
+from sqlalchemy import not_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.dependencies import get_current_librarian, get_db
+from src.endpoints.export.export_utils import ExportFormat, export_response
+from src.endpoints.export.router_init import router
+from src.models.book import Book
+
+
+@router.get("/books", response_model=None)
+async def export_books(
+    export_format: ExportFormat = ExportFormat.ndjson,
+    librarian: dict = Depends(get_current_librarian),
+    db: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """
+    Streams all the books (without relationships) as ndjson or csv.\n
+    Params
+    ------
+    JWT token of librarian.\n
+    export_format: ndjson | csv
+    Returns
+    ------
+    StreamingResponse : One book row per line
+    """
+    logging.info(f"Librarian {librarian['id']} exporting books -- {__name__}")
+    query = (
+        select(*Book.__table__.columns).where(not_(Book.is_deleted)).order_by(Book.id)
+    )
+    return export_response(db, query, export_format, "books")
@@ -0,0 +1,36 @@
+import logging
+
+from fastapi import Depends
+from fastapi.responses import StreamingResponse
+from sqlalchemy import not_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.dependencies import get_current_librarian, get_db
+from src.endpoints.export.export_utils import ExportFormat, export_response
+from src.endpoints.export.router_init import router
+from src.models.borrowed import Borrowed
+
+
+@router.get("/borrowed", response_model=None)
+async def export_borrowed(
+    export_format: ExportFormat = ExportFormat.ndjson,
+    librarian: dict = Depends(get_current_librarian),
+    db: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """
+    Streams all the borrowed (without relationships) as ndjson or csv.\n
+    Params
+    ------
+    JWT token of librarian.\n
+    export_format: ndjson | csv
+    Returns
+    ------
+    StreamingResponse : One borrowed row per line
+    """
+    logging.info(f"Librarian {librarian['id']} exporting borrowed -- {__name__}")
+    query = (
+        select(*Borrowed.__table__.columns)
+        .where(not_(Borrowed.is_deleted))
+        .order_by(Borrowed.id)
+    )
+    return export_response(db, query, export_format, "borrowed")
@@ -0,0 +1,34 @@
+import logging
+
+from fastapi import Depends
+from fastapi.responses import StreamingResponse
+from sqlalchemy import not_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.dependencies import get_current_librarian, get_db
+from src.endpoints.export.export_utils import ExportFormat, export_response
+from src.endpoints.export.router_init import router
+from src.models.copy import Copy
+
+
+@router.get("/copies", response_model=None)
+async def export_copies(
+    export_format: ExportFormat = ExportFormat.ndjson,
+    librarian: dict = Depends(get_current_librarian),
+    db: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """
+    Streams all the copies (without relationships) as ndjson or csv.\n
+    Params
+    ------
+    JWT token of librarian.\n
+    export_format: ndjson | csv
+    Returns
+    ------
+    StreamingResponse : One copy row per line
+    """
+    logging.info(f"Librarian {librarian['id']} exporting copies -- {__name__}")
+    query = (
+        select(*Copy.__table__.columns).where(not_(Copy.is_deleted)).order_by(Copy.id)
+    )
+    return export_response(db, query, export_format, "copies")
@@ -0,0 +1,5 @@
+from fastapi import APIRouter
+
+router = APIRouter(
+    prefix="/export", tags=["export"], responses={401: {"user": "Not authorized"}}
+)
@@ -2,8 +2,9 @@ import logging
 
 from fastapi import Depends, Path, status
 from sqlalchemy import and_, not_, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.cache import GENRE, invalidate
 from src.dependencies import get_current_librarian, get_db
 from src.endpoints.genre.router_init import router
 from src.exceptions import custom_exception
@@ -16,7 +17,7 @@ from src.models import all_models
 async def delete_genre_by_id(
     genre_id: int = Path(gt=-1),
     user: dict = Depends(get_current_librarian),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> None:
     """
     This function will be used to delete a genre by id.
@@ -28,9 +29,11 @@ async def delete_genre_by_id(
         None
     """
     logging.info("Deleting genre in database with id: " + str(genre_id))
-    found_genre = db.scalars(
-        select(all_models.Genre).where(
-            and_(all_models.Genre.id == genre_id, not_(all_models.Genre.is_deleted))
+    found_genre = (
+        await db.scalars(
+            select(all_models.Genre).where(
+                and_(all_models.Genre.id == genre_id, not_(all_models.Genre.is_deleted))
+            )
         )
     ).first()
     if not found_genre:
@@ -40,7 +43,8 @@ async def delete_genre_by_id(
         )
     try:
         found_genre.is_deleted = True
-        db.commit()
+        await db.commit()
+        invalidate(GENRE)
         logging.info("Deleted Genre in database with id: " + str(genre_id))
     except Exception as e:
         logging.exception("Error deleting Genre from database. Details = " + str(e))
@@ -1,9 +1,10 @@
 import logging
 
-from fastapi import Depends, Path, status
+from fastapi import Depends, Header, Path, status
 from sqlalchemy import and_, not_, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.cache import GENRE, cache_get, cache_set, make_key
 from src.dependencies import get_db
 from src.endpoints.genre.router_init import router
 from src.exceptions import custom_exception
@@ -14,7 +15,8 @@ from src.responses import custom_response
 @router.get("/{genre_id}", response_model=None, status_code=status.HTTP_200_OK)
 async def get_genre_by_id(
     genre_id: int = Path(gt=-1),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
+    if_none_match: str | None = Header(None),
 ) -> dict:
     """
     This function will be used to get a Genre by id.
@@ -22,13 +24,20 @@ async def get_genre_by_id(
         genre_id: The id of the genre.
         user: The user data. (current libarian)
         db: The database session.
+        if_none_match: The ETag of the copy the client already has.
     Returns:
         dict: A dictionary with the status code and message and data.
     """
+    cache_key = make_key(genre_id=genre_id)
+    cached, version = await cache_get(GENRE, cache_key, if_none_match)
+    if cached is not None:
+        return cached
     logging.info("Getting genre by id = " + str(genre_id) + " from database")
-    genre = db.scalars(
-        select(all_models.Genre).where(
-            and_(all_models.Genre.id == genre_id, not_(all_models.Genre.is_deleted))
+    genre = (
+        await db.scalars(
+            select(all_models.Genre).where(
+                and_(all_models.Genre.id == genre_id, not_(all_models.Genre.is_deleted))
+            )
         )
     ).first()
     if not genre:
@@ -37,6 +46,12 @@ async def get_genre_by_id(
             status_code=status.HTTP_404_NOT_FOUND, details="Genre not found."
         )
     logging.info("Genre found in database and returned")
-    return custom_response(
-        status_code=status.HTTP_200_OK, details="Genre found", data=genre
+    return await cache_set(
+        GENRE,
+        cache_key,
+        version,
+        custom_response(
+            status_code=status.HTTP_200_OK, details="Genre found", data=genre
+        ),
+        if_none_match,
     )
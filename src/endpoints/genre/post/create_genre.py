@@ -1,8 +1,9 @@
 import logging
 
 from fastapi import Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.cache import GENRE, invalidate
 from src.dependencies import get_current_librarian, get_db
 from src.endpoints.genre.router_init import router
 from src.exceptions import custom_exception
@@ -15,7 +16,7 @@ from src.schemas import genre
 async def create_genre(
     new_genre: genre.GenreSchema,
     user: dict = Depends(get_current_librarian),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> dict:
     """
     This function will be used to create a new genre.
@@ -31,8 +32,9 @@ async def create_genre(
         genre_model = all_models.Genre()
         genre_model.genre = new_genre.genre
         db.add(genre_model)
-        db.commit()
-        db.refresh(genre_model)
+        await db.commit()
+        invalidate(GENRE)
+        await db.refresh(genre_model)
         logging.info("Created new Genre in database with name: " + new_genre.genre)
         new_genre.id = genre_model.id
         return custom_response(
@@ -2,8 +2,9 @@ import logging
 
 from fastapi import Depends, Path, status
 from sqlalchemy import and_, not_, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.cache import GENRE, invalidate
 from src.dependencies import get_current_librarian, get_db
 from src.endpoints.genre.router_init import router
 from src.exceptions import custom_exception
@@ -17,7 +18,7 @@ async def update_genre_by_id(
     new_genre: genre.GenreSchema,
     genre_id: int = Path(gt=-1),
     user: dict = Depends(get_current_librarian),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> dict:
     """
     This function will be used to update a genre by id.
@@ -30,7 +31,7 @@ async def update_genre_by_id(
         dict: A dictionary with the status code and message and data.
     """
     logging.info("Updating genre in database with id: " + str(genre_id))
-    found_genre = db.scalar(
+    found_genre = await db.scalar(
         select(all_models.Genre).where(
             and_(all_models.Genre.id == genre_id, not_(all_models.Genre.is_deleted))
         )
@@ -42,7 +43,8 @@ async def update_genre_by_id(
         )
     try:
         found_genre.genre = new_genre.genre
-        db.commit()
+        await db.commit()
+        invalidate(GENRE)
         logging.info("Updated Genre in database with id: " + str(genre_id))
         new_genre.id = genre_id
         return custom_response(
@@ -2,8 +2,9 @@ import logging
 
 from fastapi import Depends, Path, status
 from sqlalchemy import and_, not_, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.cache import LANGUAGE, invalidate
 from src.dependencies import get_current_librarian, get_db
 from src.endpoints.language.router_init import router
 from src.exceptions import custom_exception
@@ -16,7 +17,7 @@ from src.models import all_models
 async def delete_language_by_id(
     language_id: int = Path(gt=-1),
     user: dict = Depends(get_current_librarian),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> None:
     """
     This function will be used to delete a language by id.
@@ -28,11 +29,13 @@ async def delete_language_by_id(
         None
     """
     logging.info("Deleting language in database with id: " + str(language_id))
-    found_language = db.scalars(
-        select(all_models.Language).where(
-            and_(
-                all_models.Language.id == language_id,
-                not_(all_models.Language.is_deleted),
+    found_language = (
+        await db.scalars(
+            select(all_models.Language).where(
+                and_(
+                    all_models.Language.id == language_id,
+                    not_(all_models.Language.is_deleted),
+                )
             )
         )
     ).first()
@@ -43,7 +46,8 @@ async def delete_language_by_id(
         )
     try:
         found_language.is_deleted = True
-        db.commit()
+        await db.commit()
+        invalidate(LANGUAGE)
         logging.info("Deleted language in database with id: " + str(language_id))
     except Exception as e:
         logging.exception("Error deleting language from database. Details = " + str(e))
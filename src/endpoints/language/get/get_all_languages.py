@@ -1,35 +1,78 @@
 import logging
-from typing import List
+from typing import Annotated, List
 
-from fastapi import Depends, status
+from fastapi import Depends, Header, Query, status
 from sqlalchemy import and_, not_, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.cache import LANGUAGE, cache_get, cache_set, make_key
 from src.dependencies import get_db
 from src.endpoints.language.router_init import router
 from src.exceptions import custom_exception
 from src.models import all_models
-from src.responses import custom_response
+from src.pagination import MAX_PAGE_SIZE, count_rows, paginate, split_page
+from src.responses import custom_response, paginated_response
 
 
 @router.get("/", response_model=None, status_code=status.HTTP_200_OK)
-async def get_all_languages(db: Session = Depends(get_db)) -> dict:
+async def get_all_languages(
+    db: AsyncSession = Depends(get_db),
+    if_none_match: str | None = Header(None),
+    page_number: Annotated[int, Query(gt=0)] = 1,  # Default value is 1
+    # Languages are a small lookup list, so by default a single page holds them all.
+    page_size: Annotated[int, Query(gt=0, le=MAX_PAGE_SIZE)] = MAX_PAGE_SIZE,
+    after: str | None = None,  # Cursor of the previous page, overrides page_number
+    count_only: bool = False,  # Only return the number of languages
+) -> dict:
     """
-    This function will be used to get all the languages.
+    This function will be used to get all the languages, one page at a time.
     Parameters:
         db: The database session.
+        if_none_match: The ETag of the copy the client already has.
+        page_number: The page to return when no cursor is given.
+        page_size: The number of languages in a page.
+        after: The cursor of the previous page.
+        count_only: Only return the number of languages.
     Returns:
         dict: The list of all languages.
     """
+    cache_key = make_key(
+        page_number=page_number, page_size=page_size, after=after, count_only=count_only
+    )
+    cached, version = await cache_get(LANGUAGE, cache_key, if_none_match)
+    if cached is not None:
+        return cached
     logging.info("Getting all languages")
+    query = select(all_models.Language).where(not_(all_models.Language.is_deleted))
+    if not count_only:
+        query = paginate(query, all_models.Language.id, page_number, page_size, after)
     try:
-        all_languages = db.scalars(
-            select(all_models.Language).where(not_(all_models.Language.is_deleted))
-        ).all()
-        return custom_response(
-            status_code=status.HTTP_200_OK,
-            details="All languages found",
-            data=all_languages,
+        if count_only:
+            return await cache_set(
+                LANGUAGE,
+                cache_key,
+                version,
+                custom_response(
+                    status_code=status.HTTP_200_OK,
+                    details="All languages counted",
+                    data={"count": await count_rows(db, query)},
+                ),
+                if_none_match,
+            )
+        all_languages, next_cursor = split_page(
+            (await db.scalars(query)).all(), page_size, all_models.Language.id
+        )
+        return await cache_set(
+            LANGUAGE,
+            cache_key,
+            version,
+            paginated_response(
+                status_code=status.HTTP_200_OK,
+                details="All languages found",
+                data=all_languages,
+                next_cursor=next_cursor,
+            ),
+            if_none_match,
         )
     except Exception as e:
         logging.exception(
@@ -1,9 +1,10 @@
 import logging
 
-from fastapi import Depends, Path, status
+from fastapi import Depends, Header, Path, status
 from sqlalchemy import and_, not_, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.cache import LANGUAGE, cache_get, cache_set, make_key
 from src.dependencies import get_db
 from src.endpoints.language.router_init import router
 from src.exceptions import custom_exception
@@ -14,7 +15,8 @@ from src.responses import custom_response
 @router.get("/{language_id}", response_model=None, status_code=status.HTTP_200_OK)
 async def get_language_by_id(
     language_id: int = Path(gt=-1),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
+    if_none_match: str | None = Header(None),
 ) -> dict:
     """
     This function will be used to get a language by id.
@@ -22,15 +24,22 @@ async def get_language_by_id(
         language_id: The id of the language.
         user: The user data. (current libarian)
         db: The database session.
+        if_none_match: The ETag of the copy the client already has.
     Returns:
         dict: A dictionary with the status code and message and data.
     """
+    cache_key = make_key(language_id=language_id)
+    cached, version = await cache_get(LANGUAGE, cache_key, if_none_match)
+    if cached is not None:
+        return cached
     logging.info("Getting language by id = " + str(language_id) + " from database")
-    language = db.scalars(
-        select(all_models.Language).where(
-            and_(
-                all_models.Language.id == language_id,
-                not_(all_models.Language.is_deleted),
+    language = (
+        await db.scalars(
+            select(all_models.Language).where(
+                and_(
+                    all_models.Language.id == language_id,
+                    not_(all_models.Language.is_deleted),
+                )
             )
         )
     ).first()
@@ -40,6 +49,12 @@ async def get_language_by_id(
             status_code=status.HTTP_404_NOT_FOUND, details="Language not found."
         )
     logging.info("Language found in database and returned")
-    return custom_response(
-        status_code=status.HTTP_200_OK, details="Language found", data=language
+    return await cache_set(
+        LANGUAGE,
+        cache_key,
+        version,
+        custom_response(
+            status_code=status.HTTP_200_OK, details="Language found", data=language
+        ),
+        if_none_match,
     )
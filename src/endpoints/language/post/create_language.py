@@ -1,8 +1,9 @@
 import logging
 
 from fastapi import Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.cache import LANGUAGE, invalidate
 from src.dependencies import get_current_librarian, get_db
 from src.endpoints.language.router_init import router
 from src.exceptions import custom_exception
@@ -15,7 +16,7 @@ from src.schemas import language_schema
 async def create_language(
     language: language_schema.LanguageSchema,
     user: dict = Depends(get_current_librarian),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> dict:
     """
     This function will be used to create a new language.
@@ -30,8 +31,9 @@ async def create_language(
         new_language = all_models.Language()
         new_language.language = language.language
         db.add(new_language)
-        db.commit()
-        db.refresh(new_language)
+        await db.commit()
+        invalidate(LANGUAGE)
+        await db.refresh(new_language)
         logging.info("Created new language in database with name: " + language.language)
         language.language_id = new_language.id
         return custom_response(
@@ -2,8 +2,9 @@ import logging
 
 from fastapi import Depends, Path, status
 from sqlalchemy import and_, not_, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.cache import LANGUAGE, invalidate
 from src.dependencies import get_current_librarian, get_db
 from src.endpoints.language.router_init import router
 from src.exceptions import custom_exception
@@ -17,7 +18,7 @@ async def update_language_by_id(
     language: language_schema.LanguageSchema,
     language_id: int = Path(gt=-1),
     user: dict = Depends(get_current_librarian),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> dict:
     """
     This function will be used to update a language by id.
@@ -30,7 +31,7 @@ async def update_language_by_id(
         dict: A dictionary with the status code and message and data.
     """
     logging.info("Updating language in database with id: " + str(language_id))
-    found_language = db.scalar(
+    found_language = await db.scalar(
         select(all_models.Language).where(
             and_(
                 all_models.Language.id == language_id,
@@ -45,7 +46,8 @@ async def update_language_by_id(
         )
     try:
         found_language.language = language.language
-        db.commit()
+        await db.commit()
+        invalidate(LANGUAGE)
         logging.info("Updated language in database with id: " + str(language_id))
         language.language_id = language_id
         return custom_response(
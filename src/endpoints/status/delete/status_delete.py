@@ -2,13 +2,15 @@ import logging
 
 from fastapi import Depends, Path
 from sqlalchemy import and_, not_, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
+from src.cache import STATUS, invalidate
 from src.dependencies import get_current_librarian, get_db
 from src.endpoints.status.router_init import router
 from src.exceptions import custom_exception
 from src.models import all_models
+from src.status_registry import load_status_ids
 
 
 @router.delete(
@@ -16,7 +18,7 @@ from src.models import all_models
 )
 async def status_delete(
     status_id: int = Path(gt=-1),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     librarian=Depends(get_current_librarian),
 ) -> None:
     """ "
@@ -30,7 +32,7 @@ async def status_delete(
     Status code 204 NO_CONTENT
     """
     logging.info(f"Deleting status {status_id} -- {__name__}")
-    found_status = db.scalar(
+    found_status = await db.scalar(
         select(all_models.Status).where(
             and_(all_models.Status.id == status_id, not_(all_models.Status.is_deleted))
         )
@@ -42,7 +44,9 @@ async def status_delete(
         )
     try:
         found_status.is_deleted = True
-        db.commit()
+        await db.commit()
+        invalidate(STATUS)
+        await load_status_ids(db)
         logging.info("Deleted status")
     except Exception as e:
         logging.exception("Error deleting status. Details = " + str(e))
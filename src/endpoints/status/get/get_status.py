@@ -1,29 +1,75 @@
 import logging
+from typing import Annotated
 
-from fastapi import Depends
+from fastapi import Depends, Header, Query
 from sqlalchemy import not_, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
+from src.cache import STATUS, cache_get, cache_set, make_key
 from src.dependencies import get_db
 from src.endpoints.status.router_init import router
 from src.models import all_models
-from src.responses import custom_response
+from src.pagination import MAX_PAGE_SIZE, count_rows, paginate, split_page
+from src.responses import custom_response, paginated_response
 
 
 @router.get("/", status_code=status.HTTP_200_OK, response_model=None)
-async def get_status(db: Session = Depends(get_db)) -> dict:
+async def get_status(
+    db: AsyncSession = Depends(get_db),
+    if_none_match: str | None = Header(None),
+    page_number: Annotated[int, Query(gt=0)] = 1,  # Default value is 1
+    # Statuses are a small lookup list, so by default a single page holds them all.
+    page_size: Annotated[int, Query(gt=0, le=MAX_PAGE_SIZE)] = MAX_PAGE_SIZE,
+    after: str | None = None,  # Cursor of the previous page, overrides page_number
+    count_only: bool = False,  # Only return the number of statuses
+) -> dict:
     """
-    Get all statuses.
+    Get all statuses, one page at a time.
     Parameters:
         db: The database session.
+        if_none_match: The ETag of the copy the client already has.
+        page_number: The page to return when no cursor is given.
+        page_size: The number of statuses in a page.
+        after: The cursor of the previous page.
+        count_only: Only return the number of statuses.
     Returns:
         dict: A dict with the following keys status_code, details and data.
     """
-    statuses = db.scalars(
-        select(all_models.Status).where(not_(all_models.Status.is_deleted))
-    ).all()
+    cache_key = make_key(
+        page_number=page_number, page_size=page_size, after=after, count_only=count_only
+    )
+    cached, version = await cache_get(STATUS, cache_key, if_none_match)
+    if cached is not None:
+        return cached
+    query = select(all_models.Status).where(not_(all_models.Status.is_deleted))
+    if count_only:
+        logging.info("Counting all statuses")
+        return await cache_set(
+            STATUS,
+            cache_key,
+            version,
+            custom_response(
+                status_code=status.HTTP_200_OK,
+                details="Success",
+                data={"count": await count_rows(db, query)},
+            ),
+            if_none_match,
+        )
+    query = paginate(query, all_models.Status.id, page_number, page_size, after)
+    statuses, next_cursor = split_page(
+        (await db.scalars(query)).all(), page_size, all_models.Status.id
+    )
     logging.info("Fetching all statuses")
-    return custom_response(
-        status_code=status.HTTP_200_OK, details="Success", data=statuses
+    return await cache_set(
+        STATUS,
+        cache_key,
+        version,
+        paginated_response(
+            status_code=status.HTTP_200_OK,
+            details="Success",
+            data=statuses,
+            next_cursor=next_cursor,
+        ),
+        if_none_match,
     )
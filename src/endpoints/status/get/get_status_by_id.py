@@ -1,10 +1,11 @@
 import logging
 
-from fastapi import Depends, Path
+from fastapi import Depends, Header, Path
 from sqlalchemy import and_, not_, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
+from src.cache import STATUS, cache_get, cache_set, make_key
 from src.dependencies import get_db
 from src.endpoints.status.router_init import router
 from src.exceptions import custom_exception
@@ -14,20 +15,32 @@ from src.responses import custom_response
 
 @router.get("/{status_id}", status_code=status.HTTP_200_OK, response_model=None)
 async def get_status_by_id(
-    status_id: int = Path(gt=-1), db: Session = Depends(get_db)
+    status_id: int = Path(gt=-1),
+    db: AsyncSession = Depends(get_db),
+    if_none_match: str | None = Header(None),
 ) -> dict:
     """
     This function will be used to get a status by id.
     Parameters:
         status_id: The id of the status.
         db: The database session.
+        if_none_match: The ETag of the copy the client already has.
     Returns:
         dict: A dictionary with the status code and message and data.
     """
+    cache_key = make_key(status_id=status_id)
+    cached, version = await cache_get(STATUS, cache_key, if_none_match)
+    if cached is not None:
+        return cached
     logging.info("Fetching status by id" + str(status_id))
-    found_status = db.scalars(
-        select(all_models.Status).where(
-            and_(all_models.Status.id == status_id, not_(all_models.Status.is_deleted))
+    found_status = (
+        await db.scalars(
+            select(all_models.Status).where(
+                and_(
+                    all_models.Status.id == status_id,
+                    not_(all_models.Status.is_deleted),
+                )
+            )
         )
     ).first()
     if not found_status:
@@ -35,6 +48,12 @@ async def get_status_by_id(
             status_code=status.HTTP_404_NOT_FOUND, details="Status not found"
         )
     logging.info("Status found")
-    return custom_response(
-        status_code=status.HTTP_200_OK, details="Status found", data=found_status
+    return await cache_set(
+        STATUS,
+        cache_key,
+        version,
+        custom_response(
+            status_code=status.HTTP_200_OK, details="Status found", data=found_status
+        ),
+        if_none_match,
     )
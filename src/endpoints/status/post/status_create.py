@@ -1,21 +1,23 @@
 import logging
 
 from fastapi import Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
+from src.cache import STATUS, invalidate
 from src.dependencies import get_current_librarian, get_db
 from src.endpoints.status.router_init import router
 from src.exceptions import custom_exception
 from src.models.status import Status
 from src.responses import custom_response
 from src.schemas.status import StatusSchema
+from src.status_registry import load_status_ids
 
 
 @router.post("/", status_code=status.HTTP_201_CREATED, response_model=None)
 async def status_create(
     status_req: StatusSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     librarian=Depends(get_current_librarian),
 ) -> dict:
     """
@@ -33,12 +35,14 @@ async def status_create(
     status_model.status = status_req.status
     try:
         db.add(status_model)
-        db.commit()
-        db.refresh(status_model)
+        await db.commit()
+        invalidate(STATUS)
+        await load_status_ids(db)
+        await db.refresh(status_model)
         status_req.status_id = status_model.id
         logging.info(f"Created status {status_req.status} -- {__name__}")
         return custom_response(
-            status_code=status.HTTP_200_OK, details="Success", data=status_req
+            status_code=status.HTTP_201_CREATED, details="Success", data=status_req
         )
     except Exception as e:
         logging.error(f"{e} -- {__name__}")
@@ -2,22 +2,24 @@ import logging
 
 from fastapi import Depends, Path
 from sqlalchemy import and_, not_, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
+from src.cache import STATUS, invalidate
 from src.dependencies import get_current_librarian, get_db
 from src.endpoints.status.router_init import router
 from src.exceptions import custom_exception
 from src.models import all_models
 from src.responses import custom_response
 from src.schemas.status import StatusSchema
+from src.status_registry import load_status_ids
 
 
 @router.put("/{status_id}", status_code=status.HTTP_200_OK, response_model=None)
 async def update_status_by_id(
     status_req: StatusSchema,
     status_id: int = Path(gt=-1),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     librarian=Depends(get_current_librarian),
 ) -> dict:
     """
@@ -31,7 +33,7 @@ async def update_status_by_id(
         dict: A dictionary with the status code and message and data.
     """
     logging.info("Updating status by id" + str(status_id))
-    found_status = db.scalar(
+    found_status = await db.scalar(
         select(all_models.Status).where(
             and_(all_models.Status.id == status_id, not_(all_models.Status.is_deleted))
         )
@@ -43,7 +45,9 @@ async def update_status_by_id(
         )
     try:
         found_status.status = status_req.status
-        db.commit()
+        await db.commit()
+        invalidate(STATUS)
+        await load_status_ids(db)
         status_req.status_id = status_id
         logging.info("Status found")
         return custom_response(
@@ -2,14 +2,16 @@ import logging
 from typing import Annotated, List
 
 from fastapi import Depends, Query
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
 from src.dependencies import get_current_librarian, get_db
 from src.endpoints.user.router_init import router
 from src.exceptions import custom_exception
 from src.models.user import User
-from src.responses import custom_response
+from src.pagination import MAX_PAGE_SIZE, paginate, split_page
+from src.responses import paginated_response
 
 
 @router.get("", status_code=status.HTTP_200_OK, response_model=None)
@@ -21,9 +23,12 @@ async def filter_user(
     contact_number: str | None = None,
     address: str | None = None,
     page_number: Annotated[int, Query(gt=0)] = 1,  # Default value is 1
-    page_size: Annotated[int, Query(gt=0)] = 10,  # Default value is 10
+    page_size: Annotated[
+        int, Query(gt=0, le=MAX_PAGE_SIZE)
+    ] = 10,  # Default value is 10
+    after: str | None = None,  # Cursor of the previous page, overrides page_number
     librarian: dict = Depends(get_current_librarian),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> dict:
     """
     Filters the users list based on param provided. If None given then it will
@@ -40,17 +45,18 @@ async def filter_user(
     filters = {key: value for key, value in params.items() if value}
     # Adding a condition that only allow non deleted users.
     filters["is_deleted"] = False
+    query = paginate(
+        select(User).filter_by(**filters), User.id, page_number, page_size, after
+    )
     try:
-        starting_index = (page_number - 1) * page_size
-        users = (
-            db.query(User)
-            .filter_by(**filters)
-            .offset(starting_index)
-            .limit(page_size)
-            .all()
+        users, next_cursor = split_page(
+            (await db.scalars(query)).all(), page_size, User.id
         )
-        return custom_response(
-            status_code=status.HTTP_200_OK, details="Users found", data=users
+        return paginated_response(
+            status_code=status.HTTP_200_OK,
+            details="Users found",
+            data=users,
+            next_cursor=next_cursor,
         )
     except Exception as e:
         logging.exception(f"Exception occured -- {__name__}.filter_user")
@@ -2,7 +2,7 @@ import logging
 
 from fastapi import Depends, Path
 from sqlalchemy import and_, not_, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
 from src.dependencies import get_current_librarian, get_db
@@ -15,7 +15,7 @@ from src.responses import custom_response
 @router.get("/{user_id}", status_code=status.HTTP_200_OK, response_model=None)
 async def get_user_by_id(
     librarian: dict = Depends(get_current_librarian),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user_id: int = Path(gt=0),
 ) -> dict:
     """
@@ -31,12 +31,10 @@ async def get_user_by_id(
     """
     try:
         user = (
-            db.execute(
+            await db.scalars(
                 select(User).where(and_(User.id == user_id, not_(User.is_deleted)))
             )
-            .scalars()
-            .first()
-        )
+        ).first()
     except Exception as e:
         logging.exception(f"Exception occured -- {__name__}.get_user_by_id")
         raise custom_exception(
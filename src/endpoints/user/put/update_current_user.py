@@ -2,10 +2,11 @@ import logging
 
 from fastapi import Depends, HTTPException, Path
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 from starlette import status
 
-from src.dependencies import get_current_user, get_db, verify_password
+from src.dependencies import async_verify_password, get_current_user, get_db
 from src.endpoints.user.router_init import router
 from src.endpoints.user.user_utils import update_user
 from src.exceptions import custom_exception
@@ -17,7 +18,7 @@ from src.schemas.update_user import UpdateUserSchema
 async def update_current_user(
     new_user: UpdateUserSchema,
     user: dict = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> dict:
     """
     Updates the current logged in user.\n
@@ -29,13 +30,19 @@ async def update_current_user(
     dict : A dict with status code, details and data
     """
     try:
-        current_user = db.scalar(select(User).where(User.id == user.get("id")))
-        if not verify_password(new_user.old_password, current_user.password):
+        current_user = await db.scalar(
+            select(User)
+            .where(User.id == user.get("id"))
+            .options(undefer(User.password))
+        )
+        if not await async_verify_password(
+            new_user.old_password, current_user.password
+        ):
             raise custom_exception(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 details="Old password not matched.",
             )
-        return update_user(new_user, user.get("id"), db)
+        return await update_user(new_user, user.get("id"), db)
     except HTTPException:
         raise custom_exception(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -2,7 +2,8 @@ import logging
 
 from fastapi import Depends, HTTPException, Path
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 from starlette import status
 
 from src.endpoints.user.router_init import router
@@ -12,10 +13,10 @@ from src.models.user import User
 from src.schemas.update_user import UpdateUserSchema
 
 from src.dependencies import (  # isort: skip
+    async_verify_password,  # isort: skip
     get_current_librarian,  # isort: skip
     get_current_user,  # isort: skip
     get_db,  # isort: skip
-    verify_password,  # isort: skip
 )  # isort: skip
 
 
@@ -24,7 +25,7 @@ async def update_current_user_by_id(
     new_user: UpdateUserSchema,
     user_id: int = Path(gt=0),
     librarian: dict = Depends(get_current_librarian),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> dict:
     """
     Updates the user whose id is given\n
@@ -37,13 +38,17 @@ async def update_current_user_by_id(
     dict : A dict with status code, details and data
     """
     try:
-        current_lib = db.scalar(select(User).where(User.id == librarian.get("id")))
-        if not verify_password(new_user.old_password, current_lib.password):
+        current_lib = await db.scalar(
+            select(User)
+            .where(User.id == librarian.get("id"))
+            .options(undefer(User.password))
+        )
+        if not await async_verify_password(new_user.old_password, current_lib.password):
             raise custom_exception(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 details="Old password not matched.",
             )
-        return update_user(new_user, user_id, db)
+        return await update_user(new_user, user_id, db)
     except HTTPException as e:
         if e.status_code == status.HTTP_401_UNAUTHORIZED:
             raise custom_exception(
@@ -1,10 +1,10 @@
 import logging
 
 from sqlalchemy import and_, not_, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
-from src.dependencies import get_password_hash
+from src.dependencies import async_get_password_hash
 from src.exceptions import custom_exception
 from src.models.user import User
 from src.responses import custom_response
@@ -12,7 +12,9 @@ from src.schemas.update_user import UpdateUserSchema
 from src.schemas.user import UserSchemaOut
 
 
-def update_user(new_user: UpdateUserSchema, user_id: int, db: Session) -> dict:
+async def update_user(
+    new_user: UpdateUserSchema, user_id: int, db: AsyncSession
+) -> dict:
     """
     Updates the db with new user data.\n
     Params
@@ -20,7 +22,7 @@ def update_user(new_user: UpdateUserSchema, user_id: int, db: Session) -> dict:
     new_user: New user data
     user_id: int id of the user to update the data of.
     """
-    current_user = db.scalar(
+    current_user = await db.scalar(
         select(User).where(and_(User.id == user_id, not_(User.is_deleted)))
     )
     if not current_user:
@@ -29,13 +31,13 @@ def update_user(new_user: UpdateUserSchema, user_id: int, db: Session) -> dict:
         )
     current_user.email = new_user.email
     current_user.username = new_user.username
-    current_user.password = get_password_hash(new_user.password)
+    current_user.password = await async_get_password_hash(new_user.password)
     current_user.first_name = new_user.first_name
     current_user.last_name = new_user.last_name
     current_user.contact_number = new_user.contact_number
     current_user.address = new_user.address
     logging.info(f"Updating user {user_id} -- {__name__}.udpate_current_user")
-    db.commit()
-    db.refresh(current_user)
+    await db.commit()
+    await db.refresh(current_user)
     new_user = UserSchemaOut(**current_user.__dict__)
     return custom_response(status_code=200, details="User updated", data=new_user)
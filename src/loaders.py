@@ -0,0 +1,57 @@
+from typing import List
+
+from sqlalchemy.orm import raiseload, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from src.models.book import Book
+from src.models.borrowed import Borrowed
+from src.models.copy import Copy
+
+# Loader profiles that endpoints pass to select(...).options(...).
+# Relationships are lazy by default, so an endpoint only pays for the part of
+# the object graph it returns. Everything outside a profile raises on access
+# instead of silently emitting a query per row.
+
+
+def book_options(shallow: bool = False) -> List[LoaderOption]:
+    """
+    Returns the loader options of a book with its authors, genres and language.
+    A shallow book only has its own columns.
+    """
+    if shallow:
+        return [raiseload("*")]
+    return [
+        selectinload(Book.authors),
+        selectinload(Book.genres),
+        selectinload(Book.language),
+        raiseload("*"),
+    ]
+
+
+def copy_options(shallow: bool = False) -> List[LoaderOption]:
+    """
+    Returns the loader options of a copy with its book (see book_options),
+    language and status. A shallow copy only has its own columns.
+    """
+    if shallow:
+        return [raiseload("*")]
+    return [
+        selectinload(Copy.book).options(*book_options()),
+        selectinload(Copy.language),
+        selectinload(Copy.status),
+        raiseload("*"),
+    ]
+
+
+def borrowed_options(shallow: bool = False) -> List[LoaderOption]:
+    """
+    Returns the loader options of a borrowed with its user and copy
+    (see copy_options). A shallow borrowed only has its own columns.
+    """
+    if shallow:
+        return [raiseload("*")]
+    return [
+        selectinload(Borrowed.user),
+        selectinload(Borrowed.copy).options(*copy_options()),
+        raiseload("*"),
+    ]
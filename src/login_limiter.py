@@ -0,0 +1,121 @@
+import logging
+import os
+import secrets
+import time
+
+import redis
+from starlette import status
+
+from src.dependencies import async_redis_conn, redis_conn
+from src.exceptions import custom_exception
+from src.metrics import Counter
+
+# Failed logins allowed per username and per client ip within a sliding window.
+# Further attempts get a 429 before the database or bcrypt are touched.
+LOGIN_WINDOW_SECONDS = int(os.getenv("LOGIN_WINDOW_SECONDS", 300))
+LOGIN_MAX_FAILURES_PER_USER = int(os.getenv("LOGIN_MAX_FAILURES_PER_USER", 5))
+LOGIN_MAX_FAILURES_PER_IP = int(os.getenv("LOGIN_MAX_FAILURES_PER_IP", 50))
+
+LOGIN_FAILURES = Counter()
+LOGIN_LIMITED_BY_USER = Counter()
+LOGIN_LIMITED_BY_IP = Counter()
+LOGIN_LIMITER_ERRORS = Counter()
+
+
+def _user_key(username: str) -> str:
+    return f"login_failures:user:{username}"
+
+
+def _ip_key(ip: str) -> str:
+    return f"login_failures:ip:{ip}"
+
+
+async def check_login_allowed(username: str, ip: str) -> None:
+    """
+    Raises an exception if the username or the ip have too many failed logins
+    in the current window. Redis errors let the login through.
+    """
+    now = time.time()
+    keys = (_user_key(username), _ip_key(ip))
+    try:
+        pipe = async_redis_conn.pipeline(transaction=False)
+        for key in keys:
+            pipe.zremrangebyscore(key, 0, now - LOGIN_WINDOW_SECONDS)
+            pipe.zcard(key)
+            pipe.zrange(key, 0, 0, withscores=True)
+        _, user_failures, user_oldest, _, ip_failures, ip_oldest = await pipe.execute()
+    except redis.RedisError as e:
+        LOGIN_LIMITER_ERRORS.inc()
+        logging.warning(f"Login limiter check failed: {e} -- {__name__}")
+        return
+    if user_failures >= LOGIN_MAX_FAILURES_PER_USER:
+        LOGIN_LIMITED_BY_USER.inc()
+        oldest = user_oldest
+    elif ip_failures >= LOGIN_MAX_FAILURES_PER_IP:
+        LOGIN_LIMITED_BY_IP.inc()
+        oldest = ip_oldest
+    else:
+        return
+    retry_after = LOGIN_WINDOW_SECONDS
+    if oldest:
+        retry_after = max(1, int(oldest[0][1] + LOGIN_WINDOW_SECONDS - now) + 1)
+    logging.info(f"Login of {username} from {ip} rate limited -- {__name__}")
+    raise custom_exception(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        details="Too many failed login attempts, try again later",
+        headers={"Retry-After": str(retry_after)},
+    )
+
+
+async def record_login_failure(username: str, ip: str) -> None:
+    """
+    Adds a failed login of the username from the ip to their windows.
+    """
+    LOGIN_FAILURES.inc()
+    now = time.time()
+    # Members must be unique, two failures can happen at the same time.
+    member = f"{now}:{secrets.token_hex(4)}"
+    try:
+        pipe = async_redis_conn.pipeline(transaction=False)
+        for key in (_user_key(username), _ip_key(ip)):
+            pipe.zadd(key, {member: now})
+            pipe.expire(key, LOGIN_WINDOW_SECONDS)
+        await pipe.execute()
+    except redis.RedisError as e:
+        LOGIN_LIMITER_ERRORS.inc()
+        logging.warning(f"Login limiter update failed: {e} -- {__name__}")
+
+
+async def clear_login_failures(username: str) -> None:
+    """
+    Forgets the failed logins of the username after it logs in successfully.
+    """
+    try:
+        await async_redis_conn.delete(_user_key(username))
+    except redis.RedisError as e:
+        LOGIN_LIMITER_ERRORS.inc()
+        logging.warning(f"Login limiter reset failed: {e} -- {__name__}")
+
+
+def reset_login_limits() -> None:
+    """
+    Forgets the failed logins of every username and ip.
+    """
+    keys = list(redis_conn.scan_iter("login_failures:*"))
+    if keys:
+        redis_conn.delete(*keys)
+
+
+def get_login_limiter_stats() -> dict:
+    """
+    Returns the limits and the failed and rejected login counts of this worker.
+    """
+    return {
+        "window_seconds": LOGIN_WINDOW_SECONDS,
+        "max_failures_per_user": LOGIN_MAX_FAILURES_PER_USER,
+        "max_failures_per_ip": LOGIN_MAX_FAILURES_PER_IP,
+        "failures": LOGIN_FAILURES.value,
+        "limited_by_user": LOGIN_LIMITED_BY_USER.value,
+        "limited_by_ip": LOGIN_LIMITED_BY_IP.value,
+        "errors": LOGIN_LIMITER_ERRORS.value,
+    }
@@ -1,9 +1,9 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.models.database import Base
+from src.models.database import Base, active_index
 
 
 class Book(Base):
@@ -17,12 +17,19 @@ class Book(Base):
         isbn (str): The ISBN number of the book.
         description (str): A description of the book.
         language_id (int): The ID of the language the book is written in.
+        total_copies (int): The number of copies of the book.
+        available_copies (int): The number of its available copies.
+        borrowed_copies (int): The number of its borrowed copies.
+        reserved_copies (int): The number of its reserved copies.
+        maintenance_copies (int): The number of its copies in maintenance.
         created_at (datetime): The date and time the book was created.
         updated_at (datetime): The date and time the book was last updated.
     """
 
     __tablename__ = "book"
 
+    __table_args__ = (active_index("ix_book_language_id", "language_id", "id"),)
+
     id: Mapped[int] = mapped_column(primary_key=True)
     title: Mapped[str] = mapped_column(String(), nullable=False)
     date_of_publication: Mapped[datetime] = mapped_column(
@@ -31,6 +38,24 @@ class Book(Base):
     isbn: Mapped[str] = mapped_column(String(), unique=True)
     description: Mapped[str] = mapped_column(String(200), nullable=False)
     language_id: Mapped[int] = mapped_column(ForeignKey("language.id"))
+    # Copy counters, kept up to date by src.book_counters along with the copies.
+    # Deferred, so that the cached book responses don't change on every checkout
+    # (see the /book/counters endpoint).
+    total_copies: Mapped[int] = mapped_column(
+        Integer(), default=0, server_default="0", nullable=False, deferred=True
+    )
+    available_copies: Mapped[int] = mapped_column(
+        Integer(), default=0, server_default="0", nullable=False, deferred=True
+    )
+    borrowed_copies: Mapped[int] = mapped_column(
+        Integer(), default=0, server_default="0", nullable=False, deferred=True
+    )
+    reserved_copies: Mapped[int] = mapped_column(
+        Integer(), default=0, server_default="0", nullable=False, deferred=True
+    )
+    maintenance_copies: Mapped[int] = mapped_column(
+        Integer(), default=0, server_default="0", nullable=False, deferred=True
+    )
     is_deleted: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
@@ -39,11 +64,7 @@ class Book(Base):
         DateTime(timezone=True), onupdate=func.now(), nullable=True
     )
 
-    authors = relationship(
-        "Author", secondary="book_author", back_populates="books", lazy=False
-    )
-    genres = relationship(
-        "Genre", secondary="book_genre", back_populates="books", lazy=False
-    )
+    authors = relationship("Author", secondary="book_author", back_populates="books")
+    genres = relationship("Genre", secondary="book_genre", back_populates="books")
     copies = relationship("Copy", back_populates="book")
-    language = relationship("Language", back_populates="books", lazy=False)
+    language = relationship("Language", back_populates="books")
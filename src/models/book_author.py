@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.models.database import Base
@@ -19,6 +19,9 @@ class BookAuthor(Base):
 
     __tablename__ = "book_author"
 
+    # The primary key (author_id, book_id) serves the lookups by author.
+    __table_args__ = (Index("ix_book_author_book_id", "book_id"),)
+
     author_id: Mapped[int] = mapped_column(ForeignKey("author.id"), primary_key=True)
     book_id: Mapped[int] = mapped_column(ForeignKey("book.id"), primary_key=True)
     is_deleted: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
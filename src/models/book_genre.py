@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.models.database import Base
@@ -20,6 +20,9 @@ class BookGenre(Base):
 
     __tablename__ = "book_genre"
 
+    # The primary key (book_id, genre_id) serves the lookups by book.
+    __table_args__ = (Index("ix_book_genre_genre_id", "genre_id", "book_id"),)
+
     book_id: Mapped[int] = mapped_column(ForeignKey("book.id"), primary_key=True)
     genre_id: Mapped[int] = mapped_column(ForeignKey("genre.id"), primary_key=True)
     is_deleted: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
@@ -1,9 +1,9 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.models.database import Base
+from src.models.database import Base, active_index
 
 
 class Borrowed(Base):
@@ -13,6 +13,12 @@ class Borrowed(Base):
     """
 
     __tablename__ = "borrowed"
+    # The history of a copy is joined without filtering is_deleted, so its index
+    # isn't partial.
+    __table_args__ = (
+        active_index("ix_borrowed_user_id", "user_id", "id"),
+        Index("ix_borrowed_copy_id", "copy_id"),
+    )
     id: Mapped[int] = mapped_column(Integer(), primary_key=True, index=True)
     copy_id: Mapped[int] = mapped_column(Integer(), ForeignKey("copy.id"))
     user_id: Mapped[int] = mapped_column(Integer(), ForeignKey("user.id"))
@@ -27,5 +33,5 @@ class Borrowed(Base):
         DateTime(timezone=True), onupdate=func.now(), nullable=True
     )
 
-    user = relationship("User", back_populates="borrowed", lazy=False)
-    copy = relationship("Copy", back_populates="borrowed", lazy=False)
+    user = relationship("User", back_populates="borrowed")
+    copy = relationship("Copy", back_populates="borrowed")
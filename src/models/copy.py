@@ -3,7 +3,7 @@ from datetime import datetime
 from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.models.database import Base
+from src.models.database import Base, active_index
 
 
 class Copy(Base):
@@ -21,6 +21,11 @@ class Copy(Base):
 
     __tablename__ = "copy"
 
+    __table_args__ = (
+        active_index("ix_copy_book_id", "book_id", "id"),
+        active_index("ix_copy_status_id", "status_id", "book_id"),
+    )
+
     id: Mapped[int] = mapped_column(primary_key=True)
     book_id: Mapped[int] = mapped_column(
         Integer(), ForeignKey("book.id"), nullable=False
@@ -39,7 +44,7 @@ class Copy(Base):
         DateTime(timezone=True), onupdate=func.now(), nullable=True
     )
 
-    book = relationship("Book", back_populates="copies", lazy=False)
-    language = relationship("Language", back_populates="copies", lazy=False)
+    book = relationship("Book", back_populates="copies")
+    language = relationship("Language", back_populates="copies")
     borrowed = relationship("Borrowed", back_populates="copy")
-    status = relationship("Status", back_populates="copy", lazy=False)
+    status = relationship("Status", back_populates="copy")
@@ -1,12 +1,179 @@
 import os
+import time
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy import Index, create_engine, event, exc, not_, text
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import (
+    ORMExecuteState,
+    Session,
+    declarative_base,
+    sessionmaker,
+    with_loader_criteria,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from src.metrics import Counter, Histogram
 
 SQLALCHEMY_DATABASE_URL = os.getenv("SQLALCHEMY_DATABASE_URL")
 
+# Connection pool settings, applied per worker process.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 5))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 10))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 30))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+
+# Async driver used for each backend when the endpoints talk to the database.
+ASYNC_DRIVERS = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
+
+# Seconds spent waiting for a connection to be handed out by the pool.
+POOL_WAIT_SECONDS = Histogram([0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30])
+POOL_TIMEOUTS = Counter()
+
+
+class MeteredQueuePool(AsyncAdaptedQueuePool):
+    """
+    Async queue pool that records how long every checkout waited for a connection.
+    """
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            POOL_TIMEOUTS.inc()
+            raise
+        finally:
+            POOL_WAIT_SECONDS.observe(time.perf_counter() - start)
+
+
+def active_index(name: str, *columns: str) -> Index:
+    """
+    Returns a partial index over the given columns of the rows that are not soft
+    deleted, usable by the queries filtering with not_(Model.is_deleted) as every
+    select of a SoftDeleteSession does.
+    """
+    return Index(
+        name,
+        *columns,
+        postgresql_where=text("NOT is_deleted"),
+        sqlite_where=text("is_deleted = 0"),
+    )
+
+
+def get_async_database_url(database_url: str) -> URL:
+    """
+    Returns the given database url with its driver replaced by the async driver
+    of the same backend (e.g postgresql+psycopg2 -> postgresql+asyncpg)
+    """
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    return url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}")
+
+
+def get_pool_options(database_url: str) -> dict:
+    """
+    Returns the pool keyword arguments for create_async_engine.
+    Sqlite keeps the pool chosen by its dialect since it does not accept sizing.
+    """
+    options = {"pool_recycle": DB_POOL_RECYCLE, "pool_pre_ping": DB_POOL_PRE_PING}
+    if make_url(database_url).get_backend_name() != "sqlite":
+        options.update(
+            poolclass=MeteredQueuePool,
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
+        )
+    return options
+
+
+def get_pool_stats() -> dict:
+    """
+    Returns the current state of the async engine connection pool along with
+    the checkout wait time histogram.
+    """
+    pool = async_engine.pool
+    stats = {
+        "pool_class": type(pool).__name__,
+        "status": pool.status(),
+        "timeouts": POOL_TIMEOUTS.value,
+        "wait_seconds": POOL_WAIT_SECONDS.snapshot(),
+    }
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+            max_overflow=DB_MAX_OVERFLOW,
+            timeout=pool.timeout(),
+        )
+    return stats
+
+
 engine = create_engine(SQLALCHEMY_DATABASE_URL)
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+async_engine = create_async_engine(
+    get_async_database_url(SQLALCHEMY_DATABASE_URL),
+    **get_pool_options(SQLALCHEMY_DATABASE_URL),
+)
 
 Base = declarative_base()
+
+# Execution option of the statements that must also see soft deleted rows,
+# e.g select(User).execution_options(include_deleted=True)
+INCLUDE_DELETED = "include_deleted"
+
+_soft_delete_criteria = None
+
+
+def get_soft_delete_criteria() -> list:
+    """
+    Returns the loader criteria hiding the soft deleted rows of every model
+    with an is_deleted column.
+    """
+    global _soft_delete_criteria
+    if _soft_delete_criteria is None:
+        _soft_delete_criteria = [
+            with_loader_criteria(
+                mapper.class_,
+                lambda cls: not_(cls.is_deleted),
+                include_aliases=True,
+            )
+            for mapper in Base.registry.mappers
+            if "is_deleted" in mapper.columns
+        ]
+    return _soft_delete_criteria
+
+
+class SoftDeleteSession(Session):
+    """
+    Session whose ORM selects only see the rows that are not soft deleted,
+    including the related rows they load, unless INCLUDE_DELETED is set.
+    """
+
+
+@event.listens_for(SoftDeleteSession, "do_orm_execute")
+def hide_soft_deleted(orm_execute_state: ORMExecuteState) -> None:
+    if (
+        orm_execute_state.is_select
+        # relationship and column loads inherit the criteria of their statement
+        and not orm_execute_state.is_column_load
+        and not orm_execute_state.is_relationship_load
+        and not orm_execute_state.execution_options.get(INCLUDE_DELETED, False)
+    ):
+        orm_execute_state.statement = orm_execute_state.statement.options(
+            *get_soft_delete_criteria()
+        )
+
+
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Objects are not expired on commit since lazy refreshes can't be awaited implicitly.
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    sync_session_class=SoftDeleteSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
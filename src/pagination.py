@@ -0,0 +1,132 @@
+import base64
+import binascii
+import json
+import os
+from typing import Any, Callable, Sequence, Tuple
+
+from sqlalchemy import ColumnElement, Select, and_, asc, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+from starlette import status
+
+from src.exceptions import custom_exception
+
+# Upper bound for page_size of every list endpoint, so that a single request
+# can't load a whole table into memory.
+MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", 100))
+
+
+def encode_cursor(value: Any) -> str:
+    """
+    Returns an opaque cursor for the given key value of the last row of a page.
+    """
+    raw = json.dumps({"k": value}).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def is_int_key(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def is_ranked_key(value: Any) -> bool:
+    return (
+        isinstance(value, list)
+        and len(value) == 2
+        and (is_int_key(value[0]) or isinstance(value[0], float))
+        and is_int_key(value[1])
+    )
+
+
+def decode_cursor(cursor: str, is_valid: Callable[[Any], bool] = is_int_key) -> Any:
+    """
+    Returns the key value stored in the given cursor (an int id by default).
+    Raises an exception if the cursor is malformed or its key isn't valid.
+    """
+    try:
+        value = json.loads(base64.urlsafe_b64decode(cursor.encode()))["k"]
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        value = None
+    if value is None or not is_valid(value):
+        raise custom_exception(
+            status_code=status.HTTP_400_BAD_REQUEST, details="Invalid cursor"
+        )
+    return value
+
+
+def paginate(
+    query: Select,
+    key: InstrumentedAttribute,
+    page_number: int,
+    page_size: int,
+    after: str | None = None,
+) -> Select:
+    """
+    Orders the query by the given (indexed, unique) key and limits it to one page.
+    When a cursor is given the page starts right after the key stored in it
+    (keyset pagination), otherwise page_number is used as an offset.
+    One extra row is fetched so that split_page can tell if a next page exists.
+    """
+    query = query.order_by(asc(key))
+    if after is not None:
+        query = query.where(key > decode_cursor(after))
+    else:
+        query = query.offset((page_number - 1) * page_size)
+    return query.limit(page_size + 1)
+
+
+def split_page(
+    rows: Sequence, page_size: int, key: InstrumentedAttribute
+) -> Tuple[list, str | None]:
+    """
+    Returns the rows of the page fetched by paginate and the cursor of the next
+    page (None if this is the last page).
+    """
+    rows = list(rows)
+    if len(rows) <= page_size:
+        return rows, None
+    rows = rows[:page_size]
+    return rows, encode_cursor(getattr(rows[-1], key.key))
+
+
+def paginate_ranked(
+    query: Select,
+    rank: ColumnElement,
+    key: InstrumentedAttribute,
+    page_size: int,
+    after: str | None = None,
+) -> Select:
+    """
+    Orders the query by rank (best first), then by the unique key, and limits it
+    to one page. The page starts right after the rank and key stored in the cursor.
+    One extra row is fetched so that split_ranked_page can tell if a next page exists.
+    """
+    query = query.order_by(rank.desc(), asc(key))
+    if after is not None:
+        last_rank, last_key = decode_cursor(after, is_ranked_key)
+        query = query.where(
+            or_(rank < last_rank, and_(rank == last_rank, key > last_key))
+        )
+    return query.limit(page_size + 1)
+
+
+def split_ranked_page(
+    rows: Sequence, page_size: int, key: InstrumentedAttribute
+) -> Tuple[list, str | None]:
+    """
+    Returns the objects of the (object, rank) rows fetched by paginate_ranked and
+    the cursor of the next page (None if this is the last page).
+    """
+    rows = list(rows)
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        last, last_rank = rows[-1]
+        next_cursor = encode_cursor([last_rank, getattr(last, key.key)])
+    return [row[0] for row in rows], next_cursor
+
+
+async def count_rows(db: AsyncSession, query: Select) -> int:
+    """
+    Returns the number of rows the given (unpaginated) query would return.
+    """
+    return await db.scalar(select(func.count()).select_from(query.subquery()))
@@ -0,0 +1,76 @@
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from starlette import status
+
+from src.exceptions import custom_exception
+from src.metrics import Counter, Gauge, Histogram
+
+# bcrypt releases the GIL, so a few threads are enough to keep it off the
+# event loop. Requests beyond PASSWORD_HASH_MAX_PENDING are rejected instead of
+# queueing up behind a burst of logins.
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", 2))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", 64))
+
+password_pool = ThreadPoolExecutor(
+    max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash"
+)
+
+# Hashes submitted and not finished yet (running + queued).
+PASSWORD_HASH_PENDING = Gauge()
+PASSWORD_HASH_REJECTED = Counter()
+PASSWORD_HASH_QUEUE_SECONDS = Histogram([0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2, 5])
+PASSWORD_HASH_RUN_SECONDS = Histogram([0.01, 0.05, 0.1, 0.25, 0.5, 1, 2, 5])
+
+
+async def run_in_password_pool(func: Callable[..., Any], *args: Any) -> Any:
+    """
+    Runs the given hashing function in the password pool and awaits its result.
+    Raises an exception if too many hashes are already pending.
+    """
+    if PASSWORD_HASH_PENDING.value >= PASSWORD_HASH_MAX_PENDING:
+        PASSWORD_HASH_REJECTED.inc()
+        raise custom_exception(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            details="Server is busy, try again later",
+            headers={"Retry-After": "1"},
+        )
+    submitted_at = time.perf_counter()
+
+    def timed() -> Any:
+        started_at = time.perf_counter()
+        PASSWORD_HASH_QUEUE_SECONDS.observe(started_at - submitted_at)
+        try:
+            return func(*args)
+        finally:
+            PASSWORD_HASH_RUN_SECONDS.observe(time.perf_counter() - started_at)
+
+    PASSWORD_HASH_PENDING.inc()
+    try:
+        future = password_pool.submit(timed)
+    except BaseException:
+        PASSWORD_HASH_PENDING.dec()
+        raise
+    # A cancelled request doesn't stop a running hash, so it is pending until
+    # the pool is done with it.
+    future.add_done_callback(lambda _: PASSWORD_HASH_PENDING.dec())
+    return await asyncio.wrap_future(future)
+
+
+def get_password_pool_stats() -> dict:
+    """
+    Returns the size, queue depth and timings of the password pool.
+    """
+    pending = PASSWORD_HASH_PENDING.value
+    return {
+        "workers": PASSWORD_HASH_WORKERS,
+        "max_pending": PASSWORD_HASH_MAX_PENDING,
+        "pending": pending,
+        "queued": max(pending - PASSWORD_HASH_WORKERS, 0),
+        "rejected": PASSWORD_HASH_REJECTED.value,
+        "queue_seconds": PASSWORD_HASH_QUEUE_SECONDS.snapshot(),
+        "run_seconds": PASSWORD_HASH_RUN_SECONDS.snapshot(),
+    }
@@ -1,7 +1,50 @@
+from typing import Any
+
+import orjson
 from fastapi import status
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+from src.models.database import Base
 
 
-def custom_response(status_code: status, details: str, data: object = None) -> dict:
+def encode_default(obj: Any) -> Any:
+    """
+    Encodes the objects orjson doesn't know about.
+    ORM rows are encoded from their loaded columns and relationships only (like
+    jsonable_encoder did), nested rows are handed back to orjson.
+    """
+    if isinstance(obj, Base):
+        return {
+            name: value
+            for name, value in obj.__dict__.items()
+            if not name.startswith("_")
+        }
+    if isinstance(obj, BaseModel):
+        return obj.dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Returns the given content serialized to JSON.
+    """
+    return orjson.dumps(content, default=encode_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class EnvelopeResponse(ORJSONResponse):
+    """
+    JSON response rendered by orjson, including ORM rows and pydantic models,
+    so that the endpoints skip the jsonable_encoder pass of FastAPI.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def custom_response(
+    status_code: status, details: str, data: object = None
+) -> EnvelopeResponse:
     """
     Returns a custom response with the given status code, details and data
     Parameters
@@ -11,6 +54,35 @@ def custom_response(status_code: status, details: str, data: object = None) -> d
     data : The data of the response
     Returns
     -------
-    dict : The custom response
+    EnvelopeResponse : The custom response
+    """
+    return EnvelopeResponse(
+        status_code=status_code,
+        content={"status_code": status_code, "details": details, "data": data},
+    )
+
+
+def paginated_response(
+    status_code: status, details: str, data: list, next_cursor: str | None
+) -> EnvelopeResponse:
+    """
+    Returns a custom response for a page of a list endpoint
+    Parameters
+    ----------
+    status_code : The status code of the response
+    details : The details of the response
+    data : The rows of the page
+    next_cursor : The cursor of the next page, None for the last page
+    Returns
+    -------
+    EnvelopeResponse : The custom response with the next_cursor
     """
-    return {"status_code": status_code, "details": details, "data": data}
+    return EnvelopeResponse(
+        status_code=status_code,
+        content={
+            "status_code": status_code,
+            "details": details,
+            "data": data,
+            "next_cursor": next_cursor,
+        },
+    )
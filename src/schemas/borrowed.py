@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, Field, validator
 
@@ -45,3 +45,59 @@ class BorrowedSchema(BaseModel):
                 "return_date": None,
             }
         }
+
+
+# Upper bound of the items of a single bulk checkout or return.
+MAX_BULK_ITEMS = 100
+
+
+class BulkCheckoutSchema(BaseModel):
+    """
+    The Pydantic Schema model for checking out many copies to one user
+    """
+
+    user_id: int = Field(title="The ID of the user who is borrowing")
+    copy_ids: List[int] = Field(
+        title="The IDs of the copies to be borrowed",
+        min_items=1,
+        max_items=MAX_BULK_ITEMS,
+    )
+    issue_date: datetime = Field(title="Date on which books were issued")
+    due_date: datetime = Field(title="Date on which books return is due")
+
+    @validator("due_date")
+    def due_date_greater_than_issue_date(cls, v, values, **kwargs):
+        if "issue_date" in values and values["issue_date"].date() >= v.date():
+            raise ValueError("Due Date must be greater than Issue Date")
+        return v
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "user_id": 7,
+                "copy_ids": [3, 4, 5],
+                "issue_date": datetime(2023, 4, 26),
+                "due_date": datetime(2023, 4, 30),
+            }
+        }
+
+
+class BulkReturnSchema(BaseModel):
+    """
+    The Pydantic Schema model for returning many borrowed at once
+    """
+
+    borrowed_ids: List[int] = Field(
+        title="The IDs of the borrowed to be returned",
+        min_items=1,
+        max_items=MAX_BULK_ITEMS,
+    )
+    return_date: datetime = Field(title="Date on which books are returned")
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "borrowed_ids": [1, 2, 3],
+                "return_date": datetime(2023, 4, 30),
+            }
+        }
@@ -77,3 +77,16 @@ class UserSchemaToken(UserSchemaOut):
 
     access_token: str
     refresh_token: str
+
+
+class UserSchemaRefresh(BaseModel):
+
+    """
+    A Pydantic user schema that will be used to return a refreshed token along with the claims it was minted from
+    """
+
+    id: int
+    username: str
+    is_librarian: bool
+    access_token: str
+    refresh_token: str
@@ -0,0 +1,66 @@
+import logging
+import os
+import time
+from typing import Dict
+
+from sqlalchemy import not_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.status import Status
+
+# Seconds after which the registry is reloaded, so that status changes made by
+# other workers are picked up.
+STATUS_REGISTRY_TTL = float(os.getenv("STATUS_REGISTRY_TTL", 60))
+
+# Process local mapping of the status names (see src/status_constants) to ids.
+_status_ids: Dict[str, int] = {}
+_loaded_at: float | None = None
+
+
+async def load_status_ids(db: AsyncSession) -> None:
+    """
+    (Re)loads the names and ids of all the statuses that are not deleted.
+    """
+    global _status_ids, _loaded_at
+    rows = await db.execute(
+        select(Status.status, Status.id).where(not_(Status.is_deleted))
+    )
+    _status_ids = {name: status_id for name, status_id in rows}
+    _loaded_at = time.monotonic()
+    logging.info(f"Loaded {len(_status_ids)} statuses -- {__name__}")
+
+
+def reset_status_ids() -> None:
+    """
+    Forgets the loaded statuses, they are loaded again on the next lookup.
+    """
+    global _status_ids, _loaded_at
+    _status_ids = {}
+    _loaded_at = None
+
+
+def _is_stale() -> bool:
+    return _loaded_at is None or time.monotonic() - _loaded_at > STATUS_REGISTRY_TTL
+
+
+async def get_status_id(db: AsyncSession, name: str) -> int | None:
+    """
+    Returns the id of the status with the given name, None if it doesn't exist.
+    The registry is reloaded once when it is stale or doesn't know the name.
+    """
+    if _is_stale() or name not in _status_ids:
+        await load_status_ids(db)
+    return _status_ids.get(name)
+
+
+async def get_status_name(db: AsyncSession, status_id: int) -> str | None:
+    """
+    Returns the name of the status with the given id, None if it doesn't exist.
+    The registry is reloaded once when it is stale or doesn't know the id.
+    """
+    if _is_stale() or status_id not in _status_ids.values():
+        await load_status_ids(db)
+    for name, known_id in _status_ids.items():
+        if known_id == status_id:
+            return name
+    return None
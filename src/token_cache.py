@@ -0,0 +1,105 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Set
+
+
+class TokenCache:
+    """
+    A bounded, thread safe LRU of the claims of verified tokens.
+    Entries are keyed by the sha256 of the token (tokens themselves are not
+    kept in memory) and expire at the token's exp or after max_age seconds,
+    whichever comes first.
+    Every eviction bumps the generation, so that claims verified while an
+    eviction happened aren't cached (see put).
+    """
+
+    def __init__(self, max_size: int, max_age: float) -> None:
+        self.max_size = max_size
+        self.max_age = max_age
+        self._entries: OrderedDict[str, tuple] = OrderedDict()
+        self._keys_by_user: Dict[int, Set[str]] = {}
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """
+        Returns the number of evictions so far, to be captured before verifying
+        a token and passed to put.
+        """
+        return self._generation
+
+    @staticmethod
+    def key(token: str) -> str:
+        """
+        Returns the key of the token, safe to share (e.g over pub/sub).
+        """
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> dict | None:
+        """
+        Returns the cached claims of the token, None if missing or expired.
+        """
+        key = self.key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            claims, expires_at = entry
+            if expires_at <= time.time():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return claims
+
+    def put(
+        self, token: str, claims: dict, exp: float, generation: int | None = None
+    ) -> None:
+        """
+        Caches the claims of a verified token until its exp.
+        Nothing is cached if an eviction happened since the given generation,
+        as the token may have been blacklisted after it was checked.
+        """
+        key = self.key(token)
+        expires_at = min(exp, time.time() + self.max_age)
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._remove(key)
+            self._entries[key] = (claims, expires_at)
+            self._keys_by_user.setdefault(claims["id"], set()).add(key)
+            while len(self._entries) > self.max_size:
+                self._remove(next(iter(self._entries)))
+
+    def evict_key(self, key: str) -> None:
+        with self._lock:
+            self._generation += 1
+            self._remove(key)
+
+    def evict_user(self, user_id: int) -> None:
+        with self._lock:
+            self._generation += 1
+            for key in list(self._keys_by_user.get(user_id, ())):
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._keys_by_user.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        user_id = entry[0]["id"]
+        keys = self._keys_by_user.get(user_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[user_id]
@@ -1,13 +1,16 @@
 import os
-from typing import Generator
+from typing import AsyncGenerator
 
 from dotenv import load_dotenv
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 
 from main import app
 from src.dependencies import get_db
+from src.models.database import SoftDeleteSession, get_async_database_url
 
 load_dotenv()
 
@@ -16,13 +19,23 @@ TestingSessionLocal = sessionmaker(
     autocommit=False, autoflush=False, bind=engine, expire_on_commit=False
 )
 
+# The test client may run each request on its own event loop, so connections
+# are never pooled between requests.
+async_engine = create_async_engine(
+    get_async_database_url(os.getenv("SQLALCHEMY_DATABASE_URL_TEST")),
+    poolclass=NullPool,
+)
+TestingAsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    sync_session_class=SoftDeleteSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 
-def override_get_db() -> Generator[Session, None, None]:
-    try:
-        db = TestingSessionLocal()
+async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
+    async with TestingAsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
 app.dependency_overrides[get_db] = override_get_db
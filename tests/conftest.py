@@ -3,8 +3,22 @@ from typing import Generator
 import pytest
 from sqlalchemy.orm import sessionmaker
 
+from src.cache import NAMESPACES, invalidate
+from src.login_limiter import reset_login_limits
 from src.models.all_models import Base
-from tests.client import TestingSessionLocal, engine
+from src.status_registry import reset_status_ids
+from tests.client import TestingSessionLocal, client, engine
+
+
+@pytest.fixture(scope="session", autouse=True)
+def app_lifespan() -> Generator[None, None, None]:
+    """
+    Runs the startup and shutdown events of the app around the whole session.
+    Requests then share one event loop, which the async redis connections are
+    bound to.
+    """
+    with client:
+        yield
 
 
 @pytest.fixture()
@@ -13,5 +27,9 @@ def test_db() -> Generator[sessionmaker, None, None]:
     A fixture function that is to be injected as a dependency in all tests. It creates tables for all models in the test database and yields a test database session maker. After the tests conclude it cleans up the test database
     """
     Base.metadata.create_all(bind=engine)
+    # Cached responses of a previous test refer to rows that no longer exist.
+    invalidate(*NAMESPACES)
+    reset_status_ids()
+    reset_login_limits()
     yield TestingSessionLocal
     Base.metadata.drop_all(bind=engine)
@@ -0,0 +1,115 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+from starlette import status
+
+import src.password_pool
+from src.metrics import Histogram
+from tests.client import client
+from tests.utils import SUPER_USER_CRED, TEST_USER_CRED, check_no_auth, get_fresh_token
+
+
+def test_get_pool_stats(test_db: sessionmaker) -> None:
+    check_no_auth("/admin/pool", client.get)
+    token = get_fresh_token(test_db, TEST_USER_CRED)
+    response = client.get("/admin/pool", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    token = get_fresh_token(test_db, SUPER_USER_CRED)
+    response = client.get("/admin/pool", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()["data"]
+    assert "pool_class" in data
+    assert "+Inf" in data["wait_seconds"]["buckets"]
+
+
+def test_histogram_buckets() -> None:
+    histogram = Histogram([0.1, 1])
+    for value in [0.05, 0.5, 0.7, 5]:
+        histogram.observe(value)
+    snapshot = histogram.snapshot()
+    assert snapshot["count"] == 4
+    assert snapshot["buckets"] == {"0.1": 1, "1": 3, "+Inf": 4}
+
+
+def test_catalog_cache(test_db: sessionmaker) -> None:
+    token = get_fresh_token(test_db, SUPER_USER_CRED)
+    headers = {"Authorization": f"Bearer {token}"}
+    before = client.get("/admin/cache", headers=headers).json()["data"]["genre"]
+
+    assert client.get("/genre/").json()["data"] == []
+    assert client.get("/genre/").json()["data"] == []
+    stats = client.get("/admin/cache", headers=headers).json()["data"]["genre"]
+    assert stats["misses"] == before["misses"] + 1
+    assert stats["hits"] == before["hits"] + 1
+
+    # a write invalidates the cached list
+    response = client.post("/genre/", json={"genre": "Fantasy"}, headers=headers)
+    assert response.status_code == status.HTTP_201_CREATED
+    assert len(client.get("/genre/").json()["data"]) == 1
+
+
+def test_password_pool(test_db: sessionmaker, monkeypatch: pytest.MonkeyPatch) -> None:
+    token = get_fresh_token(test_db, SUPER_USER_CRED)
+    headers = {"Authorization": f"Bearer {token}"}
+    response = client.get("/admin/password_pool", headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()["data"]
+    assert data["pending"] == 0
+    # the login of get_fresh_token verified its password in the pool
+    assert data["run_seconds"]["count"] >= 1
+
+    monkeypatch.setattr(src.password_pool, "PASSWORD_HASH_MAX_PENDING", 0)
+    response = client.post(
+        "/auth/token",
+        data=SUPER_USER_CRED,
+    )
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.headers["Retry-After"] == "1"
+    data = client.get("/admin/password_pool", headers=headers).json()["data"]
+    assert data["rejected"] >= 1
+
+
+def test_password_pool_cancelled() -> None:
+    """
+    Tests that a hash stays pending after its request is cancelled, until the
+    pool finishes it.
+    """
+    started, release = threading.Event(), threading.Event()
+
+    def slow_hash() -> None:
+        started.set()
+        release.wait(5)
+
+    async def cancel_running_hash() -> None:
+        task = asyncio.create_task(src.password_pool.run_in_password_pool(slow_hash))
+        while not started.is_set():
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    pending = src.password_pool.PASSWORD_HASH_PENDING
+    before = pending.value
+    asyncio.run(cancel_running_hash())
+    assert pending.value == before + 1
+    release.set()
+    # it is done once the cancelled hash finished
+    deadline = time.monotonic() + 5
+    while pending.value != before and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert pending.value == before
+
+
+def test_login_limiter_stats(test_db: sessionmaker) -> None:
+    token = get_fresh_token(test_db, SUPER_USER_CRED)
+    headers = {"Authorization": f"Bearer {token}"}
+    before = client.get("/admin/login_limiter", headers=headers).json()["data"]
+
+    response = client.post("/auth/token", data={**SUPER_USER_CRED, "password": "no"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    data = client.get("/admin/login_limiter", headers=headers).json()["data"]
+    assert data["failures"] == before["failures"] + 1
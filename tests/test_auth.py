@@ -1,11 +1,15 @@
 from datetime import datetime
 
+import pytest
 import pytz
 from fastapi import Response, status
+from jose import jwt
 from sqlalchemy import select
 from sqlalchemy.orm import sessionmaker
 
-from src.endpoints.auth.auth_utils import get_password_hash
+import src.login_limiter
+from src.dependencies import BCRYPT_ROUNDS, get_crypt_context
+from src.endpoints.auth.auth_utils import ALGORITHM, SECRET_KEY, get_password_hash
 from src.models.user import User
 from tests.client import client
 
@@ -62,6 +66,21 @@ def test_register_user_already_exists(test_db: sessionmaker) -> None:
     assert response.status_code == status.HTTP_409_CONFLICT
 
 
+def test_register_user_deleted_already_exists(test_db: sessionmaker) -> None:
+    """
+    Tests that the username and email of a deleted user stay taken
+    """
+
+    register_user(TEST_USER)
+    with test_db() as db:
+        user = db.scalar(select(User).where(User.username == TEST_USER["username"]))
+        user.is_deleted = True
+        db.commit()
+    response = register_user(TEST_USER)
+
+    assert response.status_code == status.HTTP_409_CONFLICT
+
+
 ## Token Tests
 
 
@@ -100,6 +119,72 @@ def test_token_invalid(test_db: sessionmaker) -> None:
     assert response.status_code == status.HTTP_400_BAD_REQUEST
 
 
+def test_token_rehashes_outdated_password(test_db: sessionmaker) -> None:
+    """
+    Tests that a login replaces a hash made with an outdated cost
+    """
+
+    user = TEST_USER.copy()
+    outdated_context = get_crypt_context(bcrypt_rounds=4)
+    user["password"] = outdated_context.hash(user["password"])
+    user = User(**user)
+    user.date_of_joining = datetime.now(pytz.UTC)
+    user.is_active = True
+    with test_db() as db:
+        db.add(user)
+        db.commit()
+
+    response = login(TEST_USER_AUTH)
+    assert response.status_code == status.HTTP_200_OK
+
+    with test_db() as db:
+        password = db.scalar(
+            select(User.password).where(User.username == TEST_USER["username"])
+        )
+    assert password.startswith(f"$2b${BCRYPT_ROUNDS:02d}$")
+    assert login(TEST_USER_AUTH).status_code == status.HTTP_200_OK
+
+
+def test_token_rate_limited_by_username(test_db: sessionmaker) -> None:
+    """
+    Tests that a username is locked out after too many failed logins and that
+    other usernames are not
+    """
+
+    register_user(TEST_USER)
+    wrong_auth = {**TEST_USER_AUTH, "password": "an incorrect password"}
+    for _ in range(src.login_limiter.LOGIN_MAX_FAILURES_PER_USER):
+        assert login(wrong_auth).status_code == status.HTTP_400_BAD_REQUEST
+
+    response = login(TEST_USER_AUTH)
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert int(response.headers["Retry-After"]) > 0
+
+    response = login({"username": "someone else", "password": "a password"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_token_rate_limited_by_ip(
+    test_db: sessionmaker, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Tests that a client is locked out after too many failed logins across usernames
+    and that a successful login clears the failures of its username
+    """
+
+    monkeypatch.setattr(src.login_limiter, "LOGIN_MAX_FAILURES_PER_IP", 3)
+    register_user(TEST_USER)
+    wrong_auth = {**TEST_USER_AUTH, "password": "an incorrect password"}
+    assert login(wrong_auth).status_code == status.HTTP_400_BAD_REQUEST
+    assert login(TEST_USER_AUTH).status_code == status.HTTP_200_OK
+
+    for username in ["first", "second"]:
+        response = login({"username": username, "password": "a password"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+    response = login({"username": "third", "password": "a password"})
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+
 ## Register Librarian Tests
 
 
@@ -176,6 +261,47 @@ def test_refresh_token(test_db: sessionmaker) -> None:
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
 
+def test_refresh_token_current_claims(test_db: sessionmaker) -> None:
+    "Test that the refreshed token carries the current claims of the user"
+
+    refresh_token = create_librarian_and_get_token(test_db)
+    with test_db() as db:
+        user = db.scalar(select(User).where(User.username == TEST_USER["username"]))
+        user.is_librarian = False
+        db.commit()
+
+    response = client.post("/auth/refresh_token", json={"refresh_token": refresh_token})
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()["data"]
+    assert data["is_librarian"] is False
+    claims = jwt.decode(data["access_token"], SECRET_KEY, algorithms=[ALGORITHM])
+    assert claims["is_librarian"] is False
+
+
+def test_refresh_token_minimal(test_db: sessionmaker) -> None:
+    "Test that the minimal refresh mints a working token from the claims alone"
+
+    refresh_token = create_librarian_and_get_token(test_db)
+    response = client.post(
+        "/auth/refresh_token?minimal=true", json={"refresh_token": refresh_token}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()["data"]
+    assert set(data) == {
+        "id",
+        "username",
+        "is_librarian",
+        "access_token",
+        "refresh_token",
+    }
+    assert data["username"] == TEST_USER["username"]
+    assert data["is_librarian"] is True
+
+    headers = {"Authorization": f"Bearer {data['access_token']}"}
+    response = client.get(f"/user/{data['id']}", headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+
+
 # Test logout
 
 
@@ -3,6 +3,7 @@ from sqlalchemy.orm import sessionmaker
 from starlette import status
 
 from src.models.all_models import Author
+from src.pagination import encode_cursor
 from tests.client import client
 
 # fmt: off
@@ -50,6 +51,37 @@ def test_get_all_authors(test_db: sessionmaker) -> None:
     )
 
 
+def test_get_all_authors_with_cursor(test_db: sessionmaker) -> None:
+    delete_all_authors(test_db)
+    token = get_fresh_token(test_db, SUPER_USER_CRED)
+    for first_name in ["Talha", "Tahir", "Ahmed"]:
+        author = TEST_AUTHOR.copy()
+        author["first_name"] = first_name
+        client.post(
+            "/author/", headers={"Authorization": f"Bearer {token}"}, json=author
+        )
+
+    response = client.get("/author", params={"page_size": 2})
+    assert response.status_code == status.HTTP_200_OK
+    assert [a["first_name"] for a in response.json()["data"]] == ["Talha", "Tahir"]
+    next_cursor = response.json()["next_cursor"]
+    assert next_cursor is not None
+
+    response = client.get("/author", params={"page_size": 2, "after": next_cursor})
+    assert response.status_code == status.HTTP_200_OK
+    assert [a["first_name"] for a in response.json()["data"]] == ["Ahmed"]
+    assert response.json()["next_cursor"] is None
+
+    response = client.get("/author", params={"after": "not-a-cursor"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    # well formed cursors whose key isn't an id
+    for key in ["1", {"id": 1}, True, None]:
+        cursor = encode_cursor(key)
+        response = client.get("/author", params={"after": cursor})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
 def test_get_authors_by_id(test_db: sessionmaker) -> None:
     delete_all_authors(test_db)
     # Inserting dummy data of 2 authors
@@ -1,12 +1,13 @@
 from datetime import datetime
 
-from sqlalchemy import select
+from sqlalchemy import func, select, text
 from sqlalchemy.orm import sessionmaker
 from starlette import status
 
 from src.dependencies import get_password_hash
 from src.models import all_models
 from src.models.all_models import User
+from src.status_constants import AVAILABLE
 from tests.client import client
 from tests.utils import SUPER_USER_CRED  # isort skip
 from tests.utils import check_no_auth  # isort skip
@@ -14,7 +15,8 @@ from tests.utils import get_fresh_token  # isort skip
 from tests.utils import insert_author  # isort skip
 from tests.utils import insert_book  # isort skip
 from tests.utils import insert_genre  # isort skip
-from tests.utils import insert_language  # isort skip; isort skip
+from tests.utils import insert_language  # isort skip
+from tests.utils import insert_status  # isort skip
 
 
 def test_get_book(test_db: sessionmaker) -> None:
@@ -106,6 +108,7 @@ def test_filter_books(test_db: sessionmaker) -> None:
 
 def test_book_create(test_db: sessionmaker) -> None:
     check_no_auth("/book", client.post)
+    insert_status(test_db, AVAILABLE)
     language = insert_language(test_db)
     genre = insert_genre(test_db)
     author = insert_author(test_db)
@@ -217,6 +220,37 @@ def test_book_create(test_db: sessionmaker) -> None:
             .all()
         )
         assert len(copies) == payload.get("no_of_copies")
+        book_model = test_db.get(all_models.Book, book_id)
+        assert book_model.total_copies == payload.get("no_of_copies")
+        assert book_model.available_copies == payload.get("no_of_copies")
+
+
+def test_book_create_deleted_author(test_db: sessionmaker) -> None:
+    """
+    Tests that a book can't be created with a soft deleted author
+    """
+    language = insert_language(test_db)
+    genre = insert_genre(test_db)
+    author = insert_author(test_db)
+    with test_db() as db:
+        db.get(all_models.Author, author.id).is_deleted = True
+        db.commit()
+    token = get_fresh_token(test_db, SUPER_USER_CRED)
+
+    payload = {
+        "title": "TESTBook",
+        "isbn": "dsasadaa135",
+        "date_of_publication": "2000-12-13",
+        "description": "Short dics about book, max 200 characters",
+        "language_id": language.id,
+        "author_ids": [author.id],
+        "genre_ids": [genre.id],
+    }
+    response = client.post(
+        "/book", headers={"Authorization": f"Bearer {token}"}, json=payload
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.json().get("detail") == "Author not found"
 
 
 def test_book_update(test_db: sessionmaker) -> None:
@@ -253,6 +287,7 @@ def test_book_soft_delete(test_db: sessionmaker) -> None:
     Test for book delete
     """
     check_no_auth("/book", client.post)
+    insert_status(test_db, AVAILABLE)
     language = insert_language(test_db)
     genre = insert_genre(test_db)
     author = insert_author(test_db)
@@ -346,3 +381,85 @@ def test_book_soft_delete(test_db: sessionmaker) -> None:
         json=payload,
     )
     assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_book_create_copies_status(test_db: sessionmaker) -> None:
+    language = insert_language(test_db)
+    genre = insert_genre(test_db)
+    author = insert_author(test_db)
+    token = get_fresh_token(test_db, SUPER_USER_CRED)
+    payload = {
+        "title": "TESTBook",
+        "isbn": "dsasadaa135",
+        "date_of_publication": "2000-12-13",
+        "description": "Short dics about book, max 200 characters",
+        "language_id": language.id,
+        "author_ids": [author.id],
+        "genre_ids": [genre.id],
+        "no_of_copies": 2,
+    }
+    headers = {"Authorization": f"Bearer {token}"}
+
+    # copies can't be created without an available status
+    response = client.post("/book", headers=headers, json=payload)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    insert_status(test_db, "reserved")
+    available = insert_status(test_db, AVAILABLE)
+    response = client.post("/book", headers=headers, json=payload)
+    assert response.status_code == status.HTTP_201_CREATED
+    with test_db() as db:
+        status_ids = db.scalars(
+            select(all_models.Copy.status_id).where(
+                all_models.Copy.book_id == response.json()["data"]["id"]
+            )
+        ).all()
+    assert status_ids == [available.id, available.id]
+
+
+def test_book_create_copies_atomic(test_db: sessionmaker) -> None:
+    """
+    Tests that a book is not created when the insert of its copies fails.
+    """
+    language = insert_language(test_db)
+    genre = insert_genre(test_db)
+    author = insert_author(test_db)
+    insert_status(test_db, AVAILABLE)
+    token = get_fresh_token(test_db, SUPER_USER_CRED)
+    payload = {
+        "title": "TESTBook",
+        "isbn": "dsasadaa136",
+        "date_of_publication": "2000-12-13",
+        "description": "Short dics about book, max 200 characters",
+        "language_id": language.id,
+        "author_ids": [author.id],
+        "genre_ids": [genre.id],
+        "no_of_copies": 2,
+    }
+
+    # the insert of the copies fails inside the transaction of the book
+    with test_db() as db:
+        db.execute(
+            text(
+                "CREATE TRIGGER fail_copy_insert BEFORE INSERT ON copy "
+                "BEGIN SELECT RAISE(ABORT, 'copy insert failed'); END"
+            )
+        )
+        db.commit()
+    try:
+        response = client.post(
+            "/book", headers={"Authorization": f"Bearer {token}"}, json=payload
+        )
+    finally:
+        with test_db() as db:
+            db.execute(text("DROP TRIGGER fail_copy_insert"))
+            db.commit()
+    assert response.status_code == status.HTTP_409_CONFLICT
+    with test_db() as db:
+        assert (
+            db.scalar(
+                select(func.count()).where(all_models.Book.isbn == payload["isbn"])
+            )
+            == 0
+        )
+        assert db.scalar(select(func.count(all_models.Copy.id))) == 0
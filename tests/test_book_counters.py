@@ -0,0 +1,178 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from fastapi import status
+from sqlalchemy import func, select
+from sqlalchemy.orm import sessionmaker
+
+from src.book_counters import COUNTER_COLUMNS, reconcile_book_counters, update_copy
+from src.models import all_models
+from src.status_constants import AVAILABLE, RESERVED
+from tests.client import TestingAsyncSessionLocal, client
+from tests.test_borrowed_bulk import add_copies
+from tests.test_borrowed_post import create_required_entries_in_db
+from tests.test_language_api import create_user_using_model, get_token_for_user
+
+
+def reconcile() -> int:
+    async def run() -> int:
+        async with TestingAsyncSessionLocal() as db:
+            return await reconcile_book_counters(db)
+
+    return asyncio.run(run())
+
+
+def get_updated_at(test_db: sessionmaker, copy_id: int) -> datetime:
+    with test_db() as db:
+        return db.get(all_models.Copy, copy_id).book.updated_at
+
+
+def get_counters(test_db: sessionmaker, copy_id: int) -> dict:
+    with test_db() as db:
+        book = db.get(all_models.Copy, copy_id).book
+        return {name: getattr(book, name) for name in COUNTER_COLUMNS}
+
+
+def test_book_counters(test_db: sessionmaker) -> None:
+    """
+    Tests that the copy counters of a book follow its copies through checkouts,
+    returns and deletes, and that the reconciliation fixes them after drifting.
+    """
+    user = create_user_using_model(test_db, librarian=True)
+    copy_id = create_required_entries_in_db(test_db, AVAILABLE)
+    available = [copy_id] + add_copies(test_db, copy_id, AVAILABLE, 2)
+    add_copies(test_db, copy_id, RESERVED, 1)
+    headers = {"Authorization": f"Bearer {get_token_for_user(test_db)}"}
+
+    # the counters don't change when the book was updated
+    updated_at = get_updated_at(test_db, copy_id)
+
+    # the copies were inserted without going through the api
+    assert reconcile() == 1
+    assert reconcile() == 0
+    assert get_counters(test_db, copy_id) == {
+        "total_copies": 4,
+        "available_copies": 3,
+        "borrowed_copies": 0,
+        "reserved_copies": 1,
+        "maintenance_copies": 0,
+    }
+
+    data = {
+        "user_id": user.id,
+        "copy_ids": available[:2],
+        "issue_date": datetime.now().isoformat(),
+        "due_date": (datetime.now() + timedelta(days=2)).isoformat(),
+    }
+    response = client.post("/borrowed/bulk", json=data, headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    counters = get_counters(test_db, copy_id)
+    assert counters["available_copies"] == 1
+    assert counters["borrowed_copies"] == 2
+
+    data = {
+        "borrowed_ids": [response.json()["data"][0]["borrowed_id"]],
+        "return_date": (datetime.now() + timedelta(days=1)).isoformat(),
+    }
+    response = client.put("/borrowed/bulk/return", json=data, headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    counters = get_counters(test_db, copy_id)
+    assert counters["available_copies"] == 2
+    assert counters["borrowed_copies"] == 1
+    assert get_updated_at(test_db, copy_id) == updated_at
+
+    response = client.delete(f"/copy/{available[2]}", headers=headers)
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    counters = get_counters(test_db, copy_id)
+    assert counters["total_copies"] == 3
+    assert counters["available_copies"] == 1
+
+    assert reconcile() == 0
+
+
+def test_book_counters_single_copy(test_db: sessionmaker) -> None:
+    """
+    Tests the copy counters through the endpoints changing one copy at a time,
+    and that they are served outside of the cached book responses.
+    """
+    create_user_using_model(test_db, librarian=True)
+    copy_id = create_required_entries_in_db(test_db, AVAILABLE)
+    headers = {"Authorization": f"Bearer {get_token_for_user(test_db)}"}
+    assert reconcile() == 1
+    with test_db() as db:
+        copy = db.get(all_models.Copy, copy_id)
+        book_id, language_id, available_id = (
+            copy.book_id,
+            copy.language_id,
+            copy.status_id,
+        )
+        reserved_id = db.scalar(
+            select(all_models.Status.id).where(all_models.Status.status == RESERVED)
+        )
+
+    data = {"book_id": book_id, "language_id": language_id, "status_id": available_id}
+    response = client.post("/copy/", json=data, headers=headers)
+    assert response.status_code == status.HTTP_201_CREATED
+    counters = get_counters(test_db, copy_id)
+    assert counters["total_copies"] == 2
+    assert counters["available_copies"] == 2
+    with test_db() as db:
+        new_copy_id = db.scalar(select(func.max(all_models.Copy.id)))
+
+    data["status_id"] = reserved_id
+    response = client.put(f"/copy/{new_copy_id}", json=data, headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    counters = get_counters(test_db, copy_id)
+    assert counters["available_copies"] == 1
+    assert counters["reserved_copies"] == 1
+
+    data = {
+        "copy_id": copy_id,
+        "issue_date": datetime.now().isoformat(),
+        "due_date": (datetime.now() + timedelta(days=2)).isoformat(),
+    }
+    response = client.post("/borrowed/", json=data, headers=headers)
+    assert response.status_code == status.HTTP_201_CREATED
+    borrowed_id = response.json()["data"]["id"]
+    counters = get_counters(test_db, copy_id)
+    assert counters["available_copies"] == 0
+    assert counters["borrowed_copies"] == 1
+
+    url = f"/borrowed/return_borrowed_user/{borrowed_id}"
+    response = client.put(url, json=data, headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    # the second return fails without counting the copy twice
+    response = client.put(url, json=data, headers=headers)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    counters = get_counters(test_db, copy_id)
+    assert counters["available_copies"] == 1
+    assert counters["borrowed_copies"] == 0
+    assert reconcile() == 0
+
+    response = client.get("/book/counters", params={"book_ids": [book_id, 1000]})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["data"] == {str(book_id): counters}
+    response = client.get(f"/book/{book_id}")
+    assert "total_copies" not in response.json()["data"]
+
+
+def test_update_copy_changed_since_read(test_db: sessionmaker) -> None:
+    """
+    Tests that a copy changed since it was read is neither updated nor counted.
+    """
+    copy_id = create_required_entries_in_db(test_db, AVAILABLE)
+    assert reconcile() == 1
+
+    async def update_stale_copy() -> bool:
+        async with TestingAsyncSessionLocal() as db:
+            copy = await db.get(all_models.Copy, copy_id)
+            # deleted by another request meanwhile
+            with test_db() as other_db:
+                other_db.get(all_models.Copy, copy_id).is_deleted = True
+                other_db.commit()
+            updated = await update_copy(db, copy, {"is_deleted": True})
+            await db.commit()
+            return updated
+
+    assert asyncio.run(update_stale_copy()) is False
+    assert get_counters(test_db, copy_id)["total_copies"] == 1
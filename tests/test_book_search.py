@@ -0,0 +1,122 @@
+from datetime import datetime
+
+from fastapi import status
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import sessionmaker
+
+from src.endpoints.book.search_utils import book_search
+from src.models import all_models
+from src.pagination import encode_cursor
+from tests.client import client
+
+
+def insert_books(test_db: sessionmaker) -> None:
+    author = all_models.Author(
+        first_name="Charles", last_name="Dickens", birth_date=datetime(1812, 2, 7)
+    )
+    other_author = all_models.Author(
+        first_name="Jane", last_name="Austen", birth_date=datetime(1775, 12, 16)
+    )
+    language = all_models.Language(language="English")
+    books = [
+        all_models.Book(
+            title=title,
+            description="A novel",
+            isbn=isbn,
+            date_of_publication=datetime(1850, 1, 1),
+            language=language,
+        )
+        for title, isbn in [
+            ("Great Expectations", "9780141439563"),
+            ("A Tale of Two Cities", "9780141439600"),
+            ("Pride and Prejudice", "9780141439518"),
+            ("Expectations_100%", "1111111111"),
+        ]
+    ]
+    books[0].authors.append(author)
+    books[1].authors.append(author)
+    books[2].authors.append(other_author)
+    books[3].authors.append(other_author)
+    with test_db() as db:
+        # flushed one by one so that the ids follow the list
+        for book in books:
+            db.add(book)
+            db.flush()
+        db.commit()
+
+
+def search(**params) -> dict:
+    response = client.get("/book/search", params=params)
+    assert response.status_code == status.HTTP_200_OK
+    return response.json()
+
+
+def titles(response: dict) -> list:
+    return [book["title"] for book in response["data"]]
+
+
+def test_search_books(test_db: sessionmaker) -> None:
+    insert_books(test_db)
+
+    # title prefix ranks above title substring
+    assert titles(search(q="expectations")) == [
+        "Expectations_100%",
+        "Great Expectations",
+    ]
+    # author name, isbn prefix
+    assert titles(search(q="dickens")) == ["Great Expectations", "A Tale of Two Cities"]
+    # equal ranks are ordered by id
+    assert titles(search(q="978014143")) == [
+        "Great Expectations",
+        "A Tale of Two Cities",
+        "Pride and Prejudice",
+    ]
+    # like wildcards are matched literally
+    assert titles(search(q="_100%")) == ["Expectations_100%"]
+    assert titles(search(q="nothing like it")) == []
+    assert search(q="dickens")["data"][0]["authors"][0]["last_name"] == "Dickens"
+    assert "authors" not in search(q="dickens", shallow=True)["data"][0]
+
+    response = client.get("/book/search", params={"q": ""})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_search_books_pages(test_db: sessionmaker) -> None:
+    insert_books(test_db)
+
+    pages = []
+    response = search(q="9780", page_size=2)
+    pages.append(titles(response))
+    response = search(q="9780", page_size=2, after=response["next_cursor"])
+    pages.append(titles(response))
+    assert response["next_cursor"] is None
+    assert pages == [
+        ["Great Expectations", "A Tale of Two Cities"],
+        ["Pride and Prejudice"],
+    ]
+
+    response = client.get("/book/search", params={"q": "9780", "after": "invalid"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    for key in [[1.0, "1"], ["1", 1], [1.0], 1]:
+        params = {"q": "9780", "after": encode_cursor(key)}
+        response = client.get("/book/search", params=params)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_search_books_postgres_query() -> None:
+    condition, rank = book_search("postgresql", "expectations")
+    sql = str(
+        select(all_models.Book.id, rank)
+        .where(condition)
+        .compile(dialect=postgresql.dialect())
+    )
+    # the expression of the title index, and the trigram operator
+    assert "to_tsvector('simple'::regconfig, book.title) @@ websearch_to_tsquery" in sql
+    assert "book.title %% " in sql
+    assert "similarity(book.title" in sql
+    # the expression of the author name index, with its separator inlined
+    assert "author.first_name || ' ' || author.last_name %% " in sql
+    # the title and author matches can each use their indexes
+    assert " UNION " in sql
+    assert "EXISTS" not in sql
@@ -0,0 +1,190 @@
+from datetime import datetime, timedelta
+
+from fastapi import status
+from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
+
+from src.models import all_models
+from src.status_constants import AVAILABLE, BORROWED, RESERVED
+from tests.client import client
+from tests.test_borrowed_post import create_required_entries_in_db
+from tests.test_language_api import create_user_using_model, get_token_for_user
+
+
+def add_copies(test_db: sessionmaker, copy_id: int, status_name: str, n: int) -> list:
+    """
+    Adds n copies of the book of the given copy with the given status.
+    Returns the ids of the new copies.
+    """
+    with test_db() as db:
+        copy = db.get(all_models.Copy, copy_id)
+        status_id = db.scalar(
+            select(all_models.Status.id).where(all_models.Status.status == status_name)
+        )
+        copies = [
+            all_models.Copy(
+                book_id=copy.book_id, language_id=copy.language_id, status_id=status_id
+            )
+            for _ in range(n)
+        ]
+        db.add_all(copies)
+        db.commit()
+        return [copy.id for copy in copies]
+
+
+def test_bulk_checkout_and_return(test_db: sessionmaker) -> None:
+    user = create_user_using_model(test_db, librarian=True)
+    copy_id = create_required_entries_in_db(test_db, AVAILABLE)
+    available = [copy_id] + add_copies(test_db, copy_id, AVAILABLE, 2)
+    reserved = add_copies(test_db, copy_id, RESERVED, 1)
+    headers = {"Authorization": f"Bearer {get_token_for_user(test_db)}"}
+    data = {
+        "user_id": user.id,
+        "copy_ids": available + reserved + [1000],
+        "issue_date": datetime.now().isoformat(),
+        "due_date": (datetime.now() + timedelta(days=2)).isoformat(),
+    }
+
+    response = client.post("/borrowed/bulk", json=data, headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    results = response.json()["data"]
+    assert [result["copy_id"] for result in results] == data["copy_ids"]
+    assert [result["success"] for result in results] == [True] * 3 + [False] * 2
+    assert results[3]["details"] == "Copy is not available"
+    assert results[4]["details"] == "Copy with given ID does not exist"
+    with test_db() as db:
+        borrowed = db.scalars(select(all_models.Borrowed)).all()
+        assert sorted(b.copy_id for b in borrowed) == available
+        statuses = db.scalars(
+            select(all_models.Status.status)
+            .join(all_models.Copy)
+            .where(all_models.Copy.id.in_(available))
+        ).all()
+        assert statuses == [BORROWED] * 3
+
+    # the same copies can't be checked out twice
+    response = client.post("/borrowed/bulk", json=data, headers=headers)
+    assert not any(result["success"] for result in response.json()["data"])
+
+    borrowed_ids = [result["borrowed_id"] for result in results[:3]]
+    data = {
+        "borrowed_ids": borrowed_ids + [1000],
+        "return_date": (datetime.now() + timedelta(days=1)).isoformat(),
+    }
+    response = client.put("/borrowed/bulk/return", json=data, headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    results = response.json()["data"]
+    assert [result["success"] for result in results] == [True] * 3 + [False]
+    assert results[3]["details"] == "Borrowed not found."
+    with test_db() as db:
+        borrowed = db.scalars(select(all_models.Borrowed)).all()
+        assert all(b.return_date is not None for b in borrowed)
+
+    # returning again fails since the borrowed are closed
+    response = client.put("/borrowed/bulk/return", json=data, headers=headers)
+    results = response.json()["data"]
+    assert results[0]["details"] == "Borrowed not found."
+
+
+def test_bulk_return_closed_and_duplicate_borrowed(test_db: sessionmaker) -> None:
+    """
+    Tests that a closed borrowed of a copy that is borrowed again isn't
+    returned, and that a copy is returned by one borrowed only.
+    """
+    user = create_user_using_model(test_db, librarian=True)
+    copy_id = create_required_entries_in_db(test_db, AVAILABLE)
+    headers = {"Authorization": f"Bearer {get_token_for_user(test_db)}"}
+    data = {
+        "user_id": user.id,
+        "copy_ids": [copy_id],
+        "issue_date": datetime.now().isoformat(),
+        "due_date": (datetime.now() + timedelta(days=2)).isoformat(),
+    }
+    closed_id = client.post("/borrowed/bulk", json=data, headers=headers).json()[
+        "data"
+    ][0]["borrowed_id"]
+    return_date = datetime.now() + timedelta(days=1)
+    return_data = {"borrowed_ids": [closed_id], "return_date": return_date.isoformat()}
+    response = client.put("/borrowed/bulk/return", json=return_data, headers=headers)
+    assert response.json()["data"][0]["success"]
+    open_id = client.post("/borrowed/bulk", json=data, headers=headers).json()["data"][
+        0
+    ]["borrowed_id"]
+    # a second open borrowed of the same copy
+    with test_db() as db:
+        duplicate = all_models.Borrowed(
+            copy_id=copy_id,
+            user_id=user.id,
+            issue_date=datetime.now(),
+            due_date=datetime.now() + timedelta(days=2),
+        )
+        db.add(duplicate)
+        db.commit()
+        duplicate_id = duplicate.id
+
+    return_data["borrowed_ids"] = [closed_id, open_id, duplicate_id]
+    return_data["return_date"] = (return_date + timedelta(days=1)).isoformat()
+    response = client.put("/borrowed/bulk/return", json=return_data, headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    results = response.json()["data"]
+    assert [result["success"] for result in results] == [False, True, False]
+    assert results[0]["details"] == "Borrowed not found."
+    assert results[2]["details"] == "Copy is returned by another borrowed."
+    with test_db() as db:
+        assert db.get(all_models.Borrowed, closed_id).return_date == return_date
+        assert db.get(all_models.Borrowed, duplicate_id).return_date is None
+        assert db.get(all_models.Copy, copy_id).status.status == AVAILABLE
+
+
+def test_bulk_checkout_without_available_status(test_db: sessionmaker) -> None:
+    user = create_user_using_model(test_db, librarian=True)
+    copy_id = create_required_entries_in_db(test_db, RESERVED)
+    with test_db() as db:
+        available = db.scalar(
+            select(all_models.Status).where(all_models.Status.status == AVAILABLE)
+        )
+        available.is_deleted = True
+        db.commit()
+    headers = {"Authorization": f"Bearer {get_token_for_user(test_db)}"}
+    data = {
+        "user_id": user.id,
+        "copy_ids": [copy_id],
+        "issue_date": datetime.now().isoformat(),
+        "due_date": (datetime.now() + timedelta(days=2)).isoformat(),
+    }
+    response = client.post("/borrowed/bulk", json=data, headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    result = response.json()["data"][0]
+    assert not result["success"]
+    assert result["details"] == "Available status does not exist"
+    with test_db() as db:
+        assert db.get(all_models.Copy, copy_id).status.status == RESERVED
+
+
+def test_bulk_with_normal_user(test_db: sessionmaker) -> None:
+    user = create_user_using_model(test_db, librarian=False)
+    headers = {"Authorization": f"Bearer {get_token_for_user(test_db)}"}
+    data = {
+        "user_id": user.id,
+        "copy_ids": [1],
+        "issue_date": datetime.now().isoformat(),
+        "due_date": (datetime.now() + timedelta(days=2)).isoformat(),
+    }
+    response = client.post("/borrowed/bulk", json=data, headers=headers)
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    data = {"borrowed_ids": [1], "return_date": datetime.now().isoformat()}
+    response = client.put("/borrowed/bulk/return", json=data, headers=headers)
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_bulk_checkout_with_wrong_user(test_db: sessionmaker) -> None:
+    create_user_using_model(test_db, librarian=True)
+    headers = {"Authorization": f"Bearer {get_token_for_user(test_db)}"}
+    data = {
+        "user_id": 1000,
+        "copy_ids": [1],
+        "issue_date": datetime.now().isoformat(),
+        "due_date": (datetime.now() + timedelta(days=2)).isoformat(),
+    }
+    response = client.post("/borrowed/bulk", json=data, headers=headers)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -36,6 +36,21 @@ def test_borrowed_get_all(test_db: sessionmaker) -> None:
     assert data[0]["copy"]["book"]["title"] == borrowed.copy.book.title
 
 
+def test_borrowed_get_all_shallow(test_db: sessionmaker) -> None:
+    """
+    Tests that the shallow mode only returns the columns of borrowed
+    """
+
+    token = create_librarian_and_get_token(test_db)
+    borrowed = create_borrowed(test_db)
+    response = make_request("/borrowed/?shallow=true", token)
+    data = response.json()["data"]
+    assert response.status_code == status.HTTP_200_OK
+    assert data[0]["copy_id"] == borrowed.copy_id
+    assert "copy" not in data[0]
+    assert "user" not in data[0]
+
+
 def test_borrowed_get_all_without_token(test_db: sessionmaker) -> None:
     """
     Tests the get all borrowed endpoint with no token provided. Should return 401
@@ -1,13 +1,16 @@
+import asyncio
 import logging
 from datetime import datetime, timedelta
 
-from fastapi import status
+from fastapi import HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.orm import sessionmaker
 
+from src.endpoints.borrowed.post.create_borrowed import create_borrowed
 from src.models import all_models
+from src.schemas.borrowed import BorrowedSchema
 from src.status_constants import AVAILABLE, BORROWED, MAINTENANCE, RESERVED
-from tests.client import client
+from tests.client import TestingAsyncSessionLocal, client
 from tests.test_language_api import create_user_using_model, get_token_for_user
 
 
@@ -274,6 +277,35 @@ def test_with_not_available_copy_id(test_db: sessionmaker) -> None:
         logging.info(" Wrong Return date Tested successfully")
 
 
+def test_create_borrowed_without_available_status(test_db: sessionmaker) -> None:
+    """
+    Tests that the checkout fails without changing the copy when the available
+    status doesn't exist.
+    """
+    create_user_using_model(test_db, librarian=True)
+    copy_id = create_required_entries_in_db(test_db, RESERVED)
+    with test_db() as db:
+        available = db.scalar(
+            select(all_models.Status).where(all_models.Status.status == AVAILABLE)
+        )
+        available.is_deleted = True
+        db.commit()
+    data = {
+        "copy_id": copy_id,
+        "issue_date": datetime.now().isoformat(),
+        "due_date": (datetime.now() + timedelta(days=2)).isoformat(),
+    }
+    token = get_token_for_user(test_db)
+    response = client.post(
+        "/borrowed", json=data, headers={"Authorization": f"Bearer {token}"}
+    )
+    assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+    assert response.json()["detail"] == "Available status does not exist"
+    with test_db() as db:
+        assert db.get(all_models.Copy, copy_id).status.status == RESERVED
+        assert db.scalars(select(all_models.Borrowed)).all() == []
+
+
 # Test case for create borrowed (POST /borrowed/)
 def test_with_simple_user(test_db: sessionmaker) -> None:
     """
@@ -347,3 +379,38 @@ def test_with_wrong_copy_id(test_db: sessionmaker) -> None:
         )
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         logging.info(" Wrong Return date Tested successfully")
+
+
+# Test case for concurrent checkouts of the same copy
+def test_concurrent_checkout_of_same_copy(test_db: sessionmaker) -> None:
+    """
+    This function will be used to test that only one of two concurrent
+    checkouts of the same copy succeeds.
+    Parameters:
+        test_db: The database session.
+    Returns:
+        None
+    """
+    user = create_user_using_model(test_db, librarian=False)
+    copy_id = create_required_entries_in_db(test_db, AVAILABLE)
+    borrowed = BorrowedSchema(
+        copy_id=copy_id,
+        issue_date=datetime.now(),
+        due_date=datetime.now() + timedelta(days=2),
+    )
+
+    async def checkout() -> int:
+        async with TestingAsyncSessionLocal() as db:
+            try:
+                await create_borrowed(borrowed.copy(), {"id": user.id}, db)
+                return status.HTTP_201_CREATED
+            except HTTPException as e:
+                return e.status_code
+
+    async def checkout_concurrently() -> list:
+        return await asyncio.gather(checkout(), checkout())
+
+    results = asyncio.run(checkout_concurrently())
+    assert sorted(results) == [status.HTTP_201_CREATED, status.HTTP_400_BAD_REQUEST]
+    with test_db() as db:
+        assert len(db.scalars(select(all_models.Borrowed)).all()) == 1
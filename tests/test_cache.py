@@ -0,0 +1,30 @@
+from sqlalchemy.orm import sessionmaker
+
+from src.cache import GENRE, cache_get, cache_set, invalidate, make_key
+from src.responses import custom_response
+from tests.client import client
+
+
+def test_cache_set_after_invalidation(test_db: sessionmaker) -> None:
+    """
+    Tests that a body read before an invalidation is not served after it.
+    """
+    key = make_key(test="stale")
+
+    async def read_invalidate_write() -> tuple:
+        cached, version = await cache_get(GENRE, key)
+        assert cached is None
+        # a write commits between the database read and the cache write
+        invalidate(GENRE)
+        await cache_set(GENRE, key, version, custom_response(200, "old", []))
+        stale, _ = await cache_get(GENRE, key)
+
+        cached, version = await cache_get(GENRE, key)
+        await cache_set(GENRE, key, version, custom_response(200, "new", []))
+        fresh, _ = await cache_get(GENRE, key)
+        return stale, fresh
+
+    # run on the loop of the app, which owns the async redis connections
+    stale, fresh = client.portal.call(read_invalidate_write)
+    assert stale is None
+    assert b'"new"' in fresh.body
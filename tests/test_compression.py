@@ -0,0 +1,82 @@
+import gzip
+
+from fastapi import FastAPI, Response
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from src.compression import CompressionMiddleware, accepted_encodings
+
+BIG = b"x" * 2000
+
+app = FastAPI()
+app.add_middleware(CompressionMiddleware, minimum_size=1000, exclude_paths=["/raw"])
+
+
+@app.get("/big")
+async def big() -> Response:
+    return Response(BIG, media_type="text/plain", headers={"ETag": '"abc"'})
+
+
+@app.get("/small")
+async def small() -> Response:
+    return Response(b"x" * 10, media_type="text/plain")
+
+
+@app.get("/raw/big")
+async def raw_big() -> Response:
+    return Response(BIG, media_type="text/plain")
+
+
+@app.get("/stream")
+async def stream() -> StreamingResponse:
+    async def chunks():
+        for _ in range(4):
+            yield BIG
+
+    return StreamingResponse(chunks(), media_type="text/plain")
+
+
+compression_client = TestClient(app)
+
+
+def get(url: str, accept_encoding: str = "gzip") -> tuple[Response, bytes]:
+    """
+    Returns the response and its raw (still compressed) body
+    """
+    with compression_client.stream(
+        "GET", url, headers={"Accept-Encoding": accept_encoding}
+    ) as response:
+        return response, b"".join(response.iter_raw())
+
+
+def test_compresses_large_responses() -> None:
+    response, raw = get("/big")
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert response.headers["ETag"] == 'W/"abc"'
+    assert int(response.headers["Content-Length"]) == len(raw)
+    assert gzip.decompress(raw) == BIG
+
+
+def test_compresses_streamed_responses() -> None:
+    response, raw = get("/stream")
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(raw) == BIG * 4
+
+
+def test_skips_small_excluded_and_unaccepted_responses() -> None:
+    for url, accept_encoding in [
+        ("/small", "gzip"),
+        ("/raw/big", "gzip"),
+        ("/big", "identity"),
+        ("/big", "gzip;q=0"),
+    ]:
+        response, raw = get(url, accept_encoding)
+        assert "Content-Encoding" not in response.headers
+        assert raw in (BIG, b"x" * 10)
+
+
+def test_accepted_encodings() -> None:
+    assert accepted_encodings("gzip, deflate, br;q=0.5") == {"gzip", "deflate", "br"}
+    assert accepted_encodings("br;q=0, gzip") == {"gzip"}
+    assert accepted_encodings("") == set()
@@ -47,6 +47,91 @@ def test_get_copy(test_db: sessionmaker) -> None:
     assert response.json().get("detail") == "Copy not found"
 
 
+def test_get_copies_bounded(test_db: sessionmaker) -> None:
+    copy = insert_copy(
+        test_db, isbn="qwer", language="English", status_name="available"
+    )
+    copy2 = insert_copy(
+        test_db, isbn="qwerty", language="Persian", status_name="reserved"
+    )
+
+    response = client.get("/copy", params={"count_only": True})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["data"] == {"count": 2}
+
+    response = client.get("/copy", params={"page_size": 1})
+    assert [c["id"] for c in response.json()["data"]] == [copy[1].id]
+    next_cursor = response.json()["next_cursor"]
+    response = client.get("/copy", params={"page_size": 1, "after": next_cursor})
+    assert [c["id"] for c in response.json()["data"]] == [copy2[1].id]
+    assert response.json()["next_cursor"] is None
+
+    # page size above the hard cap
+    response = client.get("/copy", params={"page_size": 100000})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_get_copies_availability(test_db: sessionmaker) -> None:
+    book, copy, language = insert_copy(
+        test_db, isbn="qwer", language="English", status_name="available"
+    )
+    book2, copy2, language2 = insert_copy(
+        test_db, isbn="qwerty", language="Persian", status_name="reserved"
+    )
+    with test_db() as db:
+        db.add_all(
+            [
+                all_models.Copy(
+                    book_id=book.id, language_id=language.id, status_id=copy.status_id
+                ),
+                all_models.Copy(
+                    book_id=book.id, language_id=language2.id, status_id=copy2.status_id
+                ),
+                all_models.Copy(
+                    book_id=book.id,
+                    language_id=language.id,
+                    status_id=copy.status_id,
+                    is_deleted=True,
+                ),
+            ]
+        )
+        db.commit()
+
+    response = client.get(
+        "/copy/availability", params={"book_ids": [book.id, book2.id, 1000]}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["data"] == {
+        str(book.id): [
+            {
+                "language_id": language.id,
+                "status_id": copy.status_id,
+                "status": "available",
+                "count": 2,
+            },
+            {
+                "language_id": language2.id,
+                "status_id": copy2.status_id,
+                "status": "reserved",
+                "count": 1,
+            },
+        ],
+        str(book2.id): [
+            {
+                "language_id": language2.id,
+                "status_id": copy2.status_id,
+                "status": "reserved",
+                "count": 1,
+            }
+        ],
+        "1000": [],
+    }
+
+    # more books than a page
+    response = client.get("/copy/availability", params={"book_ids": list(range(1000))})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
 def test_copy_create(test_db: sessionmaker) -> None:
     copy = insert_copy(
         test_db, isbn="qwertiuyii", language="English", status_name="available"
@@ -0,0 +1,53 @@
+import csv
+import io
+import json
+
+from sqlalchemy.orm import sessionmaker
+from starlette import status
+
+from tests.client import client
+from tests.utils import SUPER_USER_CRED  # isort skip
+from tests.utils import TEST_USER_CRED  # isort skip
+from tests.utils import check_no_auth  # isort skip
+from tests.utils import get_fresh_token  # isort skip
+from tests.utils import insert_copy  # isort skip
+
+
+def test_export_copies(test_db: sessionmaker) -> None:
+    check_no_auth("/export/copies", client.get)
+    token = get_fresh_token(test_db, TEST_USER_CRED)
+    headers = {"Authorization": f"Bearer {token}"}
+    response = client.get("/export/copies", headers=headers)
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    copy = insert_copy(
+        test_db, isbn="qwer", language="English", status_name="available"
+    )
+    copy2 = insert_copy(
+        test_db, isbn="qwerty", language="Persian", status_name="reserved"
+    )
+    token = get_fresh_token(test_db, SUPER_USER_CRED)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = client.get("/export/copies", headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["id"] for row in rows] == [copy[1].id, copy2[1].id]
+
+    response = client.get(
+        "/export/copies", params={"export_format": "csv"}, headers=headers
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/csv")
+    assert "copies.csv" in response.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [int(row["id"]) for row in rows] == [copy[1].id, copy2[1].id]
+
+    response = client.get("/export/books", headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.text.splitlines()) == 2
+
+    response = client.get("/export/borrowed", headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.text == ""
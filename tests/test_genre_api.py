@@ -3,6 +3,7 @@ from datetime import datetime
 
 from fastapi import status
 
+from src.cache import GENRE, invalidate
 from src.models import all_models
 from tests.client import client
 from tests.test_language_api import create_user_using_model, get_token_for_user
@@ -187,3 +188,40 @@ def test_soft_delete(test_db) -> None:
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["data"]["genre"] == "Test2"
     assert response.json()["data"]["id"] == 1
+
+
+# Test conditional GET (If-None-Match)
+def test_get_all_genre_conditional(test_db) -> None:
+    """
+    This function will be used to test the ETag of the Genre list.
+    Parameters:
+        test_db: The database session.
+    Returns:
+        None
+    """
+    response = client.get("/genre/")
+    assert response.status_code == status.HTTP_200_OK
+    etag = response.headers["ETag"]
+    assert "must-revalidate" in response.headers["Cache-Control"]
+
+    # served from the cache
+    response = client.get("/genre/", headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
+    # rebuilt from the database, with the same content
+    invalidate(GENRE)
+    response = client.get("/genre/", headers={"If-None-Match": f'W/{etag}, "x"'})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    create_user_using_model(test_db, librarian=True)
+    token = get_token_for_user(test_db)
+    response = client.post(
+        "/genre/", json={"genre": "Test"}, headers={"Authorization": f"Bearer {token}"}
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    response = client.get("/genre/", headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"] != etag
+    assert len(response.json()["data"]) == 1
@@ -0,0 +1,64 @@
+import pytest
+from sqlalchemy import Select, and_, func, not_, select, text
+from sqlalchemy.orm import sessionmaker
+
+from src.models import all_models
+from tests.client import engine
+
+Book = all_models.Book
+Borrowed = all_models.Borrowed
+Copy = all_models.Copy
+
+# The hot queries of the endpoints and the index each of them must use.
+HOT_QUERIES = {
+    "borrowed of a user": (
+        select(Borrowed)
+        .where(and_(Borrowed.user_id == 1, not_(Borrowed.is_deleted)))
+        .order_by(Borrowed.id),
+        "ix_borrowed_user_id",
+    ),
+    "borrowed of a copy": (
+        select(Borrowed).where(Borrowed.copy_id.in_([1, 2])),
+        "ix_borrowed_copy_id",
+    ),
+    "copies of a book": (
+        select(Copy)
+        .where(and_(Copy.book_id == 1, not_(Copy.is_deleted)))
+        .order_by(Copy.id),
+        "ix_copy_book_id",
+    ),
+    "copies in a status": (
+        select(Copy.book_id, func.count())
+        .where(and_(Copy.status_id == 1, not_(Copy.is_deleted)))
+        .group_by(Copy.book_id),
+        "ix_copy_status_id",
+    ),
+    "books in a language": (
+        select(Book)
+        .where(and_(Book.language_id == 1, not_(Book.is_deleted)))
+        .order_by(Book.id),
+        "ix_book_language_id",
+    ),
+    "authors of books": (
+        select(all_models.BookAuthor).where(all_models.BookAuthor.book_id.in_([1, 2])),
+        "ix_book_author_book_id",
+    ),
+    "books of a genre": (
+        select(all_models.BookGenre.book_id).where(all_models.BookGenre.genre_id == 1),
+        "ix_book_genre_genre_id",
+    ),
+}
+
+
+def query_plan(query: Select) -> str:
+    sql = query.compile(engine, compile_kwargs={"literal_binds": True})
+    with engine.connect() as connection:
+        rows = connection.execute(text(f"EXPLAIN QUERY PLAN {sql}")).all()
+    return "\n".join(row[-1] for row in rows)
+
+
+@pytest.mark.parametrize("name", HOT_QUERIES)
+def test_hot_query_uses_index(test_db: sessionmaker, name: str) -> None:
+    query, index = HOT_QUERIES[name]
+    plan = query_plan(query)
+    assert f"INDEX {index}" in plan, plan
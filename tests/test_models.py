@@ -1,9 +1,11 @@
+import asyncio
 from datetime import datetime
 
 from sqlalchemy import select
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import selectinload, sessionmaker
 
 from src.models import all_models
+from tests.client import TestingAsyncSessionLocal
 
 
 def test_book_language_relationship(test_db: sessionmaker) -> None:
@@ -177,3 +179,57 @@ def test_borrowed(test_db: sessionmaker) -> None:
         )
         assert borrowed.user == user
         assert borrowed.copy == copy
+
+
+def test_soft_deleted_rows_hidden(test_db: sessionmaker) -> None:
+    """
+    Tests that the async sessions hide soft deleted rows, including related ones,
+    unless the statement includes them.
+    """
+    with test_db() as db:
+        status = all_models.Status(status="available")
+        language = all_models.Language(language="English")
+        book = all_models.Book(
+            title="Let us C",
+            description="Coding book",
+            isbn="ABCD1234",
+            date_of_publication=datetime(2008, 1, 1),
+            language=language,
+        )
+        book.copies.extend(
+            [
+                all_models.Copy(language=language, status=status),
+                all_models.Copy(language=language, status=status, is_deleted=True),
+            ]
+        )
+        deleted_book = all_models.Book(
+            title="Let us C++",
+            description="Coding book",
+            isbn="ABCD1235",
+            date_of_publication=datetime(2008, 1, 1),
+            language=language,
+            is_deleted=True,
+        )
+        db.add_all([book, deleted_book])
+        db.commit()
+
+    async def load() -> tuple:
+        async with TestingAsyncSessionLocal() as db:
+            books = (
+                await db.scalars(
+                    select(all_models.Book).options(
+                        selectinload(all_models.Book.copies)
+                    )
+                )
+            ).all()
+            all_books = (
+                await db.scalars(
+                    select(all_models.Book).execution_options(include_deleted=True)
+                )
+            ).all()
+            return books, all_books
+
+    books, all_books = asyncio.run(load())
+    assert [book.isbn for book in books] == ["ABCD1234"]
+    assert len(books[0].copies) == 1
+    assert {book.isbn for book in all_books} == {"ABCD1234", "ABCD1235"}
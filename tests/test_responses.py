@@ -0,0 +1,56 @@
+from datetime import datetime
+
+import orjson
+import pytz
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload, sessionmaker
+
+from src.models import all_models
+from src.responses import custom_response, dumps
+from src.schemas.user import UserSchemaRefresh
+
+
+def test_dumps_matches_jsonable_encoder(test_db: sessionmaker) -> None:
+    author = all_models.Author(
+        first_name="Charles",
+        last_name="Babbage",
+        birth_date=datetime(1990, 1, 1, tzinfo=pytz.UTC),
+    )
+    language = all_models.Language(language="English")
+    book = all_models.Book(
+        title="Let us C",
+        description="Coding book",
+        isbn="ABCD1234",
+        date_of_publication=datetime(2008, 1, 1, 10, 30, 15, 250),
+        language=language,
+    )
+    book.authors.append(author)
+    with test_db() as db:
+        db.add_all([author, language, book])
+        db.commit()
+
+    with test_db() as db:
+        books = db.scalars(
+            select(all_models.Book).options(
+                selectinload(all_models.Book.authors),
+                selectinload(all_models.Book.language),
+            )
+        ).all()
+        # only loaded attributes are encoded, never the unloaded genres
+        assert orjson.loads(dumps(books)) == jsonable_encoder(books)
+        assert "genres" not in orjson.loads(dumps(books))[0]
+
+
+def test_custom_response_envelope() -> None:
+    user = UserSchemaRefresh(
+        id=1, username="user", is_librarian=False, access_token="a", refresh_token="r"
+    )
+    response = custom_response(status_code=201, details="Created", data=user)
+    assert response.status_code == 201
+    assert response.media_type == "application/json"
+    assert orjson.loads(response.body) == {
+        "status_code": 201,
+        "details": "Created",
+        "data": user.dict(),
+    }
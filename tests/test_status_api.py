@@ -2,6 +2,7 @@ import logging
 
 from fastapi import status
 
+from src.cache import STATUS, invalidate
 from src.models import all_models
 from tests.client import client
 from tests.test_language_api import create_user_using_model, get_token_for_user
@@ -200,6 +201,8 @@ def test_soft_delete(test_db) -> None:
             {"is_deleted": False}
         )
         db.commit()
+    # writes that bypass the API aren't seen by the cache until invalidated
+    invalidate(STATUS)
     # get all status
     response = client.get("/status/")
     logging.info(
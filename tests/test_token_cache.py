@@ -0,0 +1,84 @@
+import json
+import time
+
+from sqlalchemy.orm import sessionmaker
+
+from src import dependencies
+from src.dependencies import BLACKLIST_CHANNEL, redis_conn, token_cache
+from src.token_cache import TokenCache
+from tests.client import client
+from tests.utils import SUPER_USER_CRED, get_fresh_token
+
+
+def test_token_cache_lru_and_expiry() -> None:
+    cache = TokenCache(max_size=2, max_age=60)
+    now = time.time()
+    cache.put("a", {"id": 1}, now + 60)
+    cache.put("b", {"id": 2}, now + 60)
+    assert cache.get("a") == {"id": 1}
+    # "b" is the least recently used entry
+    cache.put("c", {"id": 1}, now + 60)
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+    cache.evict_user(1)
+    assert len(cache) == 0
+
+    cache.put("d", {"id": 3}, now - 1)
+    assert cache.get("d") is None
+
+
+def test_blacklist_message_evicts_cached_token(test_db: sessionmaker) -> None:
+    token = get_fresh_token(test_db, SUPER_USER_CRED)
+    response = client.get("/admin/pool", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200
+    assert token_cache.get(token)["is_librarian"]
+
+    # the listener is started with the app
+    assert dependencies.blacklist_listener is not None
+    # published by another worker
+    message = json.dumps({"token": TokenCache.key(token)})
+    redis_conn.publish(BLACKLIST_CHANNEL, message)
+    for _ in range(50):
+        if token_cache.get(token) is None:
+            break
+        time.sleep(0.1)
+    assert token_cache.get(token) is None
+
+
+def test_token_cache_put_skipped_after_eviction() -> None:
+    cache = TokenCache(max_size=2, max_age=60)
+    now = time.time()
+    generation = cache.generation
+    # a token of user 1 is blacklisted while another token is being verified
+    cache.evict_user(1)
+    cache.put("a", {"id": 1}, now + 60, generation)
+    assert cache.get("a") is None
+
+    cache.put("a", {"id": 1}, now + 60, cache.generation)
+    assert cache.get("a") == {"id": 1}
+
+
+def test_token_blacklisted_during_verification(
+    test_db: sessionmaker, monkeypatch
+) -> None:
+    token = get_fresh_token(test_db, SUPER_USER_CRED)
+    token_cache.clear()
+    mget = dependencies.async_redis_conn.mget
+
+    async def mget_then_logout(*keys):
+        values = await mget(*keys)
+        # the logout lands after the blacklist was read
+        dependencies.blacklist_token(token, 60)
+        return values
+
+    monkeypatch.setattr(dependencies.async_redis_conn, "mget", mget_then_logout)
+    response = client.get("/admin/pool", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200
+    assert token_cache.get(token) is None
+    monkeypatch.undo()
+
+    response = client.get("/admin/pool", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 401
+    # tokens of the same user minted within the same second are identical
+    redis_conn.delete(f"bl_{token}")
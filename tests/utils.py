@@ -178,3 +178,13 @@ def insert_genre(test_db: sessionmaker) -> all_models.Genre:
         db.commit()
         db.flush()
     return genre
+
+
+def insert_status(test_db: sessionmaker, status_name: str) -> all_models.Status:
+    status = all_models.Status(status=status_name)
+
+    with test_db() as db:
+        db.add(status)
+        db.commit()
+        db.flush()
+    return status